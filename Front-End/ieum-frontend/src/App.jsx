@@ -333,6 +333,29 @@ function App() {
     }
   };
 
+  // ⏱️ 지연된 정책 AI 분석 결과를 받아 policies 결과에 합침
+  const loadDeferredPolicyAnalysis = async (analysisId) => {
+    try {
+      const analysis = await searchAPI.policyAnalysis(analysisId);
+      if (!analysis || analysis.status !== "done") return;
+
+      setResultData((prev) => {
+        if (prev.policies?.analysis_id !== analysisId) return prev;
+        return {
+          ...prev,
+          policies: {
+            ...prev.policies,
+            ai_analysis: analysis.ai_analysis,
+            ai_insights: analysis.ai_insights,
+          },
+        };
+      });
+      console.log("🤖 🎉 지연된 정책 AI 분석 결과 반영!");
+    } catch (error) {
+      console.error("🤖 ❌ 정책 AI 분석 조회 실패:", error);
+    }
+  };
+
   // 🎯 개별 API 처리 함수
   const handleIndividualAPI = async (apiName, apiCall, tempResults) => {
     try {
@@ -359,6 +382,11 @@ function App() {
         console.log("🤖 🎉 정책 AI 분석 결과 발견!");
       }
 
+      // ⏱️ AI 분석이 지연 처리된 경우: 목록은 바로 보여주고 분석은 백그라운드로 받아서 합침
+      if (apiName === "policies" && result?.analysis_id && !result.ai_analysis) {
+        loadDeferredPolicyAnalysis(result.analysis_id);
+      }
+
       return result;
     } catch (error) {
       console.error(`❌ ${apiName} API 실패:`, error);
@@ -55,6 +55,32 @@ apiClient.interceptors.response.use(
     }
 );
 
+// 📦 ETag 재검증 - 같은 요청이면 If-None-Match를 보내고, 304면 저장해 둔 응답을 그대로 사용
+const etagCache = new Map();
+const MAX_ETAG_ENTRIES = 50;
+
+const conditionalPost = async (url, body) => {
+    const key = `${url}|${JSON.stringify(body)}`;
+    const cached = etagCache.get(key);
+    const response = await apiClient.post(url, body, {
+        headers: cached ? { 'If-None-Match': cached.etag } : {},
+        validateStatus: (status) => (status >= 200 && status < 300) || (status === 304 && !!cached),
+    });
+    if (response.status === 304) {
+        console.log('📦 변경 없음 (304) - 저장된 응답 사용:', url);
+        return cached.data;
+    }
+    const etag = response.headers?.etag;
+    if (etag) {
+        etagCache.delete(key);
+        etagCache.set(key, { etag, data: response.data });
+        if (etagCache.size > MAX_ETAG_ENTRIES) {
+            etagCache.delete(etagCache.keys().next().value);  // 가장 오래된 항목 제거
+        }
+    }
+    return response.data;
+};
+
 // 🛡️ 공통 에러 처리 함수
 const handleApiError = (error, operationName) => {
     console.error(`❌ ${operationName} 에러 상세:`, {
@@ -160,12 +186,13 @@ export const searchAPI = {
         return await apiCallWithRetry(async () => {
             try {
                 console.log('🚀 Jobs 요청:', { regionCode, filters });
-                const response = await apiClient.post('/api/search/jobs', {
+                const data = await conditionalPost('/api/search/jobs', {
                     region_code: regionCode,
-                    job_field: filters.ncsCdLst
+                    job_field: filters.ncsCdLst,
+                    view: 'detail'  // 👁️ 결과 페이지에 표시하는 필드만 받음
                 });
                 console.log('📥 Jobs 응답 성공');
-                return response.data;
+                return data;
             } catch (error) {
                 handleApiError(error, '일자리 검색');
             }
@@ -177,13 +204,13 @@ export const searchAPI = {
         return await apiCallWithRetry(async () => {
             try {
                 console.log('🚀 Realestate 요청:', { regionCode, dealYmd });
-                const response = await apiClient.post('/api/search/realestate', {
+                const data = await conditionalPost('/api/search/realestate', {
                     region_code: regionCode,
                     deal_ymd: dealYmd,
                     max_price: maxPrice
                 });
                 console.log('📥 Realestate 응답 성공');
-                return response.data;
+                return data;
             } catch (error) {
                 handleApiError(error, '부동산 검색');
             }
@@ -200,21 +227,41 @@ export const searchAPI = {
                 const requestData = {
                     region_code: regionCode,
                     keywords: keywords,
-                    user_query: userQuery  // ⭐ AI 분석용 사용자 질문
+                    user_query: userQuery,  // ⭐ AI 분석용 사용자 질문
+                    view: 'detail'  // 👁️ 결과 페이지에 표시하는 필드만 받음
                 };
 
                 console.log('📋 [DEBUG] Policies API 요청 데이터:', requestData);
 
-                const response = await apiClient.post('/api/search/policies', requestData);
+                const data = await conditionalPost('/api/search/policies', requestData);
 
                 console.log('📥 Policies 응답 성공');
-                console.log('🤖 [DEBUG] AI 분석 결과 포함 여부:', !!response.data?.ai_analysis);
+                console.log('🤖 [DEBUG] AI 분석 결과 포함 여부:', !!data?.ai_analysis);
 
-                return response.data;
+                return data;
             } catch (error) {
                 handleApiError(error, '정책 검색 (AI)');
             }
         });
+    },
+
+    // ⏱️ 지연된 정책 AI 분석 조회 (analysis_id, 완료될 때까지 롱폴링 반복)
+    policyAnalysis: async (analysisId, { wait = 10, maxAttempts = 6 } = {}) => {
+        for (let attempt = 1; attempt <= maxAttempts; attempt++) {
+            try {
+                const response = await apiClient.get(
+                    `/api/search/policies/analysis/${analysisId}`,
+                    { params: { wait }, timeout: (wait + 5) * 1000 }
+                );
+                if (response.data?.status !== 'pending') {
+                    console.log('🤖 AI 분석 조회 완료:', response.data?.status);
+                    return response.data;
+                }
+            } catch (error) {
+                handleApiError(error, '정책 AI 분석 조회');
+            }
+        }
+        return null;
     }
 };
 
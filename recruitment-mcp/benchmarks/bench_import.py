@@ -0,0 +1,103 @@
+# bench_import.py — 웹 API 기동 비용 측정 (import 시간 + WebAPIHandler 생성 시간)
+#
+# 매 회 새 파이썬 프로세스에서 측정하므로 모듈 캐시 영향이 없습니다.
+#   python -m benchmarks.bench_import                # 기본 5회
+#   python -m benchmarks.bench_import --runs 10 --importtime 15
+#   python -m benchmarks.bench_import --json
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 자식 프로세스에서 실행할 측정 코드 - 결과는 JSON 한 줄로 출력
+_PROBE = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import src.web_api_handler as w
+t1 = time.perf_counter()
+handler = w.WebAPIHandler()
+t2 = time.perf_counter()
+loaded = {name: name in sys.modules for name in %(watch)r}
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "construct_ms": (t2 - t1) * 1000, "loaded": loaded}))
+"""
+
+# 기동 시 불러오지 않아야 하는 모듈 (처음 사용할 때 로드)
+WATCH_MODULES = ["mcp", "openai", "tiktoken", "src.server", "src.realestate_server", "src.youth_policy_server"]
+
+
+def _run_probe(extra_args: List[str] = ()) -> subprocess.CompletedProcess:
+    code = _PROBE % {"watch": WATCH_MODULES}
+    return subprocess.run([sys.executable, *extra_args, "-c", code], cwd=PROJECT_ROOT,
+                          capture_output=True, text=True, check=True)
+
+
+def measure(runs: int) -> Dict:
+    samples = []
+    for _ in range(runs):
+        proc = _run_probe()
+        samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    def summary(key: str) -> Dict[str, float]:
+        values = [s[key] for s in samples]
+        return {
+            "min": round(min(values), 1),
+            "median": round(statistics.median(values), 1),
+            "max": round(max(values), 1),
+        }
+
+    return {
+        "runs": runs,
+        "import_ms": summary("import_ms"),
+        "construct_ms": summary("construct_ms"),
+        "loaded_at_startup": samples[-1]["loaded"],
+    }
+
+
+def top_imports(limit: int) -> List[Dict]:
+    """-X importtime 결과에서 누적 시간이 큰 모듈 상위 N개"""
+    proc = _run_probe(["-X", "importtime"])
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)", line)
+        if m:
+            rows.append({"module": m.group(4), "self_ms": int(m.group(1)) / 1000,
+                         "cumulative_ms": int(m.group(2)) / 1000, "depth": len(m.group(3)) // 2})
+    # 최상위(depth 0~1) 모듈만 보면 어떤 import가 비싼지 바로 보임
+    rows = [r for r in rows if r["depth"] <= 1]
+    rows.sort(key=lambda r: -r["cumulative_ms"])
+    return rows[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="웹 API import/생성 시간 측정")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--importtime", type=int, default=0, help="-X importtime 상위 N개 모듈 출력")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    result = measure(args.runs)
+    if args.importtime:
+        result["top_imports"] = top_imports(args.importtime)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    print(f"⏱️ import src.web_api_handler ({result['runs']}회): "
+          f"median {result['import_ms']['median']}ms (min {result['import_ms']['min']} / max {result['import_ms']['max']})")
+    print(f"🏗️ WebAPIHandler(): median {result['construct_ms']['median']}ms")
+    print("📦 기동 시 로드된 모듈:")
+    for name, loaded in result["loaded_at_startup"].items():
+        print(f"  {'⚠️ 로드됨' if loaded else '✅ 지연'}  {name}")
+    for row in result.get("top_imports", []):
+        print(f"  {row['cumulative_ms']:8.1f}ms  {row['module']}")
+
+
+if __name__ == "__main__":
+    main()
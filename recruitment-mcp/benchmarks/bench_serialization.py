@@ -0,0 +1,113 @@
+# bench_serialization.py — 정책 응답(기본 30개) 직렬화 시간과 전송 바이트 비교
+#
+#   before: FastAPI 기본 경로 (jsonable_encoder + JSONResponse.render)
+#   after : src.responses (orjson 또는 표준 json 직접 직렬화) + gzip/brotli 압축
+#
+#   python -m benchmarks.bench_serialization
+#   python -m benchmarks.bench_serialization --policies 30 --view detail --repeat 500 --json
+import argparse
+import gzip
+import json
+import time
+from typing import Callable, Dict
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from benchmarks.synthetic import make_policies
+from src import responses
+from src.projections import POLICY_VIEW_FIELDS, pick_fields, project_policy, view_fields
+
+
+def build_policy_response(count: int, view: str = "full") -> Dict:
+    """/api/search/policies 응답과 같은 구조 (AI 결과 제외)"""
+    selected = view_fields(POLICY_VIEW_FIELDS, view)
+    items = []
+    for i, policy in enumerate(make_policies(count), 1):
+        extras = {"display_title": f"{i}. {policy['plcyNm']}"}
+        projection = project_policy(policy)
+        items.append({**policy, **extras, **projection} if selected is None
+                     else pick_fields(selected, extras, projection, policy))
+    categories: Dict[str, int] = {}
+    for item in items:
+        category = item.get("lclsfNm") or "기타"
+        categories[category] = categories.get(category, 0) + 1
+    return {
+        "success": True,
+        "policies": items,
+        "categories": categories,
+        "total_count": len(items),
+        "keywords_used": None,
+        "region_info": {"code": "51150", "name": "강릉시"},
+        "ai_analysis": None,
+        "ai_insights": None,
+        "analysis_id": None,
+    }
+
+
+def _time_ms(fn: Callable[[], bytes], repeat: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {"median_ms": round(samples[len(samples) // 2], 4), "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 4)}
+
+
+def run(count: int, view: str, repeat: int) -> Dict:
+    payload = build_policy_response(count, view)
+
+    def before() -> bytes:
+        return JSONResponse(content=jsonable_encoder(payload)).body
+
+    def after() -> bytes:
+        return responses.dumps(payload)
+
+    body_before = before()
+    body_after = after()
+    assert json.loads(body_before) == json.loads(body_after)
+
+    result = {
+        "policies": count,
+        "view": view,
+        "json_encoder": responses.JSON_ENCODER,
+        "serialize": {"before": _time_ms(before, repeat), "after": _time_ms(after, repeat)},
+        "bytes": {
+            "before_identity": len(body_before),
+            "after_identity": len(body_after),
+            "gzip": len(gzip.compress(body_after, compresslevel=responses.GZIP_LEVEL, mtime=0)),
+        },
+        "compress": {"gzip": _time_ms(lambda: responses.compress(body_after, "gzip"), repeat)},
+    }
+    if responses.brotli is not None:
+        result["bytes"]["br"] = len(responses.compress(body_after, "br"))
+        result["compress"]["br"] = _time_ms(lambda: responses.compress(body_after, "br"), repeat)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정책 응답 직렬화/압축 벤치마크")
+    parser.add_argument("--policies", type=int, default=30)
+    parser.add_argument("--view", choices=["card", "detail", "full"], default="full")
+    parser.add_argument("--repeat", type=int, default=300)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    result = run(args.policies, args.view, args.repeat)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    serialize, size = result["serialize"], result["bytes"]
+    print(f"📦 정책 {result['policies']}개 응답 (view={result['view']}, 인코더={result['json_encoder']})")
+    print(f"⏱️ 직렬화 before: {serialize['before']['median_ms']}ms (p95 {serialize['before']['p95_ms']})"
+          f" → after: {serialize['after']['median_ms']}ms (p95 {serialize['after']['p95_ms']})")
+    print(f"📏 전송 바이트 before: {size['before_identity']:,} → identity {size['after_identity']:,}"
+          f" / gzip {size['gzip']:,}" + (f" / br {size['br']:,}" if "br" in size else " (brotli 미설치)"))
+    for name, timing in result["compress"].items():
+        print(f"🗜️ {name} 압축: {timing['median_ms']}ms")
+
+
+if __name__ == "__main__":
+    main()
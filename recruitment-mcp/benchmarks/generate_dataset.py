@@ -0,0 +1,345 @@
+# generate_dataset.py — 대용량 합성 고정 데이터 생성 (채용공고 / 아파트 실거래 / 청년정책)
+#
+# 실제 법정동 시군구 코드(LAWD_CD 5자리)와 대략적인 인구 비중으로 지역 분포를 정하고,
+# 레코드를 한 건씩 만들어 바로 파일에 쓰므로 수백만 건도 메모리 걱정 없이 생성할 수 있습니다.
+#
+#   python -m benchmarks.generate_dataset --out benchmarks/data                     # 기본 규모
+#   python -m benchmarks.generate_dataset --out /tmp/big --jobs 1000000 --trades 3000000 --policies 200000
+#   python -m benchmarks.generate_dataset --out fixtures --xml-samples 20 --no-gzip
+#   python -m benchmarks.generate_dataset --until 202506 --months 6   # 웹 API 기본 deal_ymd(202506) 포함
+#
+# 출력 (대역 서버 --data, 마이크로벤치 --data에서 그대로 사용)
+#   recruitment.jsonl.gz     공공기관 채용정보 API result 항목
+#   apt_trades.jsonl.gz      실거래가 API item (sggCd + dealYear/dealMonth로 조회)
+#   youth_policies.jsonl.gz  온통청년 youthPolicyList 항목
+#   xml/<sggCd>_<YYYYMM>.xml 실거래가 API 응답 XML 표본 (--xml-samples)
+#   manifest.json            생성 조건과 건수
+import argparse
+import bisect
+import datetime
+import gzip
+import itertools
+import json
+import os
+import random
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from benchmarks.synthetic import UMD_NAMES, make_job, make_policy, make_trade, trades_xml
+from src.projections import EDUCATION_CODE_MAPPING, HIRE_TYPE_CODE_MAPPING, RECRUIT_TYPE_CODE_MAPPING
+
+# 🗺️ 시도: 코드 앞 2자리 → (정식 명칭, 채용 근무지역 표기, 근무지역 코드, 아파트 가격 배율)
+SIDO = {
+    "11": ("서울특별시", "서울", "R3010", 3.2),
+    "26": ("부산광역시", "부산", "R3014", 1.5),
+    "27": ("대구광역시", "대구", "R3013", 1.3),
+    "28": ("인천광역시", "인천", "R3011", 1.5),
+    "29": ("광주광역시", "광주", "R3015", 1.1),
+    "30": ("대전광역시", "대전", "R3012", 1.3),
+    "31": ("울산광역시", "울산", "R3016", 1.2),
+    "36": ("세종특별자치시", "세종", "R3026", 1.6),
+    "41": ("경기도", "경기", "R3017", 1.9),
+    "43": ("충청북도", "충북", "R3020", 0.9),
+    "44": ("충청남도", "충남", "R3019", 0.9),
+    "46": ("전라남도", "전남", "R3023", 0.8),
+    "47": ("경상북도", "경북", "R3021", 0.8),
+    "48": ("경상남도", "경남", "R3022", 1.0),
+    "50": ("제주특별자치도", "제주", "R3025", 1.5),
+    "51": ("강원특별자치도", "강원", "R3018", 0.9),
+    "52": ("전북특별자치도", "전북", "R3024", 0.8),
+}
+
+# 🏘️ 법정동 시군구 코드, 이름, 대략적인 인구(만 명) - 지역별 레코드 비중으로 사용
+SIGUNGU: List[Tuple[str, str, int]] = [
+    ("11110", "종로구", 14), ("11140", "중구", 12), ("11170", "용산구", 21), ("11200", "성동구", 28),
+    ("11215", "광진구", 34), ("11230", "동대문구", 34), ("11260", "중랑구", 38), ("11290", "성북구", 43),
+    ("11305", "강북구", 29), ("11320", "도봉구", 30), ("11350", "노원구", 50), ("11380", "은평구", 46),
+    ("11410", "서대문구", 31), ("11440", "마포구", 37), ("11470", "양천구", 44), ("11500", "강서구", 56),
+    ("11530", "구로구", 40), ("11545", "금천구", 23), ("11560", "영등포구", 38), ("11590", "동작구", 38),
+    ("11620", "관악구", 49), ("11650", "서초구", 41), ("11680", "강남구", 55), ("11710", "송파구", 65),
+    ("11740", "강동구", 46),
+    ("26230", "부산진구", 36), ("26260", "동래구", 27), ("26350", "해운대구", 38), ("26380", "사하구", 30),
+    ("26410", "금정구", 22), ("26470", "연제구", 20), ("26500", "수영구", 17), ("26710", "기장군", 18),
+    ("27140", "동구", 34), ("27230", "북구", 41), ("27260", "수성구", 41), ("27290", "달서구", 52), ("27710", "달성군", 26),
+    ("28177", "미추홀구", 40), ("28185", "연수구", 39), ("28200", "남동구", 49), ("28237", "부평구", 48),
+    ("28245", "계양구", 29), ("28260", "서구", 61), ("28710", "강화군", 7),
+    ("29140", "서구", 28), ("29155", "남구", 21), ("29170", "북구", 42), ("29200", "광산구", 39),
+    ("30140", "중구", 22), ("30170", "서구", 46), ("30200", "유성구", 36), ("30230", "대덕구", 17),
+    ("31140", "남구", 31), ("31170", "동구", 15), ("31200", "북구", 22), ("31710", "울주군", 22),
+    ("36110", "세종특별자치시", 39),
+    ("41111", "수원시 장안구", 27), ("41113", "수원시 권선구", 37), ("41115", "수원시 팔달구", 18),
+    ("41117", "수원시 영통구", 37), ("41131", "성남시 수정구", 23), ("41135", "성남시 분당구", 47),
+    ("41150", "의정부시", 46), ("41171", "안양시 만안구", 23), ("41173", "안양시 동안구", 31),
+    ("41210", "광명시", 28), ("41220", "평택시", 59), ("41281", "고양시 덕양구", 49),
+    ("41285", "고양시 일산동구", 28), ("41287", "고양시 일산서구", 29), ("41290", "과천시", 8),
+    ("41310", "구리시", 19), ("41360", "남양주시", 73), ("41390", "시흥시", 52), ("41410", "군포시", 26),
+    ("41450", "하남시", 33), ("41461", "용인시 처인구", 27), ("41463", "용인시 기흥구", 45),
+    ("41465", "용인시 수지구", 38), ("41480", "파주시", 50), ("41500", "이천시", 22), ("41570", "김포시", 49),
+    ("41610", "광주시", 39), ("41630", "양주시", 25), ("41650", "포천시", 14), ("41670", "여주시", 11),
+    ("41800", "연천군", 4), ("41820", "가평군", 6), ("41830", "양평군", 12),
+    ("43111", "청주시 상당구", 19), ("43112", "청주시 서원구", 19), ("43113", "청주시 흥덕구", 27),
+    ("43114", "청주시 청원구", 19), ("43130", "충주시", 21), ("43150", "제천시", 13), ("43720", "보은군", 3),
+    ("43730", "옥천군", 5), ("43740", "영동군", 4), ("43745", "증평군", 4), ("43750", "진천군", 9),
+    ("43760", "괴산군", 4), ("43770", "음성군", 9), ("43800", "단양군", 3),
+    ("44131", "천안시 동남구", 26), ("44133", "천안시 서북구", 39), ("44150", "공주시", 10), ("44180", "보령시", 10),
+    ("44200", "아산시", 34), ("44210", "서산시", 18), ("44230", "논산시", 11), ("44250", "계룡시", 4),
+    ("44270", "당진시", 17), ("44710", "금산군", 5), ("44760", "부여군", 6), ("44770", "서천군", 5),
+    ("44790", "청양군", 3), ("44800", "홍성군", 10), ("44810", "예산군", 8), ("44825", "태안군", 6),
+    ("46110", "목포시", 21), ("46130", "여수시", 27), ("46150", "순천시", 28), ("46170", "나주시", 12),
+    ("46230", "광양시", 15), ("46710", "담양군", 5), ("46790", "화순군", 6), ("46820", "해남군", 7),
+    ("46840", "무안군", 9), ("46870", "영광군", 5), ("46890", "완도군", 5), ("46910", "신안군", 4),
+    ("47111", "포항시 남구", 24), ("47113", "포항시 북구", 26), ("47130", "경주시", 25), ("47150", "김천시", 14),
+    ("47170", "안동시", 15), ("47190", "구미시", 41), ("47210", "영주시", 10), ("47230", "영천시", 10),
+    ("47250", "상주시", 9), ("47280", "문경시", 7), ("47290", "경산시", 27), ("47730", "의성군", 5),
+    ("47900", "예천군", 5), ("47920", "봉화군", 3), ("47930", "울진군", 5), ("47940", "울릉군", 1),
+    ("48121", "창원시 의창구", 21), ("48123", "창원시 성산구", 23), ("48125", "창원시 마산합포구", 18),
+    ("48127", "창원시 마산회원구", 19), ("48129", "창원시 진해구", 19), ("48170", "진주시", 34),
+    ("48220", "통영시", 12), ("48240", "사천시", 11), ("48250", "김해시", 53), ("48270", "밀양시", 10),
+    ("48310", "거제시", 24), ("48330", "양산시", 36), ("48730", "함안군", 6), ("48850", "하동군", 4),
+    ("48880", "거창군", 6),
+    ("50110", "제주시", 49), ("50130", "서귀포시", 18),
+    ("51110", "춘천시", 29), ("51130", "원주시", 36), ("51150", "강릉시", 21), ("51170", "동해시", 9),
+    ("51190", "태백시", 4), ("51210", "속초시", 8), ("51230", "삼척시", 6), ("51720", "홍천군", 7),
+    ("51730", "횡성군", 5), ("51750", "영월군", 4), ("51760", "평창군", 4), ("51770", "정선군", 3),
+    ("51780", "철원군", 4), ("51810", "인제군", 3), ("51830", "양양군", 3),
+    ("52111", "전주시 완산구", 34), ("52113", "전주시 덕진구", 30), ("52130", "군산시", 26), ("52140", "익산시", 27),
+    ("52180", "정읍시", 10), ("52190", "남원시", 8), ("52210", "김제시", 8), ("52710", "완주군", 9),
+    ("52730", "무주군", 2), ("52790", "고창군", 5), ("52800", "부안군", 5),
+]
+
+# 법정동 이름이 없는 시군구에 쓰는 흔한 읍·면·동 이름
+COMMON_UMD = ["중앙동", "신흥동", "남산동", "도남동", "삼산동", "신정동", "효자동", "송정동", "내동", "읍내리"]
+
+NCS_FIELDS = [(f"R6000{i:02d}", name) for i, name in enumerate([
+    "사업관리", "경영.회계.사무", "금융.보험", "교육.자연.사회과학", "법률.경찰.소방.교도.국방", "보건.의료",
+    "사회복지.종교", "문화.예술.디자인.방송", "운전.운송", "영업판매", "경비.청소", "이용.숙박.여행.오락.스포츠",
+    "음식서비스", "건설", "기계", "재료", "화학", "섬유.의복", "전기.전자", "정보통신", "식품가공",
+    "인쇄.목재.가구.공예", "환경.에너지.안전", "농림어업", "연구"], 1)]
+# 공고에 많이 나오는 분야일수록 가중치 높게 (경영.회계.사무, 보건.의료, 정보통신, 연구 등)
+NCS_WEIGHTS = [3, 10, 3, 3, 1, 6, 3, 2, 2, 2, 1, 1, 1, 4, 3, 1, 1, 1, 4, 6, 1, 1, 3, 2, 5]
+
+HIRE_TYPE_SETS = [(("R1010",), 40), (("R1030",), 20), (("R1020",), 8), (("R1050",), 8), (("R1060",), 4),
+                  (("R1010", "R1030"), 8), (("R1030", "R1050", "R1060"), 5), (("R1040",), 4), (("R1070",), 3)]
+EDUCATION_SETS = [(("R7010",), 45), (("R7050",), 20), (("R7040", "R7050"), 10), (("R7020", "R7040", "R7050"), 8),
+                  (("R7050", "R7060"), 8), (("R7060", "R7070"), 5), (("R7030",), 4)]
+RECRUIT_TYPES = [("R2010", 55), ("R2020", 25), ("R2030", 18), ("R2040", 2)]
+
+
+class WeightedChoice:
+    """누적 가중치 + 이분 탐색 (수백만 번 뽑을 때 random.choices보다 가벼움)"""
+
+    def __init__(self, items: Sequence, weights: Sequence[float]):
+        self.items = list(items)
+        self.cumulative = list(itertools.accumulate(weights))
+
+    def __call__(self, rng: random.Random):
+        return self.items[bisect.bisect(self.cumulative, rng.random() * self.cumulative[-1])]
+
+
+def region_name(code: str, name: str) -> str:
+    sido = SIDO[code[:2]][0]
+    return sido if name == sido else f"{sido} {name}"
+
+
+def _ymd(day: datetime.date) -> str:
+    return day.strftime("%Y%m%d")
+
+
+# === 채용공고 ===
+def iter_jobs(count: int, seed: int, today: datetime.date) -> Iterator[Dict]:
+    """근무지역은 인구 비중대로, 공고 기간은 오늘 기준 (마감 공고 약 20%)"""
+    rng = random.Random(f"{seed}:jobs")
+    pick_sido = WeightedChoice(*zip(*_sido_weights()))
+    pick_ncs = WeightedChoice(NCS_FIELDS, NCS_WEIGHTS)
+    pick_hire = WeightedChoice(*zip(*HIRE_TYPE_SETS))
+    pick_education = WeightedChoice(*zip(*EDUCATION_SETS))
+    pick_recruit = WeightedChoice(*zip(*RECRUIT_TYPES))
+    for index in range(count):
+        job = make_job(rng, index)
+        sidos = sorted({pick_sido(rng) for _ in range(rng.choice([1, 1, 1, 2, 3]))})
+        fields = sorted({pick_ncs(rng) for _ in range(rng.choice([1, 1, 2]))})
+        hire_types, education, recruit = pick_hire(rng), pick_education(rng), pick_recruit(rng)
+        begin = today - datetime.timedelta(days=rng.randint(0, 50))
+        end = begin + datetime.timedelta(days=rng.randint(7, 45))
+        job.update({
+            "workRgnLst": ",".join(SIDO[s][2] for s in sidos),
+            "workRgnNmLst": ",".join(SIDO[s][1] for s in sidos),
+            "ncsCdLst": ",".join(code for code, _ in fields),
+            "ncsCdNmLst": ",".join(name for _, name in fields),
+            "hireTypeLst": ",".join(hire_types),
+            "hireTypeNmLst": ",".join(HIRE_TYPE_CODE_MAPPING[c] for c in hire_types),
+            "acbgCondLst": ",".join(education),
+            "acbgCondNmLst": ",".join(EDUCATION_CODE_MAPPING[c] for c in education),
+            "recrutSe": recruit, "recrutSeNm": RECRUIT_TYPE_CODE_MAPPING[recruit],
+            "pbancBgngYmd": _ymd(begin), "pbancEndYmd": _ymd(end),
+            "ongoingYn": "Y" if end >= today else "N", "decimalDay": max((end - today).days, 0),
+            "recrutPbancTtl": f"{job['instNm']} {begin.year}년 {fields[0][1]} 분야 "
+                              f"{HIRE_TYPE_CODE_MAPPING[hire_types[0]]} 채용 공고",
+        })
+        yield job
+
+
+def _sido_weights() -> List[Tuple[str, int]]:
+    totals: Dict[str, int] = {}
+    for code, _, population in SIGUNGU:
+        totals[code[:2]] = totals.get(code[:2], 0) + population
+    return sorted(totals.items())
+
+
+# === 아파트 실거래 ===
+def deal_months(months: int, until: Optional[str], today: datetime.date) -> List[str]:
+    """until(YYYYMM, 기본 지난달)까지 거꾸로 months개월 (YYYYMM, 오래된 순)"""
+    if until:
+        year, month = int(until[:4]), int(until[4:6]) + 1
+    else:
+        year, month = today.year, today.month
+    result = []
+    for _ in range(months):
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+        result.append(f"{year}{month:02d}")
+    return result[::-1]
+
+
+def iter_trades(total: int, months: List[str], seed: int) -> Iterator[Dict]:
+    """시군구 × 계약년월마다 인구 비중만큼 거래 (시도별 가격 배율 적용)"""
+    population = sum(p for _, _, p in SIGUNGU)
+    for code, name, weight in SIGUNGU:
+        factor = SIDO[code[:2]][3]
+        per_month = max(1, round(total * weight / population / len(months)))
+        umd_names = UMD_NAMES.get(code) or COMMON_UMD
+        agent_region = region_name(code, name)
+        for deal_ymd in months:
+            rng = random.Random(f"{seed}:{code}:{deal_ymd}")
+            for _ in range(per_month):
+                trade = make_trade(rng, code, deal_ymd, umd_names, factor)
+                if trade["dealingGbn"] == "중개거래":
+                    trade["estateAgentSggNm"] = agent_region
+                yield trade
+
+
+# === 청년정책 ===
+def iter_policies(count: int, seed: int, today: datetime.date) -> Iterator[Dict]:
+    """지자체 정책은 인구 비중대로 시군구에 배분, 약 5%는 전국 대상(중앙부처) - 종료된 사업 약 15%"""
+    rng = random.Random(f"{seed}:policies")
+    pick_region = WeightedChoice([(c, n) for c, n, _ in SIGUNGU], [p for _, _, p in SIGUNGU])
+    all_codes = ",".join(c for c, _, _ in SIGUNGU)
+    for index in range(count):
+        if rng.random() < 0.05:
+            policy = make_policy(rng, index, "00000", rng.choice(["고용노동부", "국토교통부", "중소벤처기업부", "보건복지부"]))
+            policy["zipCd"] = all_codes
+        else:
+            code, name = pick_region(rng)
+            policy = make_policy(rng, index, code, region_name(code, name))
+            sido_codes = [c for c, _, _ in SIGUNGU if c[:2] == code[:2]]
+            # 대부분 해당 시군구만, 일부는 시도 전체 대상
+            policy["zipCd"] = code if rng.random() < 0.8 else ",".join(sido_codes)
+        start = today - datetime.timedelta(days=rng.randint(30, 400))
+        end = today - datetime.timedelta(days=rng.randint(1, 60)) if rng.random() < 0.15 \
+            else today + datetime.timedelta(days=rng.randint(10, 300))
+        policy.update({"plcyNo": f"{start.year}{index:08d}{rng.randint(100, 999)}",
+                       "bizPrdBgngYmd": _ymd(start), "bizPrdEndYmd": _ymd(end),
+                       "aplyYmd": f"{_ymd(start)} ~ {_ymd(end)}"})
+        yield policy
+
+
+# === 파일 출력 ===
+def write_jsonl(path: str, records: Iterator[Dict], compress: bool, label: str) -> int:
+    opener = gzip.open if compress else open
+    count, started = 0, time.perf_counter()
+    with opener(path, "wt", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+            if count % 100_000 == 0:
+                print(f"  {label}: {count:,}건 ({time.perf_counter() - started:.1f}초)")
+    print(f"✅ {label}: {count:,}건 → {path}")
+    return count
+
+
+def _iter_trade_groups(trades_path: str) -> Iterator[Tuple[Tuple[str, str], Dict]]:
+    """거래 파일을 한 줄씩 읽어 ((시군구코드, 년월), 거래) 반환"""
+    opener = gzip.open if trades_path.endswith(".gz") else open
+    with opener(trades_path, "rt", encoding="utf-8") as f:
+        for line in f:
+            trade = json.loads(line)
+            yield (trade["sggCd"], f"{trade['dealYear']}{int(trade['dealMonth']):02d}"), trade
+
+
+def write_xml_samples(directory: str, trades_path: str, samples: int, seed: int) -> int:
+    """
+    생성한 거래 파일에서 시군구·년월 samples개를 골라 실거래가 API 응답 XML로 저장.
+    파일을 두 번 훑음 - 첫 번째는 (시군구, 년월) 목록만 모아 표본을 고르고, 두 번째는 고른 묶음의 거래만 모음
+    """
+    all_keys = sorted({key for key, _ in _iter_trade_groups(trades_path)})
+    keys = random.Random(seed).sample(all_keys, min(samples, len(all_keys)))
+    groups: Dict[Tuple[str, str], List[Dict]] = {key: [] for key in keys}
+    for key, trade in _iter_trade_groups(trades_path):
+        if key in groups:
+            groups[key].append(trade)
+    os.makedirs(directory, exist_ok=True)
+    for code, deal_ymd in keys:
+        with open(os.path.join(directory, f"{code}_{deal_ymd}.xml"), "w", encoding="utf-8") as f:
+            f.write(trades_xml(groups[(code, deal_ymd)]))
+    return len(keys)
+
+
+def generate(out: str, jobs: int, trades: int, policies: int, months: int, seed: int, until: Optional[str] = None,
+             compress: bool = True, xml_samples: int = 0, today: Optional[datetime.date] = None) -> Dict:
+    today = today or datetime.date.today()
+    os.makedirs(out, exist_ok=True)
+    suffix = ".jsonl.gz" if compress else ".jsonl"
+    paths = {name: os.path.join(out, name + suffix) for name in ("recruitment", "apt_trades", "youth_policies")}
+    # 압축 여부를 바꿔 다시 만들 때 대역 서버가 옛 파일을 먼저 읽지 않도록 정리
+    for name in paths:
+        stale = os.path.join(out, name + (".jsonl" if compress else ".jsonl.gz"))
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    month_list = deal_months(months, until, today)
+    counts = {
+        "recruitment": write_jsonl(paths["recruitment"], iter_jobs(jobs, seed, today), compress, "채용공고"),
+        "apt_trades": write_jsonl(paths["apt_trades"], iter_trades(trades, month_list, seed), compress, "실거래"),
+        "youth_policies": write_jsonl(paths["youth_policies"], iter_policies(policies, seed, today), compress, "청년정책"),
+    }
+    if xml_samples:
+        counts["xml_samples"] = write_xml_samples(os.path.join(out, "xml"), paths["apt_trades"], xml_samples, seed)
+
+    manifest = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "reference_date": today.isoformat(),
+        "seed": seed,
+        "deal_months": month_list,
+        "sigungu": len(SIGUNGU),
+        "counts": counts,
+        "files": {name: os.path.basename(path) for name, path in paths.items()},
+    }
+    with open(os.path.join(out, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대용량 합성 고정 데이터 생성 (대역 서버/벤치마크용)")
+    parser.add_argument("--out", default=os.path.join("benchmarks", "data"), help="출력 디렉터리")
+    parser.add_argument("--jobs", type=int, default=50_000, help="채용공고 수")
+    parser.add_argument("--trades", type=int, default=200_000, help="실거래 수 (전체 기간 합계, 시군구 비중대로 배분)")
+    parser.add_argument("--policies", type=int, default=20_000, help="청년정책 수")
+    parser.add_argument("--months", type=int, default=12, help="실거래 계약년월 수 (--until부터 거꾸로)")
+    parser.add_argument("--until", default=None, help="실거래 마지막 계약년월 YYYYMM (기본 지난달)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-gzip", action="store_true", help="압축하지 않은 .jsonl로 저장")
+    parser.add_argument("--xml-samples", type=int, default=0, help="실거래가 응답 XML 표본 파일 수")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    manifest = generate(args.out, args.jobs, args.trades, args.policies, args.months, args.seed, args.until,
+                        compress=not args.no_gzip, xml_samples=args.xml_samples)
+    print(f"📦 {args.out} 생성 완료 ({time.perf_counter() - started:.1f}초): "
+          + ", ".join(f"{k} {v:,}" for k, v in manifest["counts"].items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+# load_test.py — 웹 API 종단 간 부하 벤치마크 (공공 API는 로컬 대역 서버로 대체)
+#
+# 대역 서버(standin_upstream)와 웹 API(uvicorn fastapi_server:app)를 자식 프로세스로 띄우고,
+# 실제와 비슷한 요청 구성(엔드포인트/지역 비율, user_query·max_price 유무)으로 부하를 건 뒤
+# 엔드포인트별 처리량, p50/p95/p99 지연, 요청당 공공 API 호출 수를 JSON 파일로 기록합니다.
+#
+#   python -m benchmarks.load_test                                  # 기본 2000건, 동시 32
+#   python -m benchmarks.load_test --duration 60 --concurrency 64 --standin-latency lognormal:120,0.5
+#   python -m benchmarks.load_test --target http://127.0.0.1:8000   # 이미 떠 있는 서버에 부하 (대역 서버 지정은 직접)
+#
+# 공공 API 호출 수는 응답의 Server-Timing(upstream_* 단계 횟수)으로 요청별로 셉니다.
+# (응답 캐시 적중 요청은 0회) 대역 서버 /_standin/stats 전후 차이도 함께 기록합니다.
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import re
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "benchmarks", "results")
+
+# 🎯 요청 구성 (가중치)
+ENDPOINT_MIX = {"policies": 0.4, "jobs": 0.3, "realestate": 0.2, "comprehensive": 0.1}
+REGION_MIX = {"51150": 0.35, "52210": 0.2, "44790": 0.2, "51770": 0.15, "51750": 0.1}
+USER_QUERIES = ["월세 지원 받을 수 있는 정책 알려줘", "창업 지원금", "취업 준비 중인 청년 지원", "농업 창업", "자격증 응시료"]
+COMPREHENSIVE_QUERIES = ["{region} 일자리랑 집 알아보고 있어요", "{region} 청년 정책과 아파트 매물", "{region}에서 살 집과 직장"]
+REGION_NAMES = {"51150": "강릉시", "52210": "김제시", "44790": "청양군", "51770": "정선군", "51750": "영월군"}
+DEAL_YMDS = ["202504", "202505", "202506"]
+
+_STAGE_RE = re.compile(r'(upstream_\w+);dur=[\d.]+(?:;desc="x(\d+)")?')
+
+
+def _weighted(rng: random.Random, weights: Dict[str, float]) -> str:
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def build_plan(count: int, seed: int, query_ratio: float, price_ratio: float) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """(엔드포인트 이름, 경로, 요청 본문) 목록 - 같은 seed → 같은 요청 순서"""
+    rng = random.Random(seed)
+    plan = []
+    for _ in range(count):
+        endpoint = _weighted(rng, ENDPOINT_MIX)
+        region = _weighted(rng, REGION_MIX)
+        max_price = rng.choice([20000, 30000, 50000]) if rng.random() < price_ratio else None
+        if endpoint == "policies":
+            body = {"region_code": region, "defer_ai": False,
+                    "user_query": rng.choice(USER_QUERIES) if rng.random() < query_ratio else None}
+        elif endpoint == "jobs":
+            body = {"region_code": region, "view": "detail"}
+        elif endpoint == "realestate":
+            body = {"region_code": region, "deal_ymd": rng.choice(DEAL_YMDS), "max_price": max_price}
+        else:
+            body = {"query": rng.choice(COMPREHENSIVE_QUERIES).format(region=REGION_NAMES[region]),
+                    "region_code": region, "max_price": max_price}
+        plan.append((endpoint, f"/api/search/{endpoint}", body))
+    return plan
+
+
+def upstream_calls(server_timing: str) -> int:
+    """Server-Timing 헤더의 upstream_* 단계 호출 횟수 합"""
+    return sum(int(count or 1) for _, count in _STAGE_RE.findall(server_timing or ""))
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return round(sorted_values[index], 2)
+
+
+async def run_load(target: str, plan: List[Tuple[str, str, Dict]], concurrency: int,
+                   duration: Optional[float], timeout: float) -> Tuple[Dict[str, List[Dict]], float]:
+    """동시 concurrency개 워커가 plan을 차례로 요청 (duration이 있으면 시간 동안 plan을 반복)"""
+    samples: Dict[str, List[Dict]] = {}
+    position = 0
+    deadline = time.perf_counter() + duration if duration else None
+
+    def next_request():
+        nonlocal position
+        if deadline is None and position >= len(plan):
+            return None
+        if deadline is not None and time.perf_counter() >= deadline:
+            return None
+        item = plan[position % len(plan)]
+        position += 1
+        return item
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=target, timeout=timeout, limits=limits) as client:
+        async def worker():
+            while (item := next_request()) is not None:
+                endpoint, path, body = item
+                started = time.perf_counter()
+                sample = {"ok": False, "status": None, "upstream_calls": 0}
+                try:
+                    resp = await client.post(path, json=body, headers={"Accept-Encoding": "gzip"})
+                    sample["status"] = resp.status_code
+                    sample["ok"] = resp.status_code == 200 and resp.json().get("success", True) is not False
+                    sample["upstream_calls"] = upstream_calls(resp.headers.get("server-timing", ""))
+                except Exception as e:
+                    sample["error"] = type(e).__name__
+                sample["ms"] = (time.perf_counter() - started) * 1000
+                samples.setdefault(endpoint, []).append(sample)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return samples, elapsed
+
+
+def summarize(samples: Dict[str, List[Dict]], elapsed: float) -> Dict[str, Any]:
+    endpoints = {}
+    for endpoint, items in sorted(samples.items()):
+        latencies = sorted(s["ms"] for s in items)
+        errors = [s for s in items if not s["ok"]]
+        upstream = sum(s["upstream_calls"] for s in items)
+        endpoints[endpoint] = {
+            "requests": len(items),
+            "errors": len(errors),
+            "error_statuses": {str(k): sum(1 for s in errors if (s["status"] or s.get("error")) == k)
+                               for k in {s["status"] or s.get("error") for s in errors}},
+            "throughput_rps": round(len(items) / elapsed, 2),
+            "latency_ms": {"p50": percentile(latencies, 50), "p95": percentile(latencies, 95),
+                           "p99": percentile(latencies, 99), "max": round(latencies[-1], 2) if latencies else None,
+                           "mean": round(sum(latencies) / len(latencies), 2) if latencies else None},
+            "upstream_calls": upstream,
+            "upstream_calls_per_request": round(upstream / len(items), 3) if items else 0,
+        }
+    all_items = [s for items in samples.values() for s in items]
+    latencies = sorted(s["ms"] for s in all_items)
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "total": {
+            "requests": len(all_items),
+            "errors": sum(1 for s in all_items if not s["ok"]),
+            "throughput_rps": round(len(all_items) / elapsed, 2) if elapsed else 0,
+            "latency_ms": {"p50": percentile(latencies, 50), "p95": percentile(latencies, 95),
+                           "p99": percentile(latencies, 99)},
+            "upstream_calls": sum(s["upstream_calls"] for s in all_items),
+        },
+        "endpoints": endpoints,
+    }
+
+
+# === 자식 프로세스 (대역 서버 / 웹 API) ===
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_ready(url: str, process: subprocess.Popen, timeout: float = 60):
+    started = time.time()
+    while time.time() - started < timeout:
+        if process.poll() is not None:
+            raise RuntimeError(f"프로세스가 종료됨 (exit {process.returncode}): {url}")
+        try:
+            if httpx.get(url, timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"준비되지 않음: {url}")
+
+
+def start_standin(args) -> Tuple[subprocess.Popen, str]:
+    port = _free_port()
+    cmd = [sys.executable, "-m", "benchmarks.standin_upstream", "--port", str(port),
+           "--latency", args.standin_latency, "--error-rate", str(args.standin_error_rate), "--seed", str(args.seed)]
+    if args.data:
+        cmd += ["--data", args.data]
+    process = subprocess.Popen(cmd, cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    _wait_ready(f"{url}/_standin/stats", process)
+    return process, url
+
+
+def start_api(args, standin: str) -> Tuple[subprocess.Popen, str]:
+    port = _free_port()
+    env = {**os.environ, "UPSTREAM_STANDIN_URL": standin, "AI_PROVIDER": args.ai_provider,
+           "AI_STANDIN_LATENCY_MS": str(args.ai_latency_ms), "LOG_LEVEL": "WARNING"}
+    if args.no_response_cache:
+        env["RESPONSE_CACHE_TTL_SECONDS"] = "0"
+    cmd = [sys.executable, "-m", "uvicorn", "fastapi_server:app", "--host", "127.0.0.1", "--port", str(port),
+           "--workers", str(args.workers), "--log-level", "warning", "--no-access-log"]
+    process = subprocess.Popen(cmd, cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    _wait_ready(f"{url}/api/health", process)
+    return process, url
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="웹 API 종단 간 부하 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000, help="요청 수 (--duration이 없을 때)")
+    parser.add_argument("--duration", type=float, default=None, help="측정 시간(초) - 지정하면 요청 계획을 반복")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=50, help="측정 전에 보낼 요청 수 (캐시·커넥션 준비)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--query-ratio", type=float, default=0.5, help="정책 요청 중 user_query 포함 비율")
+    parser.add_argument("--price-ratio", type=float, default=0.4, help="부동산/종합 요청 중 max_price 포함 비율")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--target", default=None, help="이미 실행 중인 웹 API 주소 (지정 시 자식 프로세스 없이)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수")
+    parser.add_argument("--standin-latency", default="lognormal:80,0.5")
+    parser.add_argument("--standin-error-rate", type=float, default=0.0)
+    parser.add_argument("--data", default=None, help="대역 서버 고정 데이터 디렉터리")
+    parser.add_argument("--ai-provider", default="local")
+    parser.add_argument("--ai-latency-ms", type=float, default=300)
+    parser.add_argument("--no-response-cache", action="store_true", help="응답 캐시를 사실상 끄고 측정")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본 benchmarks/results/load-<시각>.json)")
+    args = parser.parse_args()
+
+    processes: List[subprocess.Popen] = []
+    standin = None
+    try:
+        if args.target:
+            target = args.target.rstrip("/")
+        else:
+            standin_process, standin = start_standin(args)
+            processes.append(standin_process)
+            api_process, target = start_api(args, standin)
+            processes.append(api_process)
+
+        plan = build_plan(args.requests, args.seed, args.query_ratio, args.price_ratio)
+        if args.warmup:
+            asyncio.run(run_load(target, build_plan(args.warmup, args.seed + 1, args.query_ratio, args.price_ratio),
+                                 min(args.concurrency, args.warmup), None, args.timeout))
+
+        before = httpx.get(f"{standin}/_standin/stats").json() if standin else None
+        print(f"🚀 부하 시작: {target} (동시 {args.concurrency}, "
+              + (f"{args.duration}초" if args.duration else f"{len(plan)}건") + ")")
+        samples, elapsed = asyncio.run(run_load(target, plan, args.concurrency, args.duration, args.timeout))
+        after = httpx.get(f"{standin}/_standin/stats").json() if standin else None
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    result = {
+        "benchmark": "load_test",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "config": {k: v for k, v in vars(args).items() if k != "output"},
+        "mix": {"endpoints": ENDPOINT_MIX, "regions": REGION_MIX},
+        **summarize(samples, elapsed),
+    }
+    if before is not None:
+        result["standin_requests"] = {api: after[api]["requests"] - before[api]["requests"] for api in after}
+
+    output = args.output or os.path.join(RESULTS_DIR, f"load-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    total = result["total"]
+    print(f"📊 전체 {total['requests']}건 / {result['elapsed_s']}초 = {total['throughput_rps']} req/s, "
+          f"오류 {total['errors']}건, 공공 API 호출 {total['upstream_calls']}회")
+    print(f"{'엔드포인트':<14}{'요청':>7}{'오류':>6}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'API/요청':>10}")
+    for endpoint, stats in result["endpoints"].items():
+        latency = stats["latency_ms"]
+        print(f"{endpoint:<14}{stats['requests']:>7}{stats['errors']:>6}{stats['throughput_rps']:>9}"
+              f"{latency['p50']:>9}{latency['p95']:>9}{latency['p99']:>9}{stats['upstream_calls_per_request']:>10}")
+    print(f"💾 결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
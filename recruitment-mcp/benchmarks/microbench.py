@@ -0,0 +1,216 @@
+# microbench.py — 순수 데이터 처리 함수의 입력 크기별 시간/메모리 할당 측정
+#
+# 합성 레코드(100 ~ 100k건)로 각 함수를 반복 실행해 중앙값 시간과 레코드당 시간을 재고,
+# tracemalloc으로 한 번 더 실행해 할당 블록 수/바이트와 최대 사용량을 기록합니다.
+# 크기가 10배 늘 때 시간이 몇 배 느는지(scaling = log-log 기울기, 1이면 선형)도 함께 출력합니다.
+#
+#   python -m benchmarks.microbench
+#   python -m benchmarks.microbench --sizes 100,1000,10000 --only parse_apartment_xml,filter_active_policies
+#   python -m benchmarks.microbench --json --output benchmarks/results/micro.json
+#
+# 입력 목록은 서로 다른 레코드 POOL_SIZE개를 반복해 채웁니다 (100k건 정책 생성 시 메모리/시간 절약).
+# --data로 benchmarks.generate_dataset 출력 디렉터리를 주면 그 레코드를 가장 큰 크기만큼 읽어 씁니다.
+import argparse
+import gc
+import json
+import math
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.synthetic import REGIONS, load_fixture, make_jobs, make_policies, make_trades, trades_xml
+
+POOL_SIZE = 2000
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000]
+TARGET_REGION = "51150"
+
+USER_INPUTS = [
+    "강릉 일자리 찾아줘", "청양군 아파트 3억 이하 매물", "김제시 청년 월세 지원 정책 알려줘", "정선 정규직 채용",
+    "영월군 청년인턴 공고랑 집 같이 보여줘", "2억 5천 이하 아파트", "신입 전산직 채용 있나요", "창업 지원금 받을 수 있을까",
+]
+
+FIXTURE_NAMES = {"jobs": "recruitment", "policies": "youth_policies", "trades": "apt_trades"}
+
+_pools: Dict[str, List] = {}
+_fixture: Dict[str, Any] = {"data_dir": None, "limit": None}
+
+
+def _pool(name: str) -> List:
+    """함수별 입력을 만들 서로 다른 레코드 묶음 (한 번만 생성)"""
+    if name not in _pools:
+        records = load_fixture(_fixture["data_dir"], FIXTURE_NAMES[name], _fixture["limit"])
+        if records:
+            _pools[name] = records
+        elif name == "jobs":
+            _pools[name] = make_jobs(POOL_SIZE)
+        elif name == "policies":
+            per_region = POOL_SIZE // len(REGIONS)
+            _pools[name] = [p for i, (code, _) in enumerate(REGIONS)
+                            for p in make_policies(per_region, seed=42 + i, region_code=code)]
+        elif name == "trades":
+            _pools[name] = make_trades(POOL_SIZE, TARGET_REGION)
+    return _pools[name]
+
+
+def _repeat(items: List, size: int) -> List:
+    return [items[i % len(items)] for i in range(size)]
+
+
+def build_cases(handler) -> Dict[str, Dict[str, Callable]]:
+    """함수 이름 → {"prepare": size → 입력, "run": 입력 → 결과}"""
+    chatbot = handler.chatbot
+
+    def run_each(fn):
+        return lambda values: [fn(value) for value in values]
+
+    return {
+        "parse_apartment_xml": {
+            "prepare": lambda size: trades_xml(_repeat(_pool("trades"), size)),
+            "run": chatbot.parse_apartment_xml,
+        },
+        "filter_active_policies": {
+            "prepare": lambda size: _repeat(_pool("policies"), size),
+            "run": chatbot.filter_active_policies,
+        },
+        "filter_and_sort_jobs_by_region": {
+            "prepare": lambda size: _repeat(_pool("jobs"), size),
+            "run": lambda jobs: chatbot.filter_and_sort_jobs_by_region(jobs, TARGET_REGION),
+        },
+        "filter_and_sort_policies_by_region": {
+            "prepare": lambda size: _repeat(_pool("policies"), size),
+            "run": lambda policies: chatbot.filter_and_sort_policies_by_region(policies, TARGET_REGION),
+        },
+        # 입력 문장/코드 문자열 size개를 차례로 처리 (호출당 비용 × 호출 수)
+        "analyze_user_intent": {
+            "prepare": lambda size: _repeat(USER_INPUTS, size),
+            "run": run_each(chatbot.analyze_user_intent),
+        },
+        "format_education_requirement": {
+            "prepare": lambda size: [job["acbgCondLst"] for job in _repeat(_pool("jobs"), size)],
+            "run": run_each(handler.format_education_requirement),
+        },
+        "format_hire_type": {
+            "prepare": lambda size: [job["hireTypeLst"] for job in _repeat(_pool("jobs"), size)],
+            "run": run_each(handler.format_hire_type),
+        },
+        "_calculate_job_stats_detailed": {
+            "prepare": lambda size: _repeat(_pool("jobs"), size),
+            "run": handler._calculate_job_stats_detailed,
+        },
+    }
+
+
+def _measure_time(run: Callable[[Any], Any], data: Any, repeat: int, min_seconds: float) -> Dict[str, float]:
+    """최소 repeat회, 합계 min_seconds 이상이 될 때까지 실행 (GC는 측정 중 끔)"""
+    samples: List[float] = []
+    gc.collect()
+    gc.disable()
+    try:
+        total = 0.0
+        while len(samples) < repeat or total < min_seconds:
+            started = time.perf_counter()
+            run(data)
+            elapsed = time.perf_counter() - started
+            samples.append(elapsed * 1000)
+            total += elapsed
+            if len(samples) >= repeat * 50:
+                break
+    finally:
+        gc.enable()
+    samples.sort()
+    return {"runs": len(samples), "median_ms": round(samples[len(samples) // 2], 4), "min_ms": round(samples[0], 4)}
+
+
+def _measure_alloc(run: Callable[[Any], Any], data: Any) -> Dict[str, int]:
+    """한 번 실행하는 동안의 할당 - 실행 후 남은 블록/바이트(반환값 포함)와 실행 중 최대 추가 사용량"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = run(data)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    del result
+    return {
+        "alloc_blocks": sum(stat.count_diff for stat in diff if stat.count_diff > 0),
+        "alloc_bytes": sum(stat.size_diff for stat in diff if stat.size_diff > 0),
+        "peak_bytes": peak - base,
+    }
+
+
+def run(sizes: List[int], only: Optional[List[str]], repeat: int, min_seconds: float, alloc: bool,
+        data_dir: Optional[str] = None) -> Dict:
+    import src.web_api_handler as w
+    _pools.clear()
+    _fixture.update(data_dir=data_dir, limit=max(sizes))
+    handler = w.WebAPIHandler()
+    cases = build_cases(handler)
+    unknown = set(only or ()) - set(cases)
+    if unknown:
+        raise SystemExit(f"알 수 없는 함수: {', '.join(sorted(unknown))} (가능: {', '.join(cases)})")
+
+    results: Dict[str, List[Dict]] = {}
+    for name, case in cases.items():
+        if only and name not in only:
+            continue
+        rows = []
+        for size in sizes:
+            data = case["prepare"](size)
+            row: Dict[str, Any] = {"size": size, **_measure_time(case["run"], data, repeat, min_seconds)}
+            row["us_per_record"] = round(row["median_ms"] * 1000 / size, 3)
+            if alloc:
+                row.update(_measure_alloc(case["run"], data))
+            if rows and rows[-1]["median_ms"] > 0 and row["median_ms"] > 0:
+                row["scaling"] = round(math.log(row["median_ms"] / rows[-1]["median_ms"]) / math.log(size / rows[-1]["size"]), 2)
+            rows.append(row)
+            del data
+        results[name] = rows
+    return {"sizes": sizes, "data": data_dir, "pool_size": {name: len(pool) for name, pool in _pools.items()},
+            "functions": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터 처리 함수 마이크로벤치마크")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="입력 크기 목록 (콤마 구분)")
+    parser.add_argument("--only", default=None, help="측정할 함수 이름 (콤마 구분)")
+    parser.add_argument("--repeat", type=int, default=5, help="크기별 최소 반복 횟수")
+    parser.add_argument("--min-seconds", type=float, default=0.2, help="크기별 최소 측정 시간")
+    parser.add_argument("--no-alloc", action="store_true", help="tracemalloc 할당 측정 생략")
+    parser.add_argument("--data", default=None, help="고정 데이터 디렉터리 (benchmarks.generate_dataset 출력)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    only = [s.strip() for s in args.only.split(",")] if args.only else None
+    result = run(sizes, only, args.repeat, args.min_seconds, not args.no_alloc, args.data)
+    result["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    for name, rows in result["functions"].items():
+        print(f"\n🔬 {name}")
+        print(f"{'크기':>9}{'중앙값(ms)':>13}{'µs/건':>10}{'scaling':>9}{'할당 블록':>11}{'할당 KB':>10}{'최대 KB':>10}")
+        for row in rows:
+            print(f"{row['size']:>9,}{row['median_ms']:>13}{row['us_per_record']:>10}{row.get('scaling', '-'):>9}"
+                  f"{row.get('alloc_blocks', '-'):>11}"
+                  f"{round(row['alloc_bytes'] / 1024, 1) if 'alloc_bytes' in row else '-':>10}"
+                  f"{round(row['peak_bytes'] / 1024, 1) if 'peak_bytes' in row else '-':>10}")
+    if args.output:
+        print(f"\n💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
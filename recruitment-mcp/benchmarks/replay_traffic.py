@@ -0,0 +1,182 @@
+# replay_traffic.py — 기록한 실제 요청(src/traffic_capture.py)을 대상 서버에 다시 보내기
+#
+# 기록 당시 요청 간격을 --speed 배 빠르게 재현하고(0이면 간격 무시, --concurrency개씩 최대한 빠르게),
+# 경로별로 기록 당시와 재생 결과의 지연(p50/p95/p99)과 오류율 차이를 보고합니다.
+# 기록 당시 지연은 서버 안에서 잰 값, 재생 지연은 클라이언트에서 잰 값이므로 네트워크 왕복만큼 차이가 납니다.
+#
+#   python -m benchmarks.replay_traffic captures/ --target http://127.0.0.1:8000            # 1배속
+#   python -m benchmarks.replay_traffic captures/ --target http://staging:8000 --speed 5 --output replay.json
+#   python -m benchmarks.replay_traffic captures/traffic.jsonl --target ... --speed 0 --concurrency 64
+import argparse
+import asyncio
+import glob
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.load_test import percentile
+
+# 기록 당시 발급된 ID로 조회하는 경로 - 다른 서버에서는 의미가 없어 기본으로 재생하지 않음
+SKIPPED_PATH_PREFIXES = ("/api/search/policies/analysis/",)
+
+
+def capture_files(source: str) -> List[str]:
+    """디렉터리면 회전된 파일을 오래된 순서로 (traffic.jsonl.N … traffic.jsonl.1, traffic.jsonl)"""
+    if os.path.isfile(source):
+        return [source]
+    rotated = glob.glob(os.path.join(source, "traffic.jsonl.*"))
+    rotated.sort(key=lambda path: int(path.rsplit(".", 1)[-1]) if path.rsplit(".", 1)[-1].isdigit() else 0,
+                 reverse=True)
+    current = os.path.join(source, "traffic.jsonl")
+    return rotated + ([current] if os.path.exists(current) else [])
+
+
+def load_entries(source: str, limit: Optional[int] = None, include_skipped: bool = False) -> List[Dict[str, Any]]:
+    entries = []
+    for path in capture_files(source):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                # 본문이 잘린 요청과 (기본) 다른 요청 결과에 의존하는 조회는 재생하지 않음
+                if entry.get("truncated"):
+                    continue
+                if not include_skipped and entry["path"].startswith(SKIPPED_PATH_PREFIXES):
+                    continue
+                entries.append(entry)
+    entries.sort(key=lambda e: e["ts"])
+    return entries[:limit] if limit else entries
+
+
+async def replay(entries: List[Dict[str, Any]], target: str, speed: float, concurrency: int,
+                 timeout: float) -> List[Dict[str, Any]]:
+    """speed>0이면 기록 간격/speed에 맞춰 보내고, 0이면 concurrency개씩 연달아 보냄"""
+    results: List[Dict[str, Any]] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    origin = entries[0]["ts"] if entries else 0
+
+    async with httpx.AsyncClient(base_url=target, timeout=timeout, limits=limits) as client:
+        started = time.perf_counter()
+
+        async def send(entry: Dict[str, Any]):
+            scheduled = (entry["ts"] - origin) / speed if speed > 0 else 0.0
+            delay = scheduled - (time.perf_counter() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            async with semaphore:
+                sent = time.perf_counter()
+                result = {"path": entry["path"], "captured_status": entry["status"],
+                          "captured_ms": entry["duration_ms"], "lag_ms": max(0.0, (sent - started - scheduled) * 1000)}
+                try:
+                    resp = await client.request(
+                        entry["method"], entry["path"] + (f"?{entry['query']}" if entry.get("query") else ""),
+                        content=entry.get("body", "").encode("utf-8") or None, headers=entry.get("headers") or {})
+                    result["status"] = resp.status_code
+                except Exception as e:
+                    result["status"] = None
+                    result["error"] = type(e).__name__
+                result["ms"] = (time.perf_counter() - sent) * 1000
+                results.append(result)
+
+        await asyncio.gather(*(send(entry) for entry in entries))
+    return results
+
+
+def _is_error(status: Optional[int]) -> bool:
+    return status is None or status >= 500
+
+
+def _latency(values: List[float]) -> Dict[str, Optional[float]]:
+    values = sorted(values)
+    return {"p50": percentile(values, 50), "p95": percentile(values, 95), "p99": percentile(values, 99)}
+
+
+def _compare(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    captured, replayed = _latency([r["captured_ms"] for r in items]), _latency([r["ms"] for r in items])
+    captured_errors = sum(1 for r in items if _is_error(r["captured_status"]))
+    replay_errors = sum(1 for r in items if _is_error(r["status"]))
+    return {
+        "requests": len(items),
+        "captured_ms": captured,
+        "replay_ms": replayed,
+        "delta_ms": {k: round(replayed[k] - captured[k], 2) if replayed[k] is not None and captured[k] is not None else None
+                     for k in replayed},
+        "captured_error_rate": round(captured_errors / len(items), 4),
+        "replay_error_rate": round(replay_errors / len(items), 4),
+        "error_rate_delta": round((replay_errors - captured_errors) / len(items), 4),
+        "status_mismatches": sum(1 for r in items if r["status"] != r["captured_status"]),
+    }
+
+
+def summarize(results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    by_path: Dict[str, List[Dict[str, Any]]] = {}
+    for result in results:
+        by_path.setdefault(result["path"], []).append(result)
+    lags = sorted(r["lag_ms"] for r in results)
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(results) / elapsed, 2) if elapsed else 0,
+        # 예정보다 늦게 보낸 정도 - 크면 재생 도구(또는 concurrency 한도)가 병목
+        "send_lag_ms": {"p50": percentile(lags, 50), "p99": percentile(lags, 99)},
+        "total": _compare(results) if results else {},
+        "paths": {path: _compare(items) for path, items in sorted(by_path.items())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록한 요청 재생 (지연/오류율 비교)")
+    parser.add_argument("source", help="TRAFFIC_CAPTURE_DIR 또는 traffic.jsonl 파일")
+    parser.add_argument("--target", required=True, help="대상 서버 주소")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (0 = 간격 무시)")
+    parser.add_argument("--concurrency", type=int, default=256, help="동시 요청 상한")
+    parser.add_argument("--limit", type=int, default=None, help="앞에서부터 재생할 요청 수")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--include-analysis-polls", action="store_true",
+                        help="정책 AI 분석 결과 조회(/analysis/{id})도 재생 (기록 당시 ID라 대부분 404)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    entries = load_entries(args.source, args.limit, args.include_analysis_polls)
+    if not entries:
+        raise SystemExit(f"재생할 요청이 없습니다: {args.source}")
+    span = entries[-1]["ts"] - entries[0]["ts"]
+    print(f"📼 요청 {len(entries)}건 (기록 구간 {span:.1f}초) → {args.target} "
+          + (f"{args.speed}배속" if args.speed > 0 else f"최대 속도 (동시 {args.concurrency})"))
+
+    started = time.perf_counter()
+    results = asyncio.run(replay(entries, args.target.rstrip("/"), args.speed, args.concurrency, args.timeout))
+    report = {
+        "benchmark": "replay_traffic",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "source": args.source,
+        "target": args.target,
+        "speed": args.speed,
+        "captured_span_s": round(span, 3),
+        **summarize(results, time.perf_counter() - started),
+    }
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    total = report["total"]
+    print(f"📊 {total['requests']}건 / {report['elapsed_s']}초 = {report['throughput_rps']} req/s, "
+          f"오류율 {total['captured_error_rate']:.2%} → {total['replay_error_rate']:.2%}, "
+          f"전송 지연 p99 {report['send_lag_ms']['p99']}ms")
+    for path, stats in report["paths"].items():
+        captured, replayed = stats["captured_ms"], stats["replay_ms"]
+        print(f"  {path}  {stats['requests']}건  p50 {captured['p50']}→{replayed['p50']}ms  "
+              f"p95 {captured['p95']}→{replayed['p95']}ms  p99 {captured['p99']}→{replayed['p99']}ms  "
+              f"오류율 Δ{stats['error_rate_delta']:+.2%}  상태 불일치 {stats['status_mismatches']}")
+    if args.output:
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
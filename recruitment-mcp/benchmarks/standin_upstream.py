@@ -0,0 +1,336 @@
+# standin_upstream.py — 공공 API 대역(stand-in) 서버 (API 키/외부망 없이 부하 테스트·오프라인 개발)
+#
+# 실제 API와 같은 요청 파라미터/응답 형식으로 세 API를 흉내 냅니다.
+#   GET /recruitment/list                              공공기관 채용정보 (JSON, pageNo/numOfRows)
+#   GET /RTMSDataSvcAptTrade/getRTMSDataSvcAptTrade    아파트 매매 실거래가 (XML, LAWD_CD/DEAL_YMD)
+#   GET /youthcenter/getPlcy                           온통청년 정책 (JSON, pageNum/pageSize)
+#   GET /_standin/stats                                API별 호출/주입 오류 수 (부하 테스트 집계용)
+#
+# 실행 후 웹 API를 대역 서버로 연결:
+#   python -m benchmarks.standin_upstream --port 9100
+#   UPSTREAM_STANDIN_URL=http://127.0.0.1:9100 uvicorn fastapi_server:app
+#
+# 지연/오류/TLS 설정:
+#   --latency lognormal:80,0.6             중앙값 80ms 로그정규 (fixed:50 / uniform:20,200 / none)
+#   --api-latency youth=fixed:400          API별 지연 (recruitment / realestate / youth)
+#   --error-rate 0.02 --error-kinds 500,503,timeout,garbage,key
+#   --tls self-signed                      신뢰되지 않은 인증서 → 클라이언트가 insecure 모드까지 내려감
+#   --tls legacy                           1024비트 RSA 인증서 (SSL_CERT_FILE로 신뢰시키면 tls12_seclevel1에서 성공)
+#   --data fixtures/                       recruitment.jsonl / apt_trades.jsonl / youth_policies.jsonl(.gz) 사용
+import argparse
+import asyncio
+import os
+import random
+import ssl
+import subprocess
+import tempfile
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from benchmarks.synthetic import REGIONS, load_fixture, make_jobs, make_policy, make_trades, trades_xml
+
+APIS = ("recruitment", "realestate", "youth")
+ERROR_KINDS = ("500", "503", "429", "timeout", "garbage", "key")
+
+
+class LatencyModel:
+    """지연 분포 - "none", "fixed:ms", "uniform:min,max", "lognormal:median,sigma" """
+
+    def __init__(self, spec: str = "none"):
+        self.spec = spec
+        kind, _, args = spec.partition(":")
+        self.kind = kind
+        self.args = [float(x) for x in args.split(",") if x]
+        if kind not in ("none", "fixed", "uniform", "lognormal"):
+            raise ValueError(f"알 수 없는 지연 분포: {spec}")
+
+    def sample_ms(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.args[0]
+        if self.kind == "uniform":
+            return rng.uniform(self.args[0], self.args[1])
+        if self.kind == "lognormal":
+            median, sigma = self.args[0], (self.args[1] if len(self.args) > 1 else 0.5)
+            return rng.lognormvariate(0, sigma) * median
+        return 0.0
+
+
+class StandinConfig:
+    """대역 서버 설정 (명령행 인자 또는 create_app 인자)"""
+
+    def __init__(self, latency: str = "none", api_latency: Optional[Dict[str, str]] = None,
+                 error_rate: float = 0.0, error_kinds: Iterable[str] = ("500", "503", "timeout", "garbage"),
+                 timeout_sleep: float = 35.0, retry_after: int = 1, max_page_size: int = 1000,
+                 jobs: int = 600, policies_per_region: int = 60, trades_per_month: int = 40,
+                 data_dir: Optional[str] = None, seed: int = 42):
+        self.latency = {api: LatencyModel((api_latency or {}).get(api, latency)) for api in APIS}
+        self.error_rate = error_rate
+        self.error_kinds = tuple(error_kinds)
+        unknown = set(self.error_kinds) - set(ERROR_KINDS)
+        if unknown:
+            raise ValueError(f"알 수 없는 오류 종류: {sorted(unknown)}")
+        self.timeout_sleep = timeout_sleep
+        self.retry_after = retry_after
+        self.max_page_size = max_page_size
+        self.jobs = jobs
+        self.policies_per_region = policies_per_region
+        self.trades_per_month = trades_per_month
+        self.data_dir = data_dir
+        self.seed = seed
+
+
+# === 데이터 (고정 파일 또는 합성) ===
+class StandinData:
+    def __init__(self, config: StandinConfig):
+        self.config = config
+        self.jobs = load_fixture(config.data_dir, "recruitment") or make_jobs(config.jobs, seed=config.seed)
+        policies = load_fixture(config.data_dir, "youth_policies")
+        if policies is None:
+            rng = random.Random(config.seed)
+            policies = [make_policy(rng, region_index * config.policies_per_region + i, code)
+                        for region_index, (code, _) in enumerate(REGIONS)
+                        for i in range(config.policies_per_region)]
+        self.policies = policies
+        # 실거래가: (LAWD_CD, DEAL_YMD) → 목록. 고정 파일이 없으면 요청된 지역·년월을 처음 조회할 때 생성
+        self._trades: Dict[Tuple[str, str], List[Dict]] = {}
+        self._trades_from_file = False
+        trades = load_fixture(config.data_dir, "apt_trades")
+        if trades is not None:
+            self._trades_from_file = True
+            for trade in trades:
+                key = (trade.get("sggCd", ""), f"{trade.get('dealYear', '')}{int(trade.get('dealMonth') or 0):02d}")
+                self._trades.setdefault(key, []).append(trade)
+        self._lock = threading.Lock()
+
+    def trades(self, lawd_cd: str, deal_ymd: str) -> List[Dict]:
+        key = (lawd_cd, deal_ymd)
+        with self._lock:
+            if key not in self._trades and not self._trades_from_file:
+                self._trades[key] = make_trades(self.config.trades_per_month, lawd_cd, deal_ymd, seed=self.config.seed)
+            return self._trades.get(key, [])
+
+
+def _matches_codes(value: str, requested: str) -> bool:
+    """콤마 목록 필드 필터 - 요청한 코드 중 하나라도 포함되면 일치 (실제 API와 같은 OR 조건)"""
+    have = set((value or "").split(","))
+    return any(code in have for code in requested.split(",") if code)
+
+
+def _page(items: List, page_no: int, page_size: int) -> List:
+    start = (max(page_no, 1) - 1) * page_size
+    return items[start:start + page_size]
+
+
+# === 앱 ===
+def create_app(config: Optional[StandinConfig] = None) -> FastAPI:
+    config = config or StandinConfig()
+    data = StandinData(config)
+    rng = random.Random(config.seed)
+    stats: Dict[str, Dict[str, int]] = {api: {"requests": 0, "errors_injected": 0} for api in APIS}
+    app = FastAPI(title="공공 API 대역 서버", docs_url=None, redoc_url=None)
+
+    @lru_cache(maxsize=256)
+    def filtered_jobs(filters: Tuple[Tuple[str, str], ...]) -> List[Dict]:
+        jobs = data.jobs
+        for field, value in filters:
+            jobs = [job for job in jobs if _matches_codes(str(job.get(field, "")), value)]
+        return jobs
+
+    @lru_cache(maxsize=256)
+    def filtered_policies(filters: Tuple[Tuple[str, str], ...]) -> List[Dict]:
+        policies = data.policies
+        for field, value in filters:
+            if field == "plcyNo":
+                policies = [p for p in policies if p.get("plcyNo") == value]
+            elif field in ("lclsfNm", "zipCd"):  # 쉼표로 여러 값 - 하나라도 겹치면 포함
+                wanted = set(value.split(","))
+                policies = [p for p in policies if wanted & set((p.get(field) or "").split(","))]
+            else:  # plcyNm / plcyKywdNm / sprvsnInstCdNm: 부분 일치
+                policies = [p for p in policies if value in (p.get(field) or "")]
+        return policies
+
+    async def simulate(api: str, key_present: bool) -> Optional[Response]:
+        """지연 + 오류 주입 - 오류 응답을 반환하면 그대로 전송"""
+        stats[api]["requests"] += 1
+        delay_ms = config.latency[api].sample_ms(rng)
+        if delay_ms:
+            await asyncio.sleep(delay_ms / 1000)
+        if not key_present:
+            return _key_error(api)
+        if config.error_rate and config.error_kinds and rng.random() < config.error_rate:
+            stats[api]["errors_injected"] += 1
+            kind = rng.choice(config.error_kinds)
+            if kind == "timeout":
+                await asyncio.sleep(config.timeout_sleep)  # 클라이언트 타임아웃(20~30초)보다 길게
+                return None
+            if kind in ("503", "429"):
+                return Response("Service Unavailable" if kind == "503" else "Too Many Requests",
+                                status_code=int(kind), headers={"Retry-After": str(config.retry_after)})
+            if kind == "500":
+                return Response("Internal Server Error", status_code=500)
+            if kind == "garbage":
+                return Response('{"resultCode": 200, "result": [{"recrutPbl' if api != "realestate"
+                                else "<response><header><resultCode>000</resultCode><body><items><item>",
+                                media_type="application/xml" if api == "realestate" else "application/json")
+            return _key_error(api)
+        return None
+
+    def _key_error(api: str) -> Response:
+        # data.go.kr 게이트웨이 형식 (HTTP 200 + XML 오류 본문)
+        if api == "youth":
+            return JSONResponse({"resultCode": 401, "resultMessage": "인증키가 유효하지 않습니다.", "result": None})
+        return Response(
+            "<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+            "<returnAuthMsg>SERVICE_KEY_IS_NOT_REGISTERED_ERROR</returnAuthMsg>"
+            "<returnReasonCode>30</returnReasonCode></cmmMsgHeader></OpenAPI_ServiceResponse>",
+            media_type="application/xml")
+
+    def page_size(value, default: int) -> int:
+        return min(max(int(value or default), 1), config.max_page_size)
+
+    @app.get("/recruitment/list")
+    async def recruitment_list(request: Request):
+        q = request.query_params
+        error = await simulate("recruitment", bool(q.get("serviceKey")))
+        if error is not None:
+            return error
+        filters = tuple(sorted((k, v) for k, v in q.items()
+                               if k in ("ncsCdLst", "hireTypeLst", "acbgCondLst", "workRgnLst", "recrutSe") and v))
+        jobs = filtered_jobs(filters)
+        rows = page_size(q.get("numOfRows"), 10)
+        return JSONResponse({"resultCode": 200, "resultMsg": "성공했습니다.", "totalCount": len(jobs),
+                             "result": _page(jobs, int(q.get("pageNo") or 1), rows)})
+
+    @app.get("/RTMSDataSvcAptTrade/getRTMSDataSvcAptTrade")
+    async def apartment_trades(request: Request):
+        q = request.query_params
+        error = await simulate("realestate", bool(q.get("serviceKey")))
+        if error is not None:
+            return error
+        trades = data.trades(q.get("LAWD_CD", ""), q.get("DEAL_YMD", ""))
+        rows, page_no = page_size(q.get("numOfRows"), 10), int(q.get("pageNo") or 1)
+        body = trades_xml(_page(trades, page_no, rows), rows, page_no, len(trades))
+        return Response(body, media_type="application/xml")
+
+    @app.get("/youthcenter/getPlcy")
+    async def youth_policies(request: Request):
+        q = request.query_params
+        error = await simulate("youth", bool(q.get("apiKeyNm")))
+        if error is not None:
+            return error
+        filters = tuple(sorted((k, v) for k, v in q.items()
+                               if k in ("plcyNo", "plcyNm", "plcyKywdNm", "lclsfNm", "sprvsnInstCdNm", "zipCd") and v))
+        policies = filtered_policies(filters)
+        size, page_num = page_size(q.get("pageSize"), 10), int(q.get("pageNum") or 1)
+        return JSONResponse({
+            "resultCode": 200, "resultMessage": "성공",
+            "result": {"pagging": {"totCount": len(policies), "pageNum": page_num, "pageSize": size},
+                       "youthPolicyList": _page(policies, page_num, size)},
+        })
+
+    @app.get("/_standin/stats")
+    async def standin_stats():
+        return stats
+
+    @app.post("/_standin/reset")
+    async def standin_reset():
+        for counters in stats.values():
+            for key in counters:
+                counters[key] = 0
+        return stats
+
+    return app
+
+
+# === TLS ===
+def make_certificate(directory: str, bits: int = 2048) -> Tuple[str, str]:
+    """localhost/127.0.0.1용 자체 서명 인증서 (openssl 명령 사용) - (certfile, keyfile)"""
+    certfile, keyfile = os.path.join(directory, "standin-cert.pem"), os.path.join(directory, "standin-key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", f"rsa:{bits}", "-nodes", "-days", "30",
+         "-keyout", keyfile, "-out", certfile, "-subj", "/CN=localhost",
+         "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1"],
+        check=True, capture_output=True
+    )
+    return certfile, keyfile
+
+
+def server_ssl_context(mode: str, directory: str) -> Tuple[Optional[ssl.SSLContext], Optional[str]]:
+    """
+    TLS 특성 재현:
+    - self-signed: 신뢰되지 않은 인증서 → default/tls12 후보는 검증 실패, insecure만 성공
+    - legacy: 1024비트 RSA 키 → OpenSSL3 기본 보안 레벨(2)에서 거부, SECLEVEL=1 후보는 성공
+      (인증서 자체는 SSL_CERT_FILE로 신뢰시켜야 검증 단계를 통과)
+    """
+    if mode == "off":
+        return None, None
+    certfile, keyfile = make_certificate(directory, bits=1024 if mode == "legacy" else 2048)
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    if mode == "legacy":
+        ctx.maximum_version = ssl.TLSVersion.TLSv1_2
+        ctx.set_ciphers("DEFAULT:@SECLEVEL=0")  # 서버 쪽에서 약한 키를 불러올 수 있도록
+    ctx.load_cert_chain(certfile, keyfile)
+    return ctx, certfile
+
+
+def _parse_api_latency(values: List[str]) -> Dict[str, str]:
+    result = {}
+    for value in values:
+        api, _, spec = value.partition("=")
+        if api not in APIS:
+            raise SystemExit(f"--api-latency: 알 수 없는 API {api} (recruitment/realestate/youth)")
+        result[api] = spec
+    return result
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="공공 API 대역 서버 (채용/실거래가/청년정책)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency", default="none", help="none | fixed:ms | uniform:min,max | lognormal:median,sigma")
+    parser.add_argument("--api-latency", action="append", default=[], metavar="API=SPEC")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-kinds", default="500,503,timeout,garbage", help=",".join(ERROR_KINDS))
+    parser.add_argument("--timeout-sleep", type=float, default=35.0, help="timeout 오류 시 응답 지연(초)")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--max-page-size", type=int, default=1000)
+    parser.add_argument("--jobs", type=int, default=600)
+    parser.add_argument("--policies-per-region", type=int, default=60)
+    parser.add_argument("--trades-per-month", type=int, default=40)
+    parser.add_argument("--data", default=None, help="고정 데이터 디렉터리 (benchmarks.generate_dataset 출력)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tls", choices=["off", "self-signed", "legacy"], default="off")
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        latency=args.latency, api_latency=_parse_api_latency(args.api_latency),
+        error_rate=args.error_rate, error_kinds=[k for k in args.error_kinds.split(",") if k],
+        timeout_sleep=args.timeout_sleep, retry_after=args.retry_after, max_page_size=args.max_page_size,
+        jobs=args.jobs, policies_per_region=args.policies_per_region, trades_per_month=args.trades_per_month,
+        data_dir=args.data, seed=args.seed
+    )
+    app = create_app(config)
+
+    cert_dir = tempfile.mkdtemp(prefix="standin-tls-")
+    ctx, certfile = server_ssl_context(args.tls, cert_dir)
+    scheme = "https" if ctx else "http"
+    print(f"🧪 공공 API 대역 서버: {scheme}://{args.host}:{args.port}")
+    print(f"   UPSTREAM_STANDIN_URL={scheme}://{args.host}:{args.port}")
+    if certfile:
+        print(f"   인증서: {certfile} (SSL_CERT_FILE로 지정하면 클라이언트가 신뢰)")
+
+    server_config = uvicorn.Config(app, host=args.host, port=args.port, log_level="warning")
+    server_config.load()
+    # uvicorn은 파일 경로로만 TLS를 설정하므로, 보안 레벨을 낮춘 컨텍스트는 로드 후 직접 지정
+    server_config.ssl = ctx
+    uvicorn.Server(server_config).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+# synthetic.py — 벤치마크용 합성 레코드 (실제 API 응답과 같은 필드 구성, 같은 seed → 같은 데이터)
+import datetime
+import gzip
+import json
+import os
+import random
+from typing import Dict, Iterator, List, Optional
+from xml.sax.saxutils import escape
+
+# 공고/사업 기간은 올해 기준 (신청 가능 여부 필터가 실행 날짜와 상관없이 같은 비율로 걸러지도록)
+YEAR = datetime.date.today().year
+
+REGIONS = [
+    ("51150", "강원특별자치도 강릉시"),
+    ("51770", "강원특별자치도 정선군"),
+    ("51750", "강원특별자치도 영월군"),
+    ("44790", "충청남도 청양군"),
+    ("52210", "전북특별자치도 김제시"),
+]
+
+POLICY_CATEGORIES = [("일자리", "취업"), ("일자리", "창업"), ("주거", "주택 및 거주지"), ("교육", "미래역량강화"),
+                     ("복지문화", "취약계층 및 금융지원"), ("참여권리", "청년참여")]
+POLICY_TOPICS = ["청년 월세 지원", "청년 창업 지원금", "청년 취업 장려금", "청년 농업인 정착 지원", "청년 자격증 응시료 지원",
+                 "청년 문화패스", "청년 주택 임차보증금 이자 지원", "청년 마음건강 바우처", "청년 구직활동 수당", "청년 인턴십"]
+SENTENCES = [
+    "지역에 거주하는 만 19세 이상 39세 이하 청년을 대상으로 합니다.",
+    "신청일 기준 해당 시·군에 주민등록을 두고 실제 거주하고 있어야 합니다.",
+    "지원 금액은 예산 범위 내에서 차등 지급될 수 있습니다.",
+    "중복 수혜가 제한되며, 타 기관의 유사 사업과 동시에 지원받을 수 없습니다.",
+    "선정된 청년에게는 매월 일정 금액을 최대 12개월간 지원합니다.",
+    "구비서류를 갖추어 읍·면·동 행정복지센터 또는 온라인으로 신청하시기 바랍니다.",
+    "소득 기준은 기준 중위소득 150% 이하 가구를 원칙으로 합니다.",
+    "사업 종료 후 만족도 조사 및 성과 보고에 참여해야 합니다.",
+]
+
+JOB_FIELDS = [("R600002", "경영.회계.사무"), ("R600006", "보건.의료"), ("R600020", "정보통신"),
+              ("R600014", "건설"), ("R600004", "교육.자연.사회과학"), ("R600025", "연구")]
+INSTITUTIONS = ["한국농어촌공사", "국민건강보험공단", "한국전력공사", "강원랜드", "한국수자원공사", "국립공원공단",
+                "한국교육학술정보원", "한국토지주택공사"]
+
+
+def _text(rng: random.Random, sentences: int) -> str:
+    return " ".join(rng.choice(SENTENCES) for _ in range(sentences))
+
+
+def _ymd(rng: random.Random, year: int = YEAR) -> str:
+    return f"{year}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"
+
+
+def make_policy(rng: random.Random, index: int, region_code: str = "51150", region_name: Optional[str] = None) -> Dict:
+    """온통청년 정책 API(youthPolicyList)와 같은 필드를 가진 정책 레코드"""
+    region_name = region_name or dict(REGIONS).get(region_code, "강원특별자치도 강릉시")
+    large, medium = rng.choice(POLICY_CATEGORIES)
+    topic = rng.choice(POLICY_TOPICS)
+    scope = rng.choice([1, 1, 3, 18, 250])
+    zip_codes = [region_code] + [f"{rng.randint(11, 52)}{rng.randint(100, 999)}" for _ in range(scope - 1)]
+    start = _ymd(rng)
+    return {
+        "plcyNo": f"{YEAR}{index:06d}{rng.randint(10000, 99999)}",
+        "bscPlanCycl": "1", "bscPlanPlcyWayNo": "3", "bscPlanFcsAsmtNo": "11", "bscPlanAsmtNo": "53",
+        "pvsnInstGroupCd": "0054002", "plcyPvsnMthdCd": "0042002", "plcyAprvSttsCd": "0044002",
+        "plcyNm": f"{region_name.split()[-1]} {topic}",
+        "plcyKywdNm": ",".join(rng.sample(["청년", "월세", "창업", "취업", "주거", "교육", "바우처", "장려금"], 3)),
+        "plcyExplnCn": _text(rng, rng.randint(2, 5)),
+        "lclsfNm": large, "mclsfNm": medium,
+        "plcySprtCn": _text(rng, rng.randint(1, 3)),
+        "sprvsnInstCd": "4200000", "sprvsnInstCdNm": region_name, "sprvsnInstPicNm": "청년정책팀",
+        "operInstCd": "4200000", "operInstCdNm": region_name, "operInstPicNm": "청년정책팀",
+        "sprtSclLmtYn": "N", "aplyPrdSeCd": "0057001",
+        "bizPrdSeCd": "0056001", "bizPrdBgngYmd": start, "bizPrdEndYmd": f"{YEAR}1231", "bizPrdEtcCn": "",
+        "plcyAplyMthdCn": _text(rng, 1),
+        "srngMthdCn": "서류심사 후 선정",
+        "aplyUrlAddr": "https://www.youthcenter.go.kr",
+        "sbmsnDcmntCn": "신청서, 주민등록등본, 개인정보 수집·이용 동의서",
+        "etcMttrCn": _text(rng, 1),
+        "refUrlAddr1": "", "refUrlAddr2": "",
+        "sprtSclCnt": rng.choice(["0", "10", "50", "100"]),
+        "sprtArvlSeqYn": "N",
+        "sprtTrgtMinAge": "19", "sprtTrgtMaxAge": "39", "sprtTrgtAgeLmtYn": "N",
+        "mrgSttsCd": "0055003", "earnCndSeCd": "0043001", "earnMinAmt": "0", "earnMaxAmt": "0", "earnEtcCn": "",
+        "addAplyQlfcCndCn": _text(rng, 1),
+        "ptcpPrpTrgtCn": _text(rng, 1),
+        "inqCnt": str(rng.randint(10, 5000)),
+        "rgtrInstCd": "4200000", "rgtrInstCdNm": region_name, "rgtrUpInstCd": "6420000", "rgtrUpInstCdNm": region_name.split()[0],
+        "rgtrHghrkInstCd": "6420000", "rgtrHghrkInstCdNm": region_name.split()[0],
+        "zipCd": ",".join(zip_codes),
+        "plcyMajorCd": "", "jobCd": "", "schoolCd": "", "aplyYmd": f"{start} ~ {YEAR}1231",
+        "frstRegDt": f"{YEAR}-01-02 10:00:00", "lastMdfcnDt": f"{YEAR}-03-04 15:30:00", "sbizCd": "",
+    }
+
+
+def make_job(rng: random.Random, index: int) -> Dict:
+    """공공기관 채용정보 API(recruitment list)와 같은 필드를 가진 채용 레코드"""
+    ncs_code, ncs_name = rng.choice(JOB_FIELDS)
+    regions = rng.sample(["강원", "서울", "충남", "전북", "경기", "부산"], rng.randint(1, 3))
+    return {
+        "recrutPblntSn": 280000 + index,
+        "pblntInstCd": f"B{rng.randint(100000, 999999)}",
+        "pbadmsStdInstCd": f"B{rng.randint(100000, 999999)}",
+        "instNm": rng.choice(INSTITUTIONS),
+        "ncsCdLst": ncs_code, "ncsCdNmLst": ncs_name,
+        "hireTypeLst": rng.choice(["R1010", "R1010,R1030", "R1030,R1050,R1060"]),
+        "hireTypeNmLst": rng.choice(["정규직", "정규직,기간제계약직", "기간제계약직,청년인턴(체험형)"]),
+        "workRgnLst": ",".join(f"R30{rng.randint(10, 99)}" for _ in regions),
+        "workRgnNmLst": ",".join(regions),
+        "recrutSe": rng.choice(["R2010", "R2020", "R2030"]),
+        "recrutSeNm": rng.choice(["신입", "경력", "신입+경력"]),
+        "prefCondCn": _text(rng, 1),
+        "recrutNope": rng.randint(1, 30),
+        "pbancBgngYmd": _ymd(rng),
+        "pbancEndYmd": _ymd(rng),
+        "recrutPbancTtl": f"{rng.choice(INSTITUTIONS)} {YEAR}년 {ncs_name} 분야 직원 채용 공고",
+        "srcUrl": f"https://job.alio.go.kr/recruitview.do?idx={280000 + index}",
+        "replmprYn": "N",
+        "aplyQlfcCn": _text(rng, 2),
+        "disqlfcRsn": _text(rng, 1),
+        "scrnprcdrMthdExpln": "서류전형 → 필기전형 → 면접전형 → 최종합격",
+        "prefCn": _text(rng, 1),
+        "acbgCondLst": rng.choice(["R7010", "R7020,R7040,R7050", "R7050", "R7050,R7060"]),
+        "acbgCondNmLst": rng.choice(["학력무관", "대학교졸업"]),
+        "nonatchRsn": "", "ongoingYn": "Y", "decimalDay": rng.randint(0, 30),
+    }
+
+
+# 법정동 읍·면·동 / 단지명 (실거래가 레코드용)
+UMD_NAMES = {
+    "51150": ["교동", "포남동", "입암동", "홍제동", "송정동", "주문진읍"],
+    "51770": ["정선읍", "고한읍", "사북읍", "신동읍"],
+    "51750": ["영월읍", "주천면", "상동읍"],
+    "44790": ["청양읍", "정산면", "비봉면"],
+    "52210": ["요촌동", "신풍동", "검산동", "만경읍"],
+}
+APT_NAMES = ["현대", "주공", "e편한세상", "부영사랑으로", "한신휴플러스", "푸르지오", "금호어울림", "우미린", "그린빌", "LH천년나무"]
+
+
+def make_trade(rng: random.Random, lawd_cd: str = "51150", deal_ymd: str = "202506",
+               umd_names: Optional[List[str]] = None, price_factor: float = 1.0) -> Dict:
+    """국토교통부 아파트 매매 실거래가 API(getRTMSDataSvcAptTrade) item과 같은 필드 (값은 XML 텍스트 그대로 문자열)"""
+    umd_name = rng.choice(umd_names or UMD_NAMES.get(lawd_cd) or ["중앙동", "남산동", "신흥동"])
+    area = rng.choice([39.6, 49.9, 59.9, 74.8, 84.9, 84.98, 101.2, 114.7])
+    amount = int(area * rng.uniform(180, 420) * price_factor) // 10 * 10  # 만원
+    return {
+        "aptDong": "", "aptNm": f"{umd_name[:-1]}{rng.choice(APT_NAMES)}",
+        "aptSeq": f"{lawd_cd}-{rng.randint(1, 400)}", "bonbun": f"{rng.randint(1, 2000):04d}", "bubun": "0000",
+        "buildYear": str(rng.randint(1988, 2023)), "buyerGbn": rng.choice(["개인", "개인", "법인"]),
+        "cdealDay": "", "cdealType": "",
+        "dealAmount": f"{amount:>7,}", "dealDay": str(rng.randint(1, 28)), "dealMonth": str(int(deal_ymd[4:])),
+        "dealYear": deal_ymd[:4], "dealingGbn": rng.choice(["중개거래", "중개거래", "직거래"]),
+        "estateAgentSggNm": "", "excluUseAr": f"{area}", "floor": str(rng.randint(1, 25)),
+        "jibun": str(rng.randint(1, 2000)), "landLeaseholdGbn": "N", "rgstDate": "",
+        "sggCd": lawd_cd, "slerGbn": rng.choice(["개인", "개인", "법인"]), "umdNm": umd_name,
+    }
+
+
+def make_trades(count: int, lawd_cd: str = "51150", deal_ymd: str = "202506", seed: int = 42) -> List[Dict]:
+    """지역·계약년월마다 고정된 거래 목록 (같은 seed/지역/년월 → 같은 데이터)"""
+    rng = random.Random(f"{seed}:{lawd_cd}:{deal_ymd}")
+    return [make_trade(rng, lawd_cd, deal_ymd) for _ in range(count)]
+
+
+def trades_xml(trades: List[Dict], num_of_rows: Optional[int] = None, page_no: int = 1,
+               total_count: Optional[int] = None) -> str:
+    """실거래가 API 응답 XML (resultCode 000) - trades는 해당 페이지의 item 목록"""
+    items = "".join(
+        "<item>" + "".join(f"<{k}>{escape(str(v))}</{k}>" for k, v in trade.items()) + "</item>"
+        for trade in trades
+    )
+    return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            "<response><header><resultCode>000</resultCode><resultMsg>OK</resultMsg></header>"
+            f"<body><items>{items}</items><numOfRows>{num_of_rows or len(trades)}</numOfRows><pageNo>{page_no}</pageNo>"
+            f"<totalCount>{len(trades) if total_count is None else total_count}</totalCount></body></response>")
+
+
+def make_policies(count: int, seed: int = 42, region_code: str = "51150") -> List[Dict]:
+    rng = random.Random(seed)
+    return [make_policy(rng, i, region_code) for i in range(count)]
+
+
+def make_jobs(count: int, seed: int = 42) -> List[Dict]:
+    rng = random.Random(seed)
+    return [make_job(rng, i) for i in range(count)]
+
+
+# === 고정 데이터 파일 (benchmarks.generate_dataset 출력) ===
+def fixture_path(data_dir: str, name: str) -> Optional[str]:
+    """<data_dir>/<name>.jsonl.gz 또는 .jsonl - 없으면 None"""
+    for candidate in (os.path.join(data_dir, f"{name}.jsonl.gz"), os.path.join(data_dir, f"{name}.jsonl")):
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def iter_fixture(data_dir: str, name: str, limit: Optional[int] = None) -> Iterator[Dict]:
+    path = fixture_path(data_dir, name)
+    if path is None:
+        return
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for count, line in enumerate(f):
+            if limit is not None and count >= limit:
+                break
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_fixture(data_dir: Optional[str], name: str, limit: Optional[int] = None) -> Optional[List[Dict]]:
+    """고정 데이터 레코드 목록 - 디렉터리나 파일이 없으면 None"""
+    if not data_dir or fixture_path(data_dir, name) is None:
+        return None
+    return list(iter_fixture(data_dir, name, limit))
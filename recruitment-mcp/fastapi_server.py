@@ -1,9 +1,12 @@
 # fastapi_server.py - 정책만 AI 적용 완전 수정
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
+from starlette.datastructures import MutableHeaders
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Literal
 import uvicorn
+import json
 import sys
 import os
 
@@ -13,11 +16,19 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from src.web_api_handler import WebAPIHandler
+from src import metrics, timing, traffic_capture
+from src.logging_setup import begin_request, configure_logging, end_request, get_logger, new_request_id
+from src.responses import FastJSONResponse, dumps, json_response, cached_json_response, response_cache_key
+from src.prompt_builder import prompt_stats
+
+configure_logging()
+logger = get_logger("api")
 
 app = FastAPI(
     title="이음(IEUM) 통합 정보 조회 API",
     description="채용정보 + 부동산 + 청소년정책(AI) 통합 검색 API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse  # ⚡ jsonable_encoder 없이 바로 직렬화
 )
 
 app.add_middleware(
@@ -26,8 +37,75 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Server-Timing", "X-Request-ID"],  # 프론트엔드가 If-None-Match로 재검증할 수 있도록
 )
 
+
+def _incoming_request_id(scope) -> str:
+    """앞단(로드밸런서/프론트엔드)이 보낸 X-Request-ID - 형식이 이상하면 새로 생성"""
+    for name, value in scope.get("headers") or ():
+        if name == b"x-request-id":
+            candidate = value.decode("latin-1")
+            if 0 < len(candidate) <= 64 and candidate.isascii() and candidate.replace("-", "").replace("_", "").isalnum():
+                return candidate
+            break
+    return new_request_id()
+
+
+class ServerTimingMiddleware:
+    """
+    요청별 단계 시간 기록 → Server-Timing 응답 헤더 + 요청 단위 구조화 로그 + 라우트별 지표.
+    요청 ID는 X-Request-ID 헤더를 그대로 쓰거나(로드밸런서가 붙인 경우) 새로 만들어 응답 헤더와 로그에 포함
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _incoming_request_id(scope)
+        request_token = begin_request(request_id)
+        token = timing.begin()
+        timings = timing.current()
+        status = {"code": 500}
+        metrics.HTTP_IN_FLIGHT.inc()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timings.server_timing())
+                headers.append("Timing-Allow-Origin", "*")
+                headers["X-Request-ID"] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            # 경로 변수별로 지표가 늘어나지 않도록 매칭된 라우트 템플릿으로 집계
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            metrics.HTTP_IN_FLIGHT.dec()
+            metrics.HTTP_DURATION.observe(timings.total_ms() / 1000, method=scope["method"], route=route)
+            metrics.HTTP_REQUESTS.inc(method=scope["method"], route=route, status=status["code"])
+            timing.log_request(scope["method"], scope["path"], status["code"], timings)
+            timing.end(token)
+            end_request(request_token)
+
+
+# 📼 실제 요청 표본 기록 (TRAFFIC_CAPTURE_DIR 지정 시에만) - 요청 ID를 쓰도록 ServerTimingMiddleware 안쪽에 둠
+capture_settings = traffic_capture.settings_from_env()
+if capture_settings:
+    app.add_middleware(traffic_capture.TrafficCaptureMiddleware, **capture_settings)
+
+# ⏱️ 가장 바깥에서 측정 (CORS 처리 포함)
+app.add_middleware(ServerTimingMiddleware)
+
+# 🗺️ 거의 바뀌지 않는 정적 목록 - 브라우저 캐시 허용
+STATIC_CACHE_CONTROL = {"Cache-Control": "public, max-age=86400"}
+
 handler = WebAPIHandler()
 
 # === Request/Response 모델들 ===
@@ -42,6 +120,8 @@ class JobSearchRequest(BaseModel):
     hire_type: Optional[str] = None
     education: Optional[str] = None
     # 정책만 AI 적용하므로 user_query 제거
+    view: Literal["card", "detail", "full"] = "full"  # 👁️ card/detail은 화면에 필요한 필드만 반환
+    fields: Optional[List[str]] = None  # 직접 지정한 필드만 반환 (view보다 우선)
 
 class RealestateSearchRequest(BaseModel):
     region_code: str
@@ -52,24 +132,27 @@ class PolicySearchRequest(BaseModel):
     region_code: str
     keywords: Optional[str] = None
     user_query: Optional[str] = None  # ⭐ 정책만 AI 적용
+    defer_ai: bool = True  # ⏱️ 목록 먼저 반환, AI 분석은 /api/search/policies/analysis/{id}로 조회
+    view: Literal["card", "detail", "full"] = "full"  # 👁️ card/detail은 화면에 필요한 필드만 반환
+    fields: Optional[List[str]] = None  # 직접 지정한 필드만 반환 (view보다 우선)
 
 # === API 엔드포인트들 ===
 @app.post("/api/search/comprehensive")
-async def search_comprehensive(request: SearchRequest):
+async def search_comprehensive(request: SearchRequest, http_request: Request):
     """종합 검색 - 기존 방식 (AI 없음)"""
     try:
-        print(f"📊 [DEBUG] Comprehensive API 호출: {request.query}")
+        logger.debug("종합 검색 요청", extra={"region_code": request.region_code, "query_length": len(request.query)})
         result = await handler.search_comprehensive(
             query=request.query,
             region_code=request.region_code,
             max_price=request.max_price
         )
-        return result
+        return json_response(http_request, result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
 @app.post("/api/search/jobs")
-async def search_jobs(request: JobSearchRequest):
+async def search_jobs(request: JobSearchRequest, http_request: Request):
     """일자리 검색 - 기존 방식 (AI 없음)"""
     filters = {}
     if request.job_field:
@@ -79,53 +162,99 @@ async def search_jobs(request: JobSearchRequest):
     if request.education:
         filters["acbgCondLst"] = request.education
     
-    try:
-        print(f"💼 [DEBUG] Jobs API 호출: {request.region_code}")
-        result = await handler.search_jobs_only(
+    async def produce():
+        logger.debug("일자리 검색 요청", extra={"region_code": request.region_code, "view": request.view})
+        return await handler.search_jobs_only(
             region_code=request.region_code,
-            filters=filters
+            filters=filters,
+            view=request.view,
+            fields=request.fields
         )
-        return result
+
+    try:
+        # 📦 같은 요청이면 직렬화된 응답 재사용
+        return await cached_json_response(http_request, response_cache_key("jobs", request), produce)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
 @app.post("/api/search/realestate")
-async def search_realestate(request: RealestateSearchRequest):
+async def search_realestate(request: RealestateSearchRequest, http_request: Request):
     """부동산 검색 - 기존 방식 (AI 없음)"""
-    try:
-        print(f"🏠 [DEBUG] Realestate API 호출: {request.region_code}")
-        result = await handler.search_realestate_only(
+    async def produce():
+        logger.debug("부동산 검색 요청", extra={"region_code": request.region_code, "deal_ymd": request.deal_ymd})
+        return await handler.search_realestate_only(
             region_code=request.region_code,
             deal_ymd=request.deal_ymd,
             max_price=request.max_price
         )
-        return result
+
+    try:
+        return await cached_json_response(http_request, response_cache_key("realestate", request), produce)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
 @app.post("/api/search/policies")
-async def search_policies(request: PolicySearchRequest):
+async def search_policies(request: PolicySearchRequest, http_request: Request):
     """정책 검색 - AI 적용 🤖"""
-    try:
-        print(f"🤖 [DEBUG] Policies API 호출 (AI 모드)")
-        print(f"📍 [DEBUG] region_code: {request.region_code}")
-        print(f"🔑 [DEBUG] keywords: {request.keywords}")
-        print(f"💬 [DEBUG] user_query: {request.user_query}")
-        
+    async def produce():
+        logger.debug("정책 검색 요청", extra={"region_code": request.region_code, "keywords": request.keywords,
+                                         "has_user_query": bool(request.user_query), "defer_ai": request.defer_ai})
+
         # ⭐ AI 분석을 위한 user_query 전달
         result = await handler.search_policies_only(
             region_code=request.region_code,
             keywords=request.keywords,
-            user_query=request.user_query  # AI 분석용
+            user_query=request.user_query,  # AI 분석용
+            defer_ai=request.defer_ai,
+            view=request.view,
+            fields=request.fields
         )
-        
-        print(f"🤖 [DEBUG] AI 분석 결과 포함: {bool(result.get('ai_analysis'))}")
-        
+
+        logger.debug("정책 검색 완료", extra={"ai_analysis": bool(result.get("ai_analysis")),
+                                         "analysis_id": result.get("analysis_id")})
         return result
+
+    try:
+        # 📦 지연 AI 분석(analysis_id)도 함께 재사용 - 작업 저장소는 캐시 TTL 동안 작업을 지우지 않음
+        return await cached_json_response(http_request, response_cache_key("policies", request), produce)
     except Exception as e:
-        print(f"❌ [DEBUG] Policies API 오류: {str(e)}")
+        logger.exception("정책 검색 오류")
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
+@app.post("/api/search/policies/stream")
+async def stream_policies(request: PolicySearchRequest):
+    """정책 검색 - Server-Sent Events 스트리밍 🤖 (목록 먼저, AI 추천은 토큰 도착 순으로)"""
+    logger.debug("정책 스트리밍 요청", extra={"region_code": request.region_code,
+                                        "has_user_query": bool(request.user_query)})
+
+    async def event_stream():
+        try:
+            async for event, data in handler.stream_policies(
+                region_code=request.region_code,
+                keywords=request.keywords,
+                user_query=request.user_query,
+                view=request.view,
+                fields=request.fields
+            ):
+                yield f"event: {event}\ndata: {dumps(data).decode('utf-8')}\n\n"
+        except Exception as e:
+            logger.exception("정책 스트리밍 오류")
+            yield f"event: error\ndata: {json.dumps({'detail': f'서버 오류: {str(e)}'}, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/api/search/policies/analysis/{analysis_id}")
+async def get_policy_analysis(analysis_id: str, http_request: Request, wait: float = 0):
+    """지연된 정책 AI 분석 조회 - status가 done이 될 때까지 폴링 (wait초 롱폴링 지원)"""
+    result = await handler.get_policy_analysis(analysis_id, wait=min(max(wait, 0), 25))
+    if not result.get("success"):
+        raise HTTPException(status_code=404, detail=result.get("error"))
+    return json_response(http_request, result)
+
 @app.get("/api/health")
 async def health_check():
     """서버 상태 확인"""
@@ -144,12 +273,25 @@ async def health_check():
             "44790": "청양군",
             "51150": "강릉시",
             "52210": "김제시"
-        }
+        },
+        # 🔌 공공 API 호스트별 차단기 상태 (closed / half_open / open)
+        "upstreams": _upstream_breaker_states()
     }
 
+
+def _upstream_breaker_states() -> Dict[str, Any]:
+    """공공 API 모듈이 아직 로드되지 않았으면(호출 전) 빈 목록 - 헬스 체크 때문에 httpx 등을 미리 불러오지 않음"""
+    upstream = sys.modules.get("src.upstream")
+    return upstream.breaker_states() if upstream else {}
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """📈 Prometheus 수집용 지표 (요청/공공 API/캐시/AI)"""
+    return Response(content=metrics.render(), media_type=metrics.CONTENT_TYPE)
+
 @app.get("/api/regions")
-async def get_supported_regions():
-    return {
+async def get_supported_regions(http_request: Request):
+    return json_response(http_request, {
         "regions": {
             "51770": "정선군",
             "51750": "영월군",
@@ -157,11 +299,11 @@ async def get_supported_regions():
             "51150": "강릉시",
             "52210": "김제시"
         }
-    }
+    }, headers=STATIC_CACHE_CONTROL)
 
 @app.get("/api/job-fields")
-async def get_job_fields():
-    return {
+async def get_job_fields(http_request: Request):
+    return json_response(http_request, {
         "job_fields": {
             "R600020": "정보통신",
             "R600006": "보건.의료",
@@ -170,7 +312,7 @@ async def get_job_fields():
             "R600014": "건설",
             "R600025": "연구"
         }
-    }
+    }, headers=STATIC_CACHE_CONTROL)
 
 @app.get("/api/ai-status")
 async def get_ai_status():
@@ -179,6 +321,12 @@ async def get_ai_status():
         "ai_enabled_services": ["policies"],
         "ai_disabled_services": ["jobs", "realestate", "comprehensive"],
         "openai_configured": bool(os.getenv("OPENAI_API_KEY")),
+        "ai_providers": {
+            request_class: handler.orchestrator.youth_policy_server.provider_name_for(request_class)
+            for request_class in handler.orchestrator.youth_policy_server.REQUEST_CLASSES
+        },
+        # 정책 분석 프롬프트 크기 누적 (프로세스 시작 이후)
+        "prompts": prompt_stats(),
         "message": "정책 검색에만 AI 분석이 적용됩니다."
     }
 
@@ -0,0 +1,233 @@
+# ai_providers.py — AI 백엔드 추상화 (OpenAI / 로컬 대체 백엔드)
+import abc
+import asyncio
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import threading
+from typing import Any, AsyncIterator, Dict, Optional
+
+try:
+    from .logging_setup import get_logger
+    from .metrics import record_ai_tokens
+except ImportError:
+    from logging_setup import get_logger
+    from metrics import record_ai_tokens
+
+logger = get_logger("ai")
+
+# 🤖 AI 라이브러리 (선택 의존성) - 설치 여부만 확인하고 실제 import는 OpenAIProvider 생성 시점에
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+
+# 요청 분류 - 분류별로 다른 백엔드를 지정할 수 있음 (AI_PROVIDER_<분류>)
+REQUEST_CLASSES = ("analysis", "insights", "stream")
+
+
+class AIProvider(abc.ABC):
+    """
+    정책 분석/인사이트 함수가 사용하는 AI 백엔드 인터페이스.
+    - task: 요청 분류 ("analysis", "insights", "stream")
+    - prompt: 실제 LLM에 보낼 프롬프트
+    - context: 프롬프트를 만든 구조화 데이터 (로컬 백엔드가 규칙 기반 응답에 사용)
+    응답은 항상 JSON 문자열이며 호출 측에서 json.loads 합니다.
+    """
+
+    name = "base"
+
+    @abc.abstractmethod
+    async def complete(self, task: str, prompt: str, context: Dict[str, Any], *,
+                       temperature: float = 0.5, max_tokens: int = 600, timeout: float = 25) -> str:
+        """프롬프트 하나에 대한 전체 응답(JSON 문자열)"""
+
+    async def stream(self, task: str, prompt: str, context: Dict[str, Any], *,
+                     temperature: float = 0.5, max_tokens: int = 600, timeout: float = 25) -> AsyncIterator[str]:
+        # 기본 구현: 전체 응답을 한 번에 전달
+        yield await self.complete(task, prompt, context, temperature=temperature,
+                                  max_tokens=max_tokens, timeout=timeout)
+
+
+class OpenAIProvider(AIProvider):
+    """OpenAI Chat Completions 백엔드"""
+
+    name = "openai"
+
+    def __init__(self, api_key: str, model: Optional[str] = None, timeout: float = 30.0):
+        from openai import AsyncOpenAI
+        self.model = model or os.getenv("OPENAI_MODEL") or "gpt-3.5-turbo"
+        self.client = AsyncOpenAI(api_key=api_key, timeout=timeout)
+
+    async def complete(self, task, prompt, context, *, temperature=0.5, max_tokens=600, timeout=25) -> str:
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=timeout
+        )
+        self._record_usage(task, response.usage)
+        return response.choices[0].message.content
+
+    async def stream(self, task, prompt, context, *, temperature=0.5, max_tokens=600, timeout=25):
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            stream=True,
+            stream_options={"include_usage": True}  # 마지막 청크에 토큰 사용량 포함
+        )
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if getattr(chunk, "usage", None):
+                    self._record_usage(task, chunk.usage)
+        finally:
+            # 중간에 닫히거나 취소돼도 HTTP 응답을 바로 반환
+            await stream.close()
+
+    def _record_usage(self, task: str, usage):
+        if usage is not None:
+            record_ai_tokens(self.name, task, usage.prompt_tokens, usage.completion_tokens)
+
+
+class LocalStandInProvider(AIProvider):
+    """
+    오프라인 벤치마크/부하 테스트용 결정적(deterministic) 로컬 백엔드.
+    - 기본: context 기반 규칙 응답 (같은 입력 → 항상 같은 출력)
+    - AI_STANDIN_FIXTURES: {"<task>:<prompt sha1>" 또는 "<task>": 응답 JSON} 파일을 재생
+    - AI_STANDIN_LATENCY_MS: 응답 지연, AI_STANDIN_CHUNK_MS: 스트리밍 청크 간 지연
+    """
+
+    name = "local"
+
+    def __init__(self, latency_ms: float = 0, chunk_ms: float = 0, chunk_size: int = 8,
+                 fixtures_path: Optional[str] = None):
+        self.latency_ms = latency_ms
+        self.chunk_ms = chunk_ms
+        self.chunk_size = chunk_size
+        self.fixtures: Dict[str, Any] = {}
+        if fixtures_path:
+            with open(fixtures_path, encoding="utf-8") as f:
+                self.fixtures = json.load(f)
+
+    @staticmethod
+    def prompt_key(task: str, prompt: str) -> str:
+        return f"{task}:{hashlib.sha1(prompt.encode('utf-8')).hexdigest()}"
+
+    async def complete(self, task, prompt, context, *, temperature=0.5, max_tokens=600, timeout=25) -> str:
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        return self._respond(task, prompt, context)
+
+    async def stream(self, task, prompt, context, *, temperature=0.5, max_tokens=600, timeout=25):
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        text = self._respond(task, prompt, context)
+        for i in range(0, len(text), self.chunk_size):
+            if self.chunk_ms:
+                await asyncio.sleep(self.chunk_ms / 1000)
+            yield text[i:i + self.chunk_size]
+
+    def _respond(self, task: str, prompt: str, context: Dict[str, Any]) -> str:
+        fixture = self.fixtures.get(self.prompt_key(task, prompt), self.fixtures.get(task))
+        if fixture is not None:
+            return fixture if isinstance(fixture, str) else json.dumps(fixture, ensure_ascii=False)
+        if task == "insights":
+            return json.dumps(self._rule_insights(context), ensure_ascii=False)
+        return json.dumps(self._rule_analysis(context), ensure_ascii=False)
+
+    @staticmethod
+    def _rule_analysis(context: Dict[str, Any]) -> Dict[str, Any]:
+        """질문 단어와 정책 요약의 겹침 수로 추천 순위 결정"""
+        region_name = context.get("region_name", "해당 지역")
+        query_terms = {t for t in re.split(r"\W+", context.get("user_query") or "") if len(t) >= 2}
+        summaries = context.get("policy_summaries") or []
+
+        scored = []
+        for index, summary in enumerate(summaries):
+            text = " ".join(str(v) for v in summary.values())
+            matched = sorted(t for t in query_terms if t in text)
+            scored.append((-len(matched), index, summary, matched))
+        scored.sort(key=lambda x: (x[0], x[1]))
+
+        recommendations = []
+        for rank, (_, _, summary, matched) in enumerate(scored[:3], 1):
+            reason = f"질문의 '{', '.join(matched)}'와(과) 관련된 정책입니다" if matched \
+                else f"{region_name} 지역에서 신청 가능한 정책입니다"
+            recommendations.append({
+                "정책명": summary.get("이름", ""),
+                "추천_이유": reason,
+                "우선순위": rank,
+                "예상_혜택": (summary.get("지원내용") or summary.get("분야") or "지역 특화 지원")[:50]
+            })
+        return {
+            "맞춤_추천": recommendations,
+            "종합_분석": f"{region_name} 지역 정책 {len(summaries)}개 중 {len(recommendations)}개를 추천합니다.",
+            "주의사항": "신청 기간과 자격 요건을 반드시 확인하세요.",
+            "다음_단계": "추천 정책의 상세 페이지에서 신청 방법을 확인하세요."
+        }
+
+    @staticmethod
+    def _rule_insights(context: Dict[str, Any]) -> Dict[str, Any]:
+        region_name = context.get("region_name", "해당 지역")
+        total = context.get("total_count", 0)
+        categories = context.get("categories") or {}
+        top_category = max(categories.items(), key=lambda x: (x[1], x[0]))[0] if categories else "기타"
+        return {
+            "지역_특징": f"{region_name}은(는) {top_category} 분야 정책 비중이 높습니다",
+            "강점": f"{top_category} 분야 지원",
+            "개선점": "분야별 정책 다양화 필요",
+            "추천_전략": f"{top_category} 정책부터 확인",
+            "시장_점수": min(10, 5 + total // 10),
+            "한줄_요약": f"총 {total}개 정책으로 지원 가능"
+        }
+
+
+# 🔧 백엔드 선택: AI_PROVIDER_<분류> → AI_PROVIDER → (OPENAI_API_KEY 있으면 openai)
+_providers: Dict[str, Optional[AIProvider]] = {}
+_providers_lock = threading.Lock()
+
+
+def _build_provider(name: str) -> Optional[AIProvider]:
+    if name == "local":
+        return LocalStandInProvider(
+            latency_ms=float(os.getenv("AI_STANDIN_LATENCY_MS") or 0),
+            chunk_ms=float(os.getenv("AI_STANDIN_CHUNK_MS") or 0),
+            fixtures_path=os.getenv("AI_STANDIN_FIXTURES") or None
+        )
+    if name == "openai":
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not (OPENAI_AVAILABLE and api_key):
+            logger.warning("OpenAI 백엔드를 사용할 수 없습니다 (패키지 또는 OPENAI_API_KEY 없음)")
+            return None
+        try:
+            provider = OpenAIProvider(api_key=api_key)
+            logger.info("AI 분석 모드 활성화", extra={"provider": "openai", "model": provider.model})
+            return provider
+        except Exception as e:
+            logger.warning("AI 초기화 실패: %s", e)
+            return None
+    if name not in ("", "none", "off"):
+        logger.warning("알 수 없는 AI_PROVIDER: %s", name)
+    return None
+
+
+def provider_name_for(request_class: str) -> str:
+    """요청 분류에 설정된 백엔드 이름"""
+    name = os.getenv(f"AI_PROVIDER_{request_class.upper()}") or os.getenv("AI_PROVIDER")
+    if not name:
+        name = "openai" if os.getenv("OPENAI_API_KEY") else "none"
+    return name.strip().lower()
+
+
+def get_ai_provider(request_class: str = "analysis") -> Optional[AIProvider]:
+    """요청 분류별 AI 백엔드 (없으면 None → 호출 측에서 AI 비활성화로 처리)"""
+    name = provider_name_for(request_class)
+    with _providers_lock:
+        if name not in _providers:
+            _providers[name] = _build_provider(name)
+        return _providers[name]
@@ -0,0 +1,67 @@
+# analysis_jobs.py — AI 분석 백그라운드 작업 저장소 (analysis_id → Future)
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple
+
+from .responses import RESPONSE_CACHE_TTL
+
+
+class AnalysisJobStore:
+    """
+    정책 목록 응답과 분리된 AI 분석 작업을 보관합니다.
+    - submit(): 실행 중인 Future를 등록하고 analysis_id 발급
+    - get(): analysis_id로 Future 조회 (만료/없음이면 None)
+    오래된 작업은 ttl_seconds 또는 max_jobs 기준으로 정리됩니다.
+    단, min_age_seconds보다 어린 작업은 max_jobs를 넘어도 지우지 않음 (캐시된 응답이 가리키는 analysis_id 보호)
+    """
+
+    def __init__(self, ttl_seconds: float = 600, max_jobs: int = 1000, min_age_seconds: float = 0):
+        self.ttl_seconds = ttl_seconds
+        self.max_jobs = max_jobs
+        self.min_age_seconds = min_age_seconds
+        self._jobs: "OrderedDict[str, Tuple[float, Future]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, future: Future) -> str:
+        analysis_id = uuid.uuid4().hex
+        with self._lock:
+            self._prune(time.monotonic())
+            self._jobs[analysis_id] = (time.monotonic(), future)
+        return analysis_id
+
+    def get(self, analysis_id: str) -> Optional[Future]:
+        with self._lock:
+            self._prune(time.monotonic())
+            entry = self._jobs.get(analysis_id)
+        return entry[1] if entry else None
+
+    def _prune(self, now: float):
+        # 등록 순서 = 생성 순서이므로 앞에서부터 만료된 것만 제거
+        while self._jobs:
+            job_id, (created, future) = next(iter(self._jobs.items()))
+            age = now - created
+            if age <= self.ttl_seconds and (len(self._jobs) < self.max_jobs or age <= self.min_age_seconds):
+                break
+            self._jobs.pop(job_id)
+            if not future.done():
+                future.cancel()
+
+    @staticmethod
+    def describe(future: Future) -> Dict[str, Any]:
+        """Future 상태를 API 응답용 dict로 변환"""
+        if not future.done():
+            return {"status": "pending"}
+        if future.cancelled():
+            return {"status": "error", "error": "AI 분석이 취소되었습니다."}
+        error = future.exception()
+        if error is not None:
+            return {"status": "error", "error": str(error)}
+        return {"status": "done", "result": future.result()}
+
+
+# 정책 AI 분석 작업 저장소 (프로세스 단위 공유)
+# /api/search/policies 응답 캐시에 analysis_id가 함께 저장되므로 그 TTL 동안은 개수 제한으로 지우지 않음
+policy_analysis_jobs = AnalysisJobStore(min_age_seconds=RESPONSE_CACHE_TTL)
@@ -0,0 +1,63 @@
+# bootstrap.py — 시작 비용 절감용 헬퍼 (.env 1회 로드, FastMCP 지연 생성)
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+
+_env_loaded = False
+_env_lock = threading.Lock()
+
+
+def load_env_once():
+    """.env를 프로세스당 한 번만 로드 (서버 모듈마다 반복 호출하던 load_dotenv 대체)"""
+    global _env_loaded
+    with _env_lock:
+        if not _env_loaded:
+            from dotenv import load_dotenv
+            load_dotenv()
+            _env_loaded = True
+
+
+class LazyFastMCP:
+    """
+    FastMCP 대체 래퍼 - @mcp.tool()로 등록한 함수는 그대로 반환하고,
+    실제 FastMCP 인스턴스(mcp 패키지 import 포함)는 run() 등 처음 필요할 때 생성합니다.
+    웹 API처럼 도구 함수만 직접 호출하는 경우에는 mcp 패키지를 아예 불러오지 않습니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._tools: List[Tuple[Callable, dict]] = []
+        self._server: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def tool(self, **kwargs):
+        def decorator(fn: Callable) -> Callable:
+            with self._lock:
+                self._tools.append((fn, kwargs))
+                if self._server is not None:
+                    self._server.add_tool(fn, **kwargs)
+            return fn
+        return decorator
+
+    def tool_names(self) -> List[str]:
+        """등록된 도구 이름 (FastMCP 생성 없이 조회)"""
+        return [kwargs.get("name") or fn.__name__ for fn, kwargs in self._tools]
+
+    @property
+    def server(self):
+        with self._lock:
+            if self._server is None:
+                from mcp.server.fastmcp import FastMCP
+                server = FastMCP(self.name)
+                for fn, kwargs in self._tools:
+                    server.add_tool(fn, **kwargs)
+                self._server = server
+            return self._server
+
+    def run(self, *args, **kwargs):
+        return self.server.run(*args, **kwargs)
+
+    def __getattr__(self, item):
+        # 그 밖의 FastMCP 속성 접근은 실제 인스턴스로 위임
+        if item.startswith("__"):
+            raise AttributeError(item)
+        return getattr(self.server, item)
@@ -0,0 +1,98 @@
+# cache.py — 프로세스 내 TTL 캐시 (스레드 안전 + 동일 키 동시 로드 1회 + 적중률 통계)
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    만료 시간(ttl_seconds)과 최대 크기(maxsize, LRU)를 가진 캐시.
+    get_or_load()는 같은 키에 대한 동시 요청이 있어도 loader를 한 번만 실행합니다.
+    생성 시 이름으로 CACHES에 등록되어 통계를 한곳에서 조회할 수 있습니다.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float, maxsize: int = 256):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "loads": 0}
+        CACHES[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._get_locked(key)
+        return default if value is _MISSING else value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any],
+                    cache_if: Optional[Callable[[Any], bool]] = None) -> Any:
+        """캐시에 있으면 반환, 없으면 loader() 결과를 저장 후 반환 (cache_if가 False면 저장 안 함)"""
+        with self._lock:
+            value = self._get_locked(key)
+            if value is not _MISSING:
+                return value
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # 먼저 로드한 요청이 채워 놓았으면 그대로 사용
+            with self._lock:
+                value = self._peek_locked(key)
+            if value is not _MISSING:
+                return value
+            value = loader()
+            with self._lock:
+                self._stats["loads"] += 1
+            if cache_if is None or cache_if(value):
+                self.set(key, value)
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "size": len(self._data), "maxsize": self.maxsize, "ttl_seconds": self.ttl_seconds}
+
+    def _peek_locked(self, key: Hashable) -> Any:
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return _MISSING
+        return entry[1]
+
+    def _get_locked(self, key: Hashable) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return _MISSING
+        if entry[0] < time.monotonic():
+            del self._data[key]
+            self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+            return _MISSING
+        self._data.move_to_end(key)
+        self._stats["hits"] += 1
+        return entry[1]
+
+
+# 이름 → 캐시 (통계/모니터링용)
+CACHES: Dict[str, TTLCache] = {}
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: cache.stats() for name, cache in CACHES.items()}
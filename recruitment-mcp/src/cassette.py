@@ -0,0 +1,180 @@
+# cassette.py — 공공 API 호출 녹화/재생 (같은 업스트림 데이터와 지연으로 성능 측정을 재현)
+#
+# upstream.try_get을 지나는 모든 호출(채용 call_api / 실거래가 call_molit_api / 청년정책 call_youth_api_enhanced)에 적용됩니다.
+#   record  호출 결과(응답 또는 최종 예외)와 호출자가 기다린 시간을 카세트 파일에 한 줄씩 추가
+#   replay  네트워크 없이 카세트의 응답을 돌려줌 (녹화된 소요 시간 × 배율만큼 기다린 뒤)
+#
+# 카세트: gzip JSONL (줄마다 gzip 멤버로 추가하므로 프로세스가 중간에 죽어도 앞부분은 읽힘)
+# 인증 파라미터(serviceKey/apiKeyNm)는 저장하지 않고, 매칭에도 쓰지 않습니다.
+# 매칭은 URL 경로 + 나머지 파라미터 기준 (호스트 무시 - 실서버 녹화를 대역 서버 설정에서도 재생 가능)
+# 같은 요청이 여러 번 녹화되어 있으면 녹화 순서대로 돌려주고, 다 쓰면 처음부터 반복합니다.
+#
+# 환경변수
+#   UPSTREAM_CASSETTE_MODE         off(기본) | record | replay
+#   UPSTREAM_CASSETTE              카세트 경로 (기본 upstream_cassette.jsonl.gz)
+#   UPSTREAM_REPLAY_TIMING_SCALE   재생 지연 배율 (기본 1 = 녹화 당시 그대로, 0 = 지연 없음, 2 = 두 배 느리게)
+#   UPSTREAM_REPLAY_MISS           카세트에 없는 요청 처리: error(기본) | live (실제로 호출)
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+import httpx
+
+SECRET_PARAMS = frozenset({"serviceKey", "ServiceKey", "apiKeyNm", "authKey"})
+# 재생 응답에 되살릴 헤더 (본문은 이미 압축 해제된 상태로 저장)
+KEPT_HEADERS = ("content-type", "retry-after")
+
+
+class CassetteMiss(LookupError):
+    """재생 모드에서 카세트에 없는 요청"""
+
+
+def public_params(params: Dict[str, Any]) -> Dict[str, str]:
+    return {k: str(v) for k, v in params.items() if k not in SECRET_PARAMS and v is not None}
+
+
+def request_key(url: str, params: Dict[str, Any]) -> str:
+    """매칭 키: 경로?정렬된 파라미터 (인증 파라미터 제외)"""
+    return f"{urlsplit(url).path}?{urlencode(sorted(public_params(params).items()))}"
+
+
+class Cassette:
+    def __init__(self, mode: str = "off", path: str = "upstream_cassette.jsonl.gz",
+                 timing_scale: float = 1.0, on_miss: str = "error"):
+        self.mode = mode if mode in ("record", "replay") else "off"
+        self.path = path
+        self.timing_scale = timing_scale
+        self.on_miss = on_miss
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, List[Dict]]] = None
+        self._positions: Dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls) -> "Cassette":
+        return cls(
+            mode=(os.getenv("UPSTREAM_CASSETTE_MODE") or "off").strip().lower(),
+            path=os.getenv("UPSTREAM_CASSETTE") or "upstream_cassette.jsonl.gz",
+            timing_scale=float(os.getenv("UPSTREAM_REPLAY_TIMING_SCALE") or 1),
+            on_miss=(os.getenv("UPSTREAM_REPLAY_MISS") or "error").strip().lower(),
+        )
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    # === 녹화 ===
+    def record(self, url: str, params: Dict[str, Any], elapsed: float, mode: Optional[str] = None,
+               resp: Optional[httpx.Response] = None, error: Optional[Exception] = None):
+        entry: Dict[str, Any] = {
+            "key": request_key(url, params),
+            "url": f"{urlsplit(url).scheme}://{urlsplit(url).netloc}{urlsplit(url).path}",
+            "params": public_params(params),
+            "elapsed_ms": round(elapsed * 1000, 2),
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        if resp is not None:
+            entry.update(mode=mode, status=resp.status_code,
+                         headers={k: resp.headers[k] for k in KEPT_HEADERS if k in resp.headers})
+            try:
+                entry["body"] = resp.content.decode("utf-8")
+            except UnicodeDecodeError:
+                entry["body_b64"] = base64.b64encode(resp.content).decode("ascii")
+        else:
+            entry.update(error=type(error).__name__, message=str(error))
+        line = (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            with open(self.path, "ab") as f:
+                f.write(gzip.compress(line))
+
+    # === 재생 ===
+    def _load(self) -> Dict[str, List[Dict]]:
+        if self._entries is None:
+            entries: Dict[str, List[Dict]] = {}
+            if os.path.exists(self.path):
+                with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            entry = json.loads(line)
+                            entries.setdefault(entry["key"], []).append(entry)
+            self._entries = entries
+        return self._entries
+
+    def next_entry(self, url: str, params: Dict[str, Any]) -> Optional[Dict]:
+        key = request_key(url, params)
+        with self._lock:
+            candidates = self._load().get(key)
+            if not candidates:
+                return None
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        return candidates[position % len(candidates)]
+
+    def replay(self, url: str, params: Dict[str, Any]) -> Optional[Tuple[str, httpx.Response]]:
+        """
+        녹화된 응답을 (mode, response)로 반환 - 녹화된 예외는 같은 종류로 다시 던짐.
+        카세트에 없으면 on_miss=live일 때 None(실제 호출), 아니면 CassetteMiss.
+        """
+        entry = self.next_entry(url, params)
+        if entry is None:
+            if self.on_miss == "live":
+                return None
+            raise CassetteMiss(f"카세트에 없는 요청: {request_key(url, params)}")
+
+        delay = entry.get("elapsed_ms", 0) / 1000 * self.timing_scale
+        if delay > 0:
+            time.sleep(delay)
+
+        request = httpx.Request("GET", url, params=params)
+        if "error" in entry:
+            raise _recorded_error(entry, request)
+        content = (base64.b64decode(entry["body_b64"]) if "body_b64" in entry
+                   else entry.get("body", "").encode("utf-8"))
+        resp = httpx.Response(entry["status"], headers=entry.get("headers") or {}, content=content, request=request)
+        return entry.get("mode") or "replay", resp
+
+    def summary(self) -> Dict[str, Any]:
+        entries = self._load() if self.replaying else {}
+        return {"mode": self.mode, "path": self.path, "timing_scale": self.timing_scale,
+                "requests": len(entries), "responses": sum(len(v) for v in entries.values())}
+
+
+def _recorded_error(entry: Dict, request: httpx.Request) -> Exception:
+    """녹화된 예외 이름이 httpx 예외면 같은 클래스로, 아니면 TransportError로 재생"""
+    cls = getattr(httpx, entry["error"], None)
+    message = entry.get("message") or entry["error"]
+    if isinstance(cls, type) and issubclass(cls, httpx.RequestError):
+        return cls(message, request=request)
+    return httpx.TransportError(f"{entry['error']}: {message}", request=request)
+
+
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Cassette:
+    """환경변수 설정으로 만든 프로세스 공용 카세트 (configure()로 교체 가능)"""
+    global _cassette
+    if _cassette is None:
+        with _cassette_lock:
+            if _cassette is None:
+                _cassette = Cassette.from_env()
+    return _cassette
+
+
+def configure(cassette: Optional[Cassette]) -> Cassette:
+    """벤치마크/도구에서 카세트를 직접 지정 (None이면 환경변수 설정으로 되돌림)"""
+    global _cassette
+    with _cassette_lock:
+        _cassette = cassette
+    return get_cassette()
@@ -1,20 +1,37 @@
 # enhanced_orchestrator.py — 청소년정책 포함 확장 오케스트레이터
 import asyncio
+import importlib
 import json
 from typing import Dict, Any, Optional
 
-# 상대 import로 변경
-from . import server
-from . import realestate_server
-from . import youth_policy_server
+from .bootstrap import load_env_once
+from .logging_setup import get_logger
+
+# .env는 서버 모듈 import 전에 한 번만 로드 (final_chatbot 등의 설정값도 .env를 따르도록)
+load_env_once()
+
+logger = get_logger("orchestrator")
+
+
+def _server_module(name: str):
+    # 서버 모듈은 처음 사용할 때 import (웹 워커 기동/--reload 시 불필요한 초기화 방지)
+    return importlib.import_module(f"{__package__}.{name}")
+
 
 class EnhancedOrchestrator:
     """채용정보 + 부동산 + 청소년정책을 통합하는 확장된 오케스트레이터"""
-    
-    def __init__(self):
-        self.recruitment_server = server
-        self.realestate_server = realestate_server
-        self.youth_policy_server = youth_policy_server
+
+    @property
+    def recruitment_server(self):
+        return _server_module("server")
+
+    @property
+    def realestate_server(self):
+        return _server_module("realestate_server")
+
+    @property
+    def youth_policy_server(self):
+        return _server_module("youth_policy_server")
     
     def get_available_tools(self) -> Dict[str, list]:
         """사용 가능한 모든 도구 목록"""
@@ -142,10 +159,9 @@ class EnhancedOrchestrator:
                     "result": self.youth_policy_server.getYouthPolicyDetail(**arguments)
                 }
             elif tool_name == 'searchPoliciesByRegion':
-                user_query = arguments.get('user_query')
-                print(f"🔧 [ORCHESTRATOR-DEBUG] tool_name: {tool_name}")
-                print(f"🔧 [ORCHESTRATOR-DEBUG] arguments: {arguments}")
-                print(f"🔧 [ORCHESTRATOR-DEBUG] user_query 추출: '{user_query}'")
+                # 인자 값(사용자 질문 등)은 남기지 않고 키만 기록
+                logger.debug("도구 호출", extra={"tool": tool_name, "argument_keys": sorted(arguments),
+                                              "has_user_query": bool(arguments.get('user_query'))})
 
                 return {
                     "status": "success",
@@ -196,12 +212,11 @@ class EnhancedOrchestrator:
     
     def comprehensive_region_analysis(self, region_code: str, deal_ymd: str = "202506"):
         """지역 종합 분석 - 채용정보 + 부동산 + 청소년정책"""
-        print(f"🔍 지역 종합 분석 시작: {region_code}")
+        logger.debug("지역 종합 분석 시작", extra={"region_code": region_code})
         
         results = {}
         
         # 1. 채용정보 조회
-        print("  📋 채용정보 조회 중...")
         recruitment_result = self.call_recruitment_tool(
             'listRecruitments',
             {'pageNo': 1, 'numOfRows': 10}
@@ -209,7 +224,6 @@ class EnhancedOrchestrator:
         results['recruitment'] = recruitment_result
         
         # 2. 부동산 아파트 실거래가 조회
-        print("  🏠 아파트 실거래가 조회 중...")
         apt_result = self.call_realestate_tool(
             'getApartmentTrades',
             {
@@ -222,7 +236,6 @@ class EnhancedOrchestrator:
         results['apartment_trades'] = apt_result
         
         # 3. 지역별 청소년정책 조회 (새로 추가!)
-        print("  🎯 지역별 청소년정책 조회 중...")
         policy_result = self.call_youth_policy_tool(
             'searchPoliciesByRegion',
             {
@@ -235,7 +248,6 @@ class EnhancedOrchestrator:
         results['youth_policies'] = policy_result
         
         # 4. 청년 특화 정책 검색
-        print("  🚀 청년 특화 정책 검색 중...")
         youth_specific_result = self.call_youth_policy_tool(
             'searchPoliciesByKeywords',
             {
@@ -247,12 +259,12 @@ class EnhancedOrchestrator:
         )
         results['youth_specific_policies'] = youth_specific_result
         
-        print("✅ 지역 종합 분석 완료")
+        logger.debug("지역 종합 분석 완료", extra={"region_code": region_code})
         return results
 
     def analyze_living_feasibility(self, region_code: str, age_group: str = "청년"):
         """거주 타당성 분석 - 일자리, 주거비, 정책 지원 종합"""
-        print(f"📊 {age_group} 거주 타당성 분석: {region_code}")
+        logger.debug("거주 타당성 분석", extra={"region_code": region_code, "age_group": age_group})
         
         results = {}
         
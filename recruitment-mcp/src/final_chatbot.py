@@ -1,16 +1,32 @@
 # perfect_chatbot.py — 완벽한 통합 챗봇 (정책 조회 + 날짜 필터링 + 5개 지역 한정)
 import asyncio
 import json
+import os
 import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 # 확장된 오케스트레이터 import
 from .enhanced_orchestrator import EnhancedOrchestrator
+from .cache import TTLCache
+from .logging_setup import get_logger
+from .projections import precompute_jobs
+from .timing import stage
+
+logger = get_logger("chatbot")
+
+# 🌐 전국 채용정보 공통 조회 설정 - 지역과 무관하게 한 번 받아서 지역별로 나눠 사용
+RECRUITMENT_NATIONAL_ROWS = int(os.getenv("RECRUITMENT_NATIONAL_ROWS") or 100)
+RECRUITMENT_NATIONAL_PAGES = int(os.getenv("RECRUITMENT_NATIONAL_PAGES") or 1)
+RECRUITMENT_REFRESH_SECONDS = float(os.getenv("RECRUITMENT_REFRESH_SECONDS") or 300)
+
+# 필터 조합 → {"jobs": 전국 목록, "by_region": {지역코드: 지역 필터링 결과}} (프로세스 단위 공유)
+_national_job_cache = TTLCache("recruitment_national_pages", ttl_seconds=RECRUITMENT_REFRESH_SECONDS, maxsize=64)
 
 class PerfectChatbot:
-    def __init__(self):
-        self.orchestrator = EnhancedOrchestrator()
+    def __init__(self, orchestrator: Optional[EnhancedOrchestrator] = None):
+        # 웹 API에서는 WebAPIHandler의 오케스트레이터를 공유
+        self.orchestrator = orchestrator or EnhancedOrchestrator()
 
         # ✅ 이 챗봇은 아래 5개 지역만 지원합니다.
         # 정선군(51770), 영월군(51750), 청양군(44790), 강릉시(51150), 김제시(52210)
@@ -541,6 +557,63 @@ class PerfectChatbot:
         return []
 
 
+    def get_national_job_views(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        전국 채용정보 페이지 묶음을 갱신 주기당 한 번만 조회하고, 지원 지역별 결과를 미리 나눠 둠.
+        - 캐시 키는 지역과 무관한 필터 조합뿐이므로 지역 전환 시 추가 API 호출 없음
+        """
+        filters = {k: v for k, v in (filters or {}).items() if v}
+        cache_key = tuple(sorted(filters.items()))
+
+        def load():
+            jobs: List[Dict] = []
+            for page_no in range(1, RECRUITMENT_NATIONAL_PAGES + 1):
+                job_result = self.orchestrator.call_recruitment_tool(
+                    'listRecruitments',
+                    {'pageNo': page_no, 'numOfRows': RECRUITMENT_NATIONAL_ROWS, 'filters': dict(filters)}
+                )
+                api_result = job_result.get("result") or {}
+                if job_result["status"] != "success" or api_result.get("status") == "error":
+                    if page_no == 1:
+                        return {"status": "error",
+                                "message": job_result.get("message") or api_result.get("message", "알 수 없는 오류")}
+                    break
+                page_jobs = api_result.get("data", {}).get("result", []) or []
+                jobs.extend(page_jobs)
+                if len(page_jobs) < RECRUITMENT_NATIONAL_ROWS:
+                    break
+
+            # 직무분야는 API 필터와 별도로 한 번 더 확인 (API가 무시하는 경우 대비)
+            if "ncsCdLst" in filters:
+                requested_code = filters["ncsCdLst"]
+                jobs = [job for job in jobs if requested_code in job.get("ncsCdLst", "")]
+
+            # 표시용 필드는 적재 시 한 번만 계산 (모든 지역·요청에서 재사용)
+            with stage("projection"):
+                projections = precompute_jobs(jobs)
+            with stage("region_filter"):
+                by_region = {code: self.filter_and_sort_jobs_by_region(jobs, code)
+                             for code in self.allowed_regions_code_to_name}
+            return {
+                "status": "success",
+                "jobs": jobs,
+                "by_region": by_region,
+                "projections": projections
+            }
+
+        # 실패 결과는 캐시하지 않음 (다음 요청에서 다시 시도)
+        return _national_job_cache.get_or_load(cache_key, load, cache_if=lambda v: v["status"] == "success")
+
+    def get_region_jobs(self, region_code: str, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """지역별 채용정보 (도시 우선 → 광역) - 전국 공통 조회 결과에서 꺼내옴"""
+        if region_code in self.allowed_regions_name_to_code:
+            region_code = self.allowed_regions_name_to_code[region_code]
+        views = self.get_national_job_views(filters)
+        if views["status"] != "success":
+            return {"status": "error", "message": views["message"], "jobs": []}
+        return {"status": "success", "jobs": list(views["by_region"].get(region_code, [])),
+                "projections": views["projections"]}
+
     def filter_and_sort_policies_by_region(self, policies: List[Dict], target_region_code: str) -> List[Dict]:
         """청년정책 지역 관련성 정렬 (5개 지역 전용)"""
         region_mapping = {
@@ -591,18 +664,13 @@ class PerfectChatbot:
             # 1) 채용정보
             if intent["search_jobs"]:
                 print("📋 채용정보 검색 중...")
-                job_result = self.orchestrator.call_recruitment_tool(
-                    'listRecruitments',
-                    {
-                        'pageNo': 1,
-                        'numOfRows': 100,
-                        'filters': {**intent.get("filters", {}),
-                                    **({} if self.state["job_field"] is None else {"ncsCdLst": self.state["job_field"]})}
-                    }
+                job_result = self.get_region_jobs(
+                    region_code,
+                    {**intent.get("filters", {}),
+                     **({} if self.state["job_field"] is None else {"ncsCdLst": self.state["job_field"]})}
                 )
                 if job_result["status"] == "success":
-                    job_data = job_result["result"].get("data", {}).get("result", [])
-                    job_data = self.filter_and_sort_jobs_by_region(job_data, region_code)
+                    job_data = job_result["jobs"]
                     results.append(self.format_job_results(job_data, limit=5, region_name=region_name))
                 else:
                     results.append(f"📋 채용정보 검색 실패: {job_result.get('message', '알 수 없는 오류')}")
@@ -684,7 +752,7 @@ class PerfectChatbot:
                 apt_list.append(apt_data)
             return apt_list
         except Exception as e:
-            print(f"XML 파싱 오류: {e}")
+            logger.warning("실거래가 XML 파싱 오류: %s", e)
             return []
 
     async def run(self):
@@ -0,0 +1,177 @@
+# logging_setup.py — 구조화 로깅 (큐 기반 비동기 출력 + 모듈별 레벨 + 요청 ID + DEBUG 샘플링)
+#
+# 요청 처리 스레드는 LogRecord를 큐에 넣기만 하고, 포맷/stderr 쓰기는 QueueListener 스레드가 맡습니다.
+# 모든 로거는 "ieum." 아래에 두고(get_logger), 레벨이 꺼진 로그는 isEnabledFor 확인 한 번으로 끝납니다.
+# (MCP 서버를 stdio로 실행할 때 stdout은 프로토콜 채널이므로 로그는 항상 stderr로 출력)
+#
+# 환경변수
+#   LOG_LEVEL              기본 레벨 (기본 INFO)
+#   LOG_LEVELS             모듈별 레벨, 예: "youth_policy=DEBUG,timing=WARNING" (ieum. 이하 이름)
+#   LOG_FORMAT             json(기본) | text
+#   LOG_DEBUG_SAMPLE_RATE  DEBUG 로그를 남길 요청 비율 0~1 (기본 1) - 요청 ID 단위로 결정해 한 요청의 로그는 함께 남음
+#   LOG_QUEUE_SIZE         큐 크기 (기본 10000) - 가득 차면 기다리지 않고 버림 (ieum_log_records_dropped_total)
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import time
+import uuid
+import zlib
+from typing import Any, Awaitable, Optional
+
+try:
+    from .metrics import Counter
+except ImportError:
+    from metrics import Counter
+
+ROOT_LOGGER = "ieum"
+
+LOG_RECORDS_DROPPED = Counter("ieum_log_records_dropped_total", "로그 큐가 가득 차 버린 레코드 수", ("level",))
+
+# LogRecord 기본 속성 - 이 외의 속성은 extra로 넘어온 구조화 필드로 취급
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+_request_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """ieum.<name> 로거 (LOG_LEVELS의 모듈 이름과 같음)"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+# 🆔 요청 ID
+def new_request_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def begin_request(request_id: Optional[str] = None) -> contextvars.Token:
+    """요청 ID 설정 (없으면 새로 생성) - 반환한 토큰으로 end_request() 호출"""
+    return _request_id.set(request_id or new_request_id())
+
+
+def end_request(token: contextvars.Token):
+    _request_id.reset(token)
+
+
+def current_request_id() -> Optional[str]:
+    return _request_id.get()
+
+
+async def with_request_id(request_id: Optional[str], coro: Awaitable[Any]) -> Any:
+    """다른 이벤트 루프(AI 루프 등)에서 실행되는 코루틴에 호출한 요청의 ID를 이어 붙임"""
+    token = _request_id.set(request_id)
+    try:
+        return await coro
+    finally:
+        _request_id.reset(token)
+
+
+class _RequestContextFilter(logging.Filter):
+    """호출 스레드에서 요청 ID를 레코드에 기록 + DEBUG 레코드는 요청 단위로 샘플링"""
+
+    def __init__(self, debug_sample_rate: float = 1.0):
+        super().__init__()
+        self.debug_sample_rate = debug_sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        request_id = _request_id.get()
+        record.request_id = request_id
+        if record.levelno > logging.DEBUG or self.debug_sample_rate >= 1:
+            return True
+        if request_id:
+            return zlib.crc32(request_id.encode()) % 10000 < self.debug_sample_rate * 10000
+        return random.random() < self.debug_sample_rate
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 호출 스레드를 막지 않고 레코드를 버림"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 메시지 포맷은 리스너 스레드에서 (args는 큐에 넣을 때 이미 불변 값이라고 가정)
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc(level=record.levelname)
+
+
+class JSONFormatter(logging.Formatter):
+    """한 줄 JSON - 기본 필드 + extra로 넘긴 구조화 필드"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s [%(request_id)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        if getattr(record, "request_id", None) is None:
+            record.request_id = "-"
+        return super().format(record)
+
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def _parse_levels(spec: str):
+    for part in spec.split(","):
+        name, _, level = part.strip().partition("=")
+        if name and level:
+            yield name.strip().removeprefix(f"{ROOT_LOGGER}."), level.strip().upper()
+
+
+def queued_handler(target: logging.Handler, queue_size: int = 10000) -> logging.Handler:
+    """target 앞에 (가득 차면 버리는) 큐를 두고 리스너 스레드에서 출력 - 종료 시 큐에 남은 레코드까지 출력"""
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    listener = logging.handlers.QueueListener(log_queue, target, respect_handler_level=False)
+    listener.start()
+    atexit.register(listener.stop)
+    return _DroppingQueueHandler(log_queue)
+
+
+def configure_logging(level: Optional[str] = None, fmt: Optional[str] = None):
+    """ieum 로거에 큐 핸들러 연결 (여러 번 호출해도 한 번만 설정)"""
+    global _configured
+    with _configure_lock:
+        if _configured:
+            return
+        root = logging.getLogger(ROOT_LOGGER)
+        root.setLevel((level or os.getenv("LOG_LEVEL") or "INFO").upper())
+        root.propagate = False
+        for name, module_level in _parse_levels(os.getenv("LOG_LEVELS") or ""):
+            get_logger(name).setLevel(module_level)
+
+        output = logging.StreamHandler(sys.stderr)
+        output.setFormatter(JSONFormatter() if (fmt or os.getenv("LOG_FORMAT") or "json") == "json" else TextFormatter())
+
+        handler = queued_handler(output, int(os.getenv("LOG_QUEUE_SIZE") or 10000))
+        handler.addFilter(_RequestContextFilter(float(os.getenv("LOG_DEBUG_SAMPLE_RATE") or 1)))
+        root.addHandler(handler)
+        _configured = True
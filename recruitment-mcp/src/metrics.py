@@ -0,0 +1,223 @@
+# metrics.py — 프로세스 내 지표 수집 + Prometheus 텍스트 형식 출력 (/metrics)
+#
+# 외부 라이브러리 없이 Counter/Gauge/Histogram만 구현합니다.
+# 기록은 잠금 한 번 + dict 갱신(히스토그램은 bisect)이라 부하 중에도 켜 둘 수 있고,
+# 캐시 통계처럼 이미 다른 곳에 있는 값은 수집 시점(scrape)에 collector로 읽어 옵니다.
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from .cache import cache_stats
+except ImportError:
+    from cache import cache_stats
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 지연 시간 버킷 (초) - 내부 처리(ms)부터 느린 공공 API/LLM 호출(수십 초)까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric:
+    """이름/설명/라벨 이름과 라벨 값별 저장소를 가진 지표 (생성 시 REGISTRY에 등록)"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[_LabelValues, object] = {}
+        REGISTRY[name] = self
+
+    def _key(self, labels: Dict[str, object]) -> _LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def expose(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            lines.extend(self._sample_lines(key, value))
+        return lines
+
+    def _sample_lines(self, key: _LabelValues, value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 - 라벨 값별로 [버킷별 개수..., 합계, 개수] 저장"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            entry[index] += 1
+            entry[-2] += value
+            entry[-1] += 1
+
+    def _sample_lines(self, key: _LabelValues, value) -> List[str]:
+        with self._lock:
+            entry = list(value)
+        lines, cumulative = [], 0
+        for bound, count in zip(self.buckets + (float("inf"),), entry):
+            cumulative += count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(round(entry[-2], 6))}")
+        lines.append(f"{self.name}_count{labels} {entry[-1]}")
+        return lines
+
+
+# 이름 → 지표, 수집 시점에 값을 만드는 collector (Prometheus 텍스트 줄 목록 반환)
+REGISTRY: Dict[str, _Metric] = {}
+_collectors: List[Callable[[], Iterable[str]]] = []
+
+
+def register_collector(collector: Callable[[], Iterable[str]]):
+    _collectors.append(collector)
+
+
+def render() -> str:
+    """모든 지표를 Prometheus 텍스트 형식(0.0.4)으로"""
+    lines: List[str] = []
+    for metric in list(REGISTRY.values()):
+        lines.extend(metric.expose())
+    for collector in list(_collectors):
+        lines.extend(collector())
+    return "\n".join(lines) + "\n"
+
+
+# 🌐 HTTP 요청 (라우트 템플릿 단위 - /api/search/policies/analysis/{analysis_id} 처럼 경로 변수는 묶음)
+HTTP_REQUESTS = Counter("ieum_http_requests_total", "HTTP 요청 수", ("method", "route", "status"))
+HTTP_DURATION = Histogram("ieum_http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route"))
+HTTP_IN_FLIGHT = Gauge("ieum_http_requests_in_flight", "처리 중인 HTTP 요청 수")
+
+# 🛰️ 공공 API 호출 (호스트 × TLS 후보 모드 단위, 시도 1회마다 기록)
+UPSTREAM_REQUESTS = Counter("ieum_upstream_requests_total", "공공 API 호출 시도 수 (result: 상태코드 대역, exception, 헤징 경주에서 져서 cancelled)",
+                            ("host", "mode", "result"))
+UPSTREAM_ERRORS = Counter("ieum_upstream_errors_total",
+                          "공공 API 호출 예외 수 (kind: tls / timeout / connection / other)", ("host", "mode", "kind", "error"))
+UPSTREAM_DURATION = Histogram("ieum_upstream_request_duration_seconds", "공공 API 호출 시간", ("host", "mode"))
+UPSTREAM_IN_FLIGHT = Gauge("ieum_upstream_requests_in_flight", "진행 중인 공공 API 호출 수", ("host",))
+UPSTREAM_BREAKER_STATE = Gauge("ieum_upstream_breaker_state", "공공 API 호스트별 차단기 상태 (0 닫힘, 1 반열림, 2 열림)", ("host",))
+UPSTREAM_BREAKER_REJECTED = Counter("ieum_upstream_breaker_rejected_total",
+                                    "차단기가 열려 호출하지 않은 수 (served: stale 마지막 정상 응답 / error 즉시 실패)",
+                                    ("host", "served"))
+UPSTREAM_RETRIES = Counter("ieum_upstream_retries_total", "공공 API 재시도 수 (reason: timeout / connection / 상태코드)",
+                           ("host", "reason"))
+UPSTREAM_RETRIES_SKIPPED = Counter("ieum_upstream_retries_skipped_total",
+                                   "재시도 대상이지만 하지 않은 수 (why: budget / deadline / retry_after / breaker)",
+                                   ("host", "why"))
+UPSTREAM_HEDGES = Counter("ieum_upstream_hedges_total",
+                          "지연 호출의 예비 요청 (outcome: hedge_won / primary_won / both_failed / skipped_budget)",
+                          ("host", "outcome"))
+
+# 🤖 AI 호출
+AI_DURATION = Histogram("ieum_ai_request_duration_seconds", "AI 백엔드 호출 시간", ("provider", "task", "result"))
+AI_TOKENS = Counter("ieum_ai_tokens_total", "AI 백엔드 사용 토큰 수 (kind: prompt/completion)", ("provider", "task", "kind"))
+
+
+@contextmanager
+def ai_call(provider: str, task: str) -> Iterator[None]:
+    """AI 호출 시간 기록 (예외면 result=error, 스트림 중단이면 cancelled)"""
+    started = time.perf_counter()
+    result = "ok"
+    try:
+        yield
+    except GeneratorExit:
+        result = "cancelled"
+        raise
+    except BaseException as e:
+        result = "cancelled" if type(e).__name__ == "CancelledError" else "error"
+        raise
+    finally:
+        AI_DURATION.observe(time.perf_counter() - started, provider=provider, task=task, result=result)
+
+
+def record_ai_tokens(provider: str, task: str, prompt_tokens: Optional[int], completion_tokens: Optional[int]):
+    if prompt_tokens:
+        AI_TOKENS.inc(prompt_tokens, provider=provider, task=task, kind="prompt")
+    if completion_tokens:
+        AI_TOKENS.inc(completion_tokens, provider=provider, task=task, kind="completion")
+
+
+# 📦 캐시 통계 - TTLCache가 이미 세고 있는 값을 수집 시점에 그대로 노출
+_CACHE_COUNTERS = (("hits", "캐시 적중 수"), ("misses", "캐시 미적중 수"), ("evictions", "크기 초과로 제거된 항목 수"),
+                   ("expirations", "만료로 제거된 항목 수"), ("loads", "loader 실행 수"))
+
+
+def _cache_collector() -> List[str]:
+    stats = cache_stats()
+    lines: List[str] = []
+    for field, help_text in _CACHE_COUNTERS:
+        name = f"ieum_cache_{field}_total"
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        lines += [f'{name}{{cache="{_escape(cache)}"}} {values[field]}' for cache, values in stats.items()]
+    for field, help_text in (("size", "현재 항목 수"), ("maxsize", "최대 항목 수")):
+        name = f"ieum_cache_{field}"
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+        lines += [f'{name}{{cache="{_escape(cache)}"}} {values[field]}' for cache, values in stats.items()]
+    return lines
+
+
+register_collector(_cache_collector)
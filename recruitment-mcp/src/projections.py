@@ -0,0 +1,319 @@
+# projections.py — 화면 표시용 필드를 레코드 적재 시 한 번만 계산해 원본 옆에 보관
+#
+# 채용/정책 원본 레코드를 캐시(전국 채용 묶음, 광역 정책 묶음)에 적재할 때 표시용 필드(projection)를
+# 레코드 키(공고번호/정책번호) 기준으로 계산해 같은 캐시 항목에 넣어 두므로, 원본과 함께 만료·갱신되고
+# 요청·지역이 바뀌어도 다시 계산하지 않습니다.
+# 순번(display_number)이나 지역 기준 표시처럼 요청마다 달라지는 값만 렌더링 시점에 붙입니다.
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+POLICY_DETAIL_URL = "https://www.youthcenter.go.kr/youthPolicy/ythPlcyTotalSearch/ythPlcyDetail/{}"
+
+# 🔧 학력 코드 매핑 테이블
+EDUCATION_CODE_MAPPING = {
+    "R7010": "학력무관",
+    "R7020": "고등학교졸업",
+    "R7030": "고등학교졸업 이상",
+    "R7040": "전문대학졸업",
+    "R7050": "대학교졸업",
+    "R7060": "대학원 석사졸업",
+    "R7070": "대학원 박사졸업",
+    "R7080": "기타"
+}
+
+# 🎯 학력 순서 (낮은 순부터)
+EDUCATION_ORDER = {
+    "R7020": 1,  # 고등학교졸업
+    "R7030": 2,  # 고등학교졸업 이상
+    "R7040": 3,  # 전문대학졸업
+    "R7050": 4,  # 대학교졸업
+    "R7060": 5,  # 대학원 석사졸업
+    "R7070": 6,  # 대학원 박사졸업
+    "R7080": 7   # 기타
+}
+
+# 🔧 고용형태 코드 매핑
+HIRE_TYPE_CODE_MAPPING = {
+    "R1010": "정규직",
+    "R1020": "무기계약직",
+    "R1030": "기간제계약직",
+    "R1040": "비정규직",
+    "R1050": "청년인턴(체험형)",
+    "R1060": "청년인턴(채용형)",
+    "R1070": "기타"
+}
+
+# 🎯 고용형태 우선순위
+HIRE_TYPE_PRIORITY = {
+    "R1010": 1,  # 정규직 (최우선)
+    "R1020": 2,  # 무기계약직
+    "R1040": 3,  # 비정규직
+    "R1030": 4,  # 기간제계약직
+    "R1060": 5,  # 청년인턴(채용형)
+    "R1050": 6,  # 청년인턴(체험형)
+    "R1070": 7   # 기타
+}
+
+# 🆕 채용구분 코드 매핑
+RECRUIT_TYPE_CODE_MAPPING = {
+    "R2010": "신입",
+    "R2020": "경력",
+    "R2030": "신입+경력",
+    "R2040": "외국인 전형"
+}
+
+
+def format_education_requirement(code_str: str) -> str:
+    """학력 코드를 한글로 변환 - 학력무관 우선, 3개 이상이면 "X 이상" 범위로 표시"""
+    if not code_str:
+        return "정보 없음"
+
+    codes = [code.strip() for code in code_str.split(',') if code.strip()]
+    if "R7010" in codes:
+        return "학력무관"
+
+    valid_codes = [code for code in codes if code in EDUCATION_ORDER]
+    if not valid_codes:
+        # 매핑되지 않은 코드들
+        return ', '.join([EDUCATION_CODE_MAPPING.get(code, code) for code in codes])
+
+    sorted_codes = sorted(valid_codes, key=lambda x: EDUCATION_ORDER[x])
+    if len(sorted_codes) == 1:
+        return EDUCATION_CODE_MAPPING.get(sorted_codes[0], sorted_codes[0])
+    if len(sorted_codes) >= 3:
+        min_code = sorted_codes[0]
+        return f"{EDUCATION_CODE_MAPPING.get(min_code, min_code)} 이상"
+    return ', '.join(EDUCATION_CODE_MAPPING.get(code, code) for code in sorted_codes)
+
+
+def format_hire_type(code_str: str) -> str:
+    """고용형태 코드를 한글로 변환 - 우선순위 순 최대 2개 + "외 N개" """
+    if not code_str:
+        return "정보 없음"
+
+    codes = [code.strip() for code in code_str.split(',') if code.strip()]
+    valid_codes = [code for code in codes if code in HIRE_TYPE_PRIORITY]
+    sorted_codes = sorted(valid_codes, key=lambda x: HIRE_TYPE_PRIORITY.get(x, 999))
+
+    result = ', '.join(HIRE_TYPE_CODE_MAPPING.get(code, code) for code in sorted_codes[:2])
+    if len(sorted_codes) > 2:
+        result += f" 외 {len(sorted_codes) - 2}개"
+    return result
+
+
+def format_category_display(policy: Dict) -> str:
+    """정책 카테고리 표시 (대분류/중분류 중복 제거)"""
+    large_category = policy.get("lclsfNm", "")  # 대분류
+    medium_category = policy.get("mclsfNm", "")  # 중분류
+
+    if large_category and medium_category:
+        if large_category.strip() == medium_category.strip():
+            return large_category.strip()
+
+        # 콤마로 구분된 값들을 대분류 → 중분류 순으로 중복 없이 합침
+        unique_parts = []
+        for part in large_category.split(',') + medium_category.split(','):
+            part = part.strip()
+            if part and part not in unique_parts:
+                unique_parts.append(part)
+
+        if len(unique_parts) == 1:
+            return unique_parts[0]
+        elif len(unique_parts) > 1:
+            return " > ".join(unique_parts)
+        return large_category or medium_category or "기타"
+
+    single = large_category or medium_category
+    if single:
+        parts = list(dict.fromkeys([part.strip() for part in single.split(',') if part.strip()]))
+        return parts[0] if len(parts) == 1 else ", ".join(parts)
+    return "기타"
+
+
+def format_date(date_str: str) -> str:
+    """YYYYMMDD → YYYY년 MM월 DD일 (final_chatbot.py와 동일)"""
+    if date_str and len(date_str) == 8 and date_str.isdigit():
+        return f"{date_str[:4]}년 {date_str[4:6]}월 {date_str[6:]}일"
+    return date_str
+
+
+def format_apply_period(apply_str: str) -> str:
+    if not apply_str:
+        return ""
+    if " ~ " in apply_str:
+        dates = apply_str.split(" ~ ")
+        if len(dates) == 2:
+            return f"{format_date(dates[0].strip())} ~ {format_date(dates[1].strip())}"
+    return format_date(apply_str)
+
+
+def format_business_period(start: str, end: str) -> str:
+    def valid(value):
+        return bool(value and value.strip() and value != "00000000")
+
+    if start and end:
+        if valid(start) and valid(end):
+            return f"{format_date(start)} ~ {format_date(end)}"
+        return ""
+    if valid(start):
+        return f"{format_date(start)} ~"
+    if valid(end):
+        return f"~ {format_date(end)}"
+    return ""
+
+
+def format_policy_scope(zip_codes: str) -> str:
+    """적용 범위 (final_chatbot.py와 동일)"""
+    if not zip_codes:
+        return "범위미상"
+    region_count = len(zip_codes.split(','))
+    if region_count >= 50:
+        return f"전국 ({region_count}개 지역)"
+    elif region_count > 10:
+        return f"광역 ({region_count}개 지역)"
+    elif region_count > 1:
+        return f"다지역 ({region_count}개 지역)"
+    return "지역특화"
+
+
+def project_job(job: Dict) -> Dict[str, Any]:
+    """채용 레코드의 표시용 필드 (지역·순번과 무관한 값만)"""
+    hire_type = job.get("hireTypeNmLst", "")
+    deadline = job.get("pbancEndYmd", "")
+    education_code = job.get("acbgCondLst", "")
+    formatted_hire_type_detailed = format_hire_type(hire_type)
+    basic_hire_type = hire_type.split(',')[0] if hire_type else ""
+
+    return {
+        "formatted_title": job.get("recrutPbancTtl", "제목 없음"),
+        "formatted_company": job.get("instNm", "기관명 없음"),
+        "formatted_hire_type": hire_type,
+        "formatted_region": None,  # 지역(광역명) 기준 표시 - 렌더링 시 채움 (필드 순서 유지용 자리)
+        "formatted_deadline": f"{deadline[:4]}.{deadline[4:6]}.{deadline[6:]}" if deadline and len(deadline) == 8 else "미정",
+        "formatted_ncs_field": job.get("ncsCdNmLst", ""),
+        "formatted_education": format_education_requirement(education_code),
+        "formatted_hire_type_detailed": formatted_hire_type_detailed if formatted_hire_type_detailed != basic_hire_type else None,
+        "education_code_original": education_code,  # 원본 코드 보존
+        "hire_type_code_original": hire_type,       # 원본 코드 보존
+
+        # 추가 필드들
+        "acbg_cond": education_code,
+        "career_cond": job.get("creerCondLst", ""),
+        "major_field": job.get("mjrfldNmLst", ""),
+        "recruit_count": job.get("rcritNmprCo", ""),
+        "work_type": job.get("workTypeNmLst", ""),
+        "salary_type": job.get("salaryTypeNmLst", ""),
+        "contact_info": job.get("cntctNo", ""),
+        "recruit_start_date": job.get("pbancBgngYmd", ""),
+        "application_method": job.get("aplyMthdNmLst", ""),
+
+        # 🆕 채용구분
+        "recruit_type_code": job.get("recrutSe", ""),
+        "formatted_recruit_type": job.get("recrutSeNm", "") or "미정"
+    }
+
+
+def project_policy(policy: Dict) -> Dict[str, Any]:
+    """정책 레코드의 표시용 필드 (순번과 무관한 값만)"""
+    apply_period = format_apply_period(policy.get("aplyYmd", ""))
+    policy_no = policy.get("plcyNo", "")
+    support_scale = policy.get("sprtSclCnt")
+
+    return {
+        "formatted_explanation": policy.get("plcyExplnCn", "설명 없음"),
+        "category_display": format_category_display(policy),
+        "scope_display": format_policy_scope(policy.get("zipCd", "")),
+        "keywords_display": policy.get("plcyKywdNm", ""),
+        "institution_display": policy.get("sprvsnInstCdNm", ""),
+        "support_content_display": policy.get("plcySprtCn", ""),
+        "business_period_display": format_business_period(policy.get("bizPrdBgngYmd", ""), policy.get("bizPrdEndYmd", "")),
+        "apply_period_display": apply_period or "상시접수",
+        "support_scale_display": f"{support_scale}명" if support_scale and support_scale != "0" else "",
+        "apply_method_display": policy.get("plcyAplyMthdCn", ""),
+        "additional_conditions_display": policy.get("addAplyQlfcCndCn", ""),
+        "participation_target_display": policy.get("ptcpPrpTrgtCn", ""),
+        "detail_url": POLICY_DETAIL_URL.format(policy_no) if policy_no else ""
+    }
+
+
+# 레코드 키 - 캐시 항목의 projections는 이 값 → projection (키가 없는 레코드는 렌더링 시 계산)
+JOB_KEY = "recrutPblntSn"
+POLICY_KEY = "plcyNo"
+
+
+def _project_records(records: Iterable[Dict], key: str, project: Callable[[Dict], Dict]) -> Dict[str, Dict[str, Any]]:
+    return {record[key]: project(record) for record in records if record.get(key)}
+
+
+def _lookup(projections: Optional[Dict[str, Dict[str, Any]]], record: Dict, key: str,
+            project: Callable[[Dict], Dict]) -> Dict[str, Any]:
+    projection = projections.get(record.get(key)) if projections else None
+    return projection if projection is not None else project(record)
+
+
+def precompute_jobs(jobs: Iterable[Dict]) -> Dict[str, Dict[str, Any]]:
+    """캐시에 적재하는 채용 레코드의 표시용 필드 (공고번호 → projection, 캐시 항목에 함께 보관)"""
+    return _project_records(jobs, JOB_KEY, project_job)
+
+
+def precompute_policies(policies: Iterable[Dict]) -> Dict[str, Dict[str, Any]]:
+    """캐시에 적재하는 정책 레코드의 표시용 필드 (정책번호 → projection, 캐시 항목에 함께 보관)"""
+    return _project_records(policies, POLICY_KEY, project_policy)
+
+
+def job_projection(job: Dict, projections: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """채용 레코드의 표시용 필드 (적재 시 계산된 값 재사용, 없으면 계산)"""
+    return _lookup(projections, job, JOB_KEY, project_job)
+
+
+def policy_projection(policy: Dict, projections: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """정책 레코드의 표시용 필드 (적재 시 계산된 값 재사용, 없으면 계산)"""
+    return _lookup(projections, policy, POLICY_KEY, project_policy)
+
+
+# 👁️ 응답 보기(view) - 화면에 필요한 필드만 내려보내 응답 크기/직렬화 시간 절감
+#   card: 목록 카드, detail: 결과 페이지 상세, full: 원본 + 표시용 필드 전체 (기본값, 기존 응답과 동일)
+VIEWS = ("card", "detail", "full")
+
+JOB_VIEW_FIELDS = {
+    "card": (
+        "recrutPblntSn", "display_number", "display_title", "formatted_title", "formatted_company",
+        "formatted_hire_type", "formatted_region", "formatted_deadline", "formatted_recruit_type",
+    ),
+}
+JOB_VIEW_FIELDS["detail"] = JOB_VIEW_FIELDS["card"] + (
+    "instNm", "recrutPbancTtl", "srcUrl", "formatted_ncs_field", "formatted_education",
+    "formatted_hire_type_detailed", "career_cond", "recruit_count", "work_type", "salary_type",
+    "application_method", "contact_info", "recruit_start_date",
+)
+
+POLICY_VIEW_FIELDS = {
+    "card": (
+        "plcyNo", "display_title", "plcyNm", "plcyExplnCn", "sprvsnInstCdNm",
+        "category_display", "apply_period_display", "detail_url",
+    ),
+}
+POLICY_VIEW_FIELDS["detail"] = POLICY_VIEW_FIELDS["card"] + (
+    "lclsfNm", "mclsfNm", "plcyKywdNm", "sprtSclCnt", "scope_display", "support_content_display",
+    "business_period_display", "support_scale_display", "apply_method_display",
+    "additional_conditions_display", "participation_target_display",
+)
+
+
+def view_fields(table: Dict[str, Tuple[str, ...]], view: Optional[str] = None,
+                fields: Optional[Sequence[str]] = None) -> Optional[Tuple[str, ...]]:
+    """내려보낼 필드 목록 (fields가 있으면 우선 - 빈 이름뿐이면 view 사용, None이면 full = 전체)"""
+    names = tuple(name.strip() for name in fields or () if name and name.strip())
+    if names:
+        return names
+    return table.get(view or "full")
+
+
+def pick_fields(fields: Sequence[str], *sources: Dict) -> Dict[str, Any]:
+    """앞쪽 source부터 찾아 fields 순서대로 담은 dict (없는 필드는 생략)"""
+    item = {}
+    for name in fields:
+        for source in sources:
+            if name in source:
+                item[name] = source[name]
+                break
+    return item
@@ -0,0 +1,198 @@
+# prompt_builder.py — AI 프롬프트 구성 (질문 관련도 순위 + 토큰 예산 내 패킹)
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# 🔢 토큰 계산 (tiktoken 선택 의존성 - 없으면 문자 기반 추정)
+# 인코딩 로드는 파일 읽기가 포함되므로 첫 프롬프트 생성 시점까지 미룸
+_ENCODING: Any = None
+_encoding_lock = threading.Lock()
+_encoding_loaded = False
+TOKEN_COUNTER = "estimate"
+
+# ⚙️ 설정
+PROMPT_TOKEN_BUDGET = int(os.getenv("AI_PROMPT_TOKEN_BUDGET") or 700)
+PROMPT_MAX_POLICIES = int(os.getenv("AI_PROMPT_MAX_POLICIES") or 6)
+EXPLANATION_CHARS = 80
+SUPPORT_CHARS = 50
+
+# 순위 계산에 사용하는 필드와 가중치 (정책명/키워드가 설명보다 중요)
+RANK_FIELDS = {"plcyNm": 2.0, "plcyKywdNm": 1.5, "plcyExplnCn": 1.0}
+
+POLICY_ANALYSIS_TEMPLATE = """
+사용자: "{user_query}"
+지역: {region_name}
+정책: {policies_json}
+
+JSON만 답변:
+{{
+    "맞춤_추천": [
+        {{
+            "정책명": "이름",
+            "추천_이유": "간단한 이유",
+            "우선순위": 1,
+            "예상_혜택": "혜택"
+        }}
+    ],
+    "종합_분석": "한 줄 분석",
+    "주의사항": "주요 주의점",
+    "다음_단계": "다음 행동"
+}}
+"""
+
+_WORD_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+
+def _encoding():
+    global _ENCODING, _encoding_loaded, TOKEN_COUNTER
+    if not _encoding_loaded:
+        with _encoding_lock:
+            if not _encoding_loaded:
+                try:
+                    import tiktoken
+                    _ENCODING = tiktoken.get_encoding("cl100k_base")
+                    TOKEN_COUNTER = "tiktoken"
+                except Exception:
+                    _ENCODING = None
+                _encoding_loaded = True
+    return _ENCODING
+
+
+def count_tokens(text: str) -> int:
+    """프롬프트 토큰 수 (tiktoken 측정, 없으면 한글 1자≈1토큰 / 기타 4자≈1토큰 추정)"""
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    hangul = len(_HANGUL_RE.findall(text))
+    return hangul + math.ceil((len(text) - hangul) / 4)
+
+
+def tokenize(text: str) -> List[str]:
+    """순위 계산용 토큰 - 단어 + 한글 2글자 조각 (조사가 붙은 단어도 매칭되도록)"""
+    terms = []
+    for word in _WORD_RE.findall((text or "").lower()):
+        if len(word) >= 2:
+            terms.append(word)
+        if _HANGUL_RE.match(word) and len(word) > 2:
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return terms
+
+
+def rank_policies(query: str, policies: Sequence[Dict], k1: float = 1.5, b: float = 0.75) -> List[Tuple[float, Dict]]:
+    """
+    BM25 방식으로 질문과 정책(plcyNm/plcyExplnCn/plcyKywdNm)의 관련도를 계산해 내림차순 정렬.
+    점수가 같으면 기존 순서(지역 관련성 순)를 유지합니다.
+    """
+    query_terms = set(tokenize(query))
+    if not policies:
+        return []
+    if not query_terms:
+        return [(0.0, p) for p in policies]
+
+    docs = []
+    for policy in policies:
+        tf: Counter = Counter()
+        length = 0.0
+        for field, weight in RANK_FIELDS.items():
+            terms = tokenize(policy.get(field, "") or "")
+            length += len(terms) * weight
+            for term in terms:
+                tf[term] += weight
+        docs.append((tf, length))
+
+    n = len(docs)
+    avg_len = sum(length for _, length in docs) / n or 1.0
+    df = {term: sum(1 for tf, _ in docs if term in tf) for term in query_terms}
+
+    scored = []
+    for index, (policy, (tf, length)) in enumerate(zip(policies, docs)):
+        score = 0.0
+        for term in query_terms:
+            freq = tf.get(term, 0)
+            if not freq:
+                continue
+            idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+            score += idf * freq * (k1 + 1) / (freq + k1 * (1 - b + b * length / avg_len))
+        scored.append((score, index, policy))
+    scored.sort(key=lambda x: (-x[0], x[1]))
+    return [(score, policy) for score, _, policy in scored]
+
+
+def summarize_policy(policy: Dict) -> Dict[str, str]:
+    return {
+        "이름": policy.get("plcyNm", ""),
+        "설명": (policy.get("plcyExplnCn", "") or "")[:EXPLANATION_CHARS],
+        "분야": policy.get("lclsfNm", ""),
+        "지원내용": (policy.get("plcySprtCn", "") or "")[:SUPPORT_CHARS],
+    }
+
+
+def build_policy_analysis_prompt(user_query: str, policies: Sequence[Dict], region_name: str,
+                                 token_budget: Optional[int] = None,
+                                 max_policies: Optional[int] = None) -> Tuple[str, List[Dict], Dict[str, Any]]:
+    """
+    맞춤 분석 프롬프트 생성 - (prompt, 포함된 정책 요약, 프롬프트 지표) 반환
+    1) 질문 관련도 순으로 정책 정렬  2) 토큰 예산 안에 들어가는 만큼 요약을 채움
+    """
+    started = time.perf_counter()
+    token_budget = token_budget or PROMPT_TOKEN_BUDGET
+    max_policies = max_policies or PROMPT_MAX_POLICIES
+
+    def render(summaries: List[Dict]) -> str:
+        return POLICY_ANALYSIS_TEMPLATE.format(
+            user_query=user_query, region_name=region_name,
+            policies_json=json.dumps(summaries, ensure_ascii=False)
+        )
+
+    ranked = rank_policies(user_query, policies)
+    summaries: List[Dict] = []
+    prompt = render(summaries)
+    prompt_tokens = count_tokens(prompt)
+    for _, policy in ranked:
+        if len(summaries) >= max_policies:
+            break
+        candidate = render(summaries + [summarize_policy(policy)])
+        candidate_tokens = count_tokens(candidate)
+        if candidate_tokens > token_budget and summaries:
+            break
+        summaries.append(summarize_policy(policy))
+        prompt, prompt_tokens = candidate, candidate_tokens
+
+    metrics = {
+        "candidates": len(policies),
+        "packed_policies": len(summaries),
+        "prompt_tokens": prompt_tokens,
+        "prompt_chars": len(prompt),
+        "token_budget": token_budget,
+        "token_counter": TOKEN_COUNTER,
+        "top_score": round(ranked[0][0], 3) if ranked else 0.0,
+        "build_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+    _record(metrics)
+    return prompt, summaries, metrics
+
+
+# 📊 프롬프트 크기 누적 지표 (프로세스 단위)
+_stats_lock = threading.Lock()
+_stats = {"prompts": 0, "prompt_tokens_total": 0, "packed_policies_total": 0, "prompt_tokens_max": 0}
+
+
+def _record(metrics: Dict[str, Any]):
+    with _stats_lock:
+        _stats["prompts"] += 1
+        _stats["prompt_tokens_total"] += metrics["prompt_tokens"]
+        _stats["packed_policies_total"] += metrics["packed_policies"]
+        _stats["prompt_tokens_max"] = max(_stats["prompt_tokens_max"], metrics["prompt_tokens"])
+
+
+def prompt_stats() -> Dict[str, Any]:
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["prompt_tokens_avg"] = round(stats["prompt_tokens_total"] / stats["prompts"], 1) if stats["prompts"] else 0
+    return stats
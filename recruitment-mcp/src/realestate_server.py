@@ -1,60 +1,23 @@
 # realestate_server.py — 부동산 실거래가 MCP 서버
-import os
-import ssl
-from typing import Any, Dict, Optional, Tuple, Iterable
+from typing import Any, Dict, Optional
 
-import httpx
-from dotenv import load_dotenv
-from mcp.server.fastmcp import FastMCP
+try:
+    from .bootstrap import load_env_once, LazyFastMCP
+    from .timing import stage
+    from .upstream import resolve_api_key, resolve_base_url, try_get
+except ImportError:  # 단독 MCP 서버로 실행하는 경우
+    from bootstrap import load_env_once, LazyFastMCP
+    from timing import stage
+    from upstream import resolve_api_key, resolve_base_url, try_get
 
-load_dotenv()
+load_env_once()
 
-mcp = FastMCP("realestate-mcp")
+# FastMCP 인스턴스는 mcp.run() 시점에 생성 (웹 API에서는 도구 함수만 직접 호출)
+mcp = LazyFastMCP("realestate-mcp")
 
 # 국토교통부 부동산 실거래가 API
-BASE_URL = (os.getenv("MOLIT_BASE_URL") or "https://apis.data.go.kr/1613000/RTMSDataSvcAptTrade").rstrip("/")
-API_KEY = (os.getenv("MOLIT_API_KEY") or "").strip()
-
-def _client_candidates() -> Iterable[Tuple[str, httpx.Client]]:
-    """
-    TLS/SSL 환경에 따라 순차적으로 시도할 httpx.Client 후보들.
-    """
-    # 1) 기본값
-    yield "default", httpx.Client(http2=False, timeout=20, trust_env=True)
-
-    # 2) TLS 1.2 이상 + 낮은 보안 레벨
-    try:
-        tls = ssl.create_default_context()
-        tls.minimum_version = ssl.TLSVersion.TLSv1_2
-        try:
-            tls.set_ciphers("DEFAULT:@SECLEVEL=1")
-        except Exception:
-            pass
-        yield "tls12_seclevel1", httpx.Client(verify=tls, http2=False, timeout=20, trust_env=True)
-    except Exception:
-        pass
-
-    # 3) 최후 수단: 인증서 검증 비활성화
-    yield "insecure", httpx.Client(verify=False, http2=False, timeout=20, trust_env=True)
-
-
-def _try_get(url: str, params: Dict[str, Any]):
-    """
-    위의 후보 클라이언트들을 순서대로 시도. 성공하면 (mode, response) 반환.
-    """
-    last_err: Optional[Exception] = None
-    for mode, client in _client_candidates():
-        try:
-            with client as c:
-                resp = c.get(url, params=params)
-                return mode, resp
-        except Exception as e:
-            last_err = e
-            continue
-    if last_err:
-        raise last_err
-    raise RuntimeError("No HTTP client candidates available")
-
+BASE_URL = resolve_base_url("MOLIT_BASE_URL", "https://apis.data.go.kr/1613000/RTMSDataSvcAptTrade", "RTMSDataSvcAptTrade")
+API_KEY = resolve_api_key("MOLIT_API_KEY")
 
 def call_molit_api(
     endpoint: str = "getRTMSDataSvcAptTrade",
@@ -83,17 +46,20 @@ def call_molit_api(
         params.update(filters)
 
     try:
-        mode, resp = _try_get(url, params)
+        with stage("upstream_realestate"):
+            mode, resp = try_get(url, params)
         req_url = str(resp.request.url)
         status_code = resp.status_code
         resp.raise_for_status()
         try:
+            with stage("parse_realestate"):
+                data = resp.json()
             return {
                 "status": "ok",
                 "ssl_mode": mode,
                 "request_url": req_url,
                 "status_code": status_code,
-                "data": resp.json(),
+                "data": data,
             }
         except Exception:
             return {
@@ -190,7 +156,7 @@ def ping():
 
 def main():
     try:
-        names = [t.name for t in mcp._tools]
+        names = mcp.tool_names()
         print("[REALESTATE SERVER] tools:", names, flush=True)
     except Exception:
         pass
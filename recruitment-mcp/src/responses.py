@@ -0,0 +1,174 @@
+# responses.py — API 응답 직렬화/압축 (빠른 JSON 인코더 + gzip/brotli 협상 압축)
+import gzip
+import hashlib
+import json
+import os
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# ⚡ JSON 인코더 (orjson 선택 의존성 - 없으면 표준 json)
+try:
+    import orjson
+    JSON_ENCODER = "orjson"
+except ImportError:
+    orjson = None
+    JSON_ENCODER = "json"
+
+# 🗜️ brotli (선택 의존성 - 없으면 gzip만 협상)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from .cache import TTLCache
+    from .timing import annotate, stage
+except ImportError:
+    from cache import TTLCache
+    from timing import annotate, stage
+
+# ⚙️ 설정 - 작은 응답은 압축 이득보다 CPU 비용이 커서 그대로 전송
+COMPRESS_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESS_MIN_BYTES") or 1024)
+GZIP_LEVEL = int(os.getenv("RESPONSE_GZIP_LEVEL") or 6)
+BROTLI_QUALITY = int(os.getenv("RESPONSE_BROTLI_QUALITY") or 5)
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS") or 60)
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE") or 512)
+
+
+def dumps(data: Any) -> bytes:
+    """응답 dict → UTF-8 JSON 바이트 (한글은 이스케이프하지 않음)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding에서 사용할 압축 방식 선택 (br > gzip, q=0은 제외)"""
+    accepted = {}
+    for part in (accept_encoding or "").lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip()] = q
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0 or (accepted.get("*", 0) > 0 and "gzip" not in accepted):
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class FastJSONResponse(Response):
+    """jsonable_encoder를 거치지 않고 바로 직렬화하는 JSON 응답"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class RenderedBody:
+    """직렬화된 응답 바이트 + 강한 ETag (압축본은 인코딩별로 처음 필요할 때 한 번만 생성)"""
+
+    __slots__ = ("body", "etag", "_encoded")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self._encoded: Dict[str, bytes] = {}
+
+    def encoded(self, encoding: str) -> bytes:
+        if encoding not in self._encoded:
+            with stage("compress"):
+                self._encoded[encoding] = compress(self.body, encoding)
+        return self._encoded[encoding]
+
+
+def render(data: Any) -> RenderedBody:
+    with stage("serialize"):
+        return RenderedBody(dumps(data))
+
+
+def _not_modified(if_none_match: Optional[str], etags) -> bool:
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or any(etag in tags for etag in etags)
+
+
+def send_rendered(request: Request, rendered: RenderedBody, status_code: int = 200,
+                  headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    직렬화된 응답 전송 - If-None-Match가 일치하면 304, 아니면 협상된 방식으로 압축.
+    압축본은 바이트가 다르므로 ETag에 인코딩 접미사를 붙임 ("<hash>-gzip")
+    """
+    encoding = negotiate_encoding(request.headers.get("accept-encoding")) \
+        if len(rendered.body) >= COMPRESS_MIN_BYTES else None
+    etag = rendered.etag if encoding is None else f'{rendered.etag[:-1]}-{encoding}"'
+    response_headers = {"Vary": "Accept-Encoding", "ETag": etag, **(headers or {})}
+
+    if status_code == 200 and _not_modified(request.headers.get("if-none-match"), (etag, rendered.etag)):
+        return Response(status_code=304, headers=response_headers)
+
+    if encoding:
+        response_headers["Content-Encoding"] = encoding
+    body = rendered.body if encoding is None else rendered.encoded(encoding)
+    return Response(content=body, status_code=status_code, media_type="application/json",
+                    headers=response_headers)
+
+
+def json_response(request: Request, data: Any, status_code: int = 200,
+                  headers: Optional[Dict[str, str]] = None) -> Response:
+    """API 응답 - 직렬화 후 ETag/조건부 요청/압축 처리"""
+    return send_rendered(request, render(data), status_code=status_code, headers=headers)
+
+
+# 📦 렌더링된 응답 캐시 - (경로, 정규화된 요청 모델) → RenderedBody
+_response_cache = TTLCache("rendered_responses", ttl_seconds=RESPONSE_CACHE_TTL, maxsize=RESPONSE_CACHE_SIZE)
+
+
+def response_cache_key(route: str, model: Any) -> Hashable:
+    """요청 모델을 기본값 포함·키 정렬한 JSON으로 정규화 (필드 순서/생략 여부와 무관하게 같은 키)"""
+    return route, json.dumps(model.model_dump(mode="json"), sort_keys=True, ensure_ascii=False)
+
+
+# AI 결과가 들어가는 응답 필드 - 기본 결과로 대체(fallback)된 경우 캐시하지 않음
+AI_RESULT_FIELDS = ("ai_analysis", "ai_insights")
+
+
+def _cacheable(data: Any) -> bool:
+    """실패 응답, 업스트림 조회 실패(빈 목록으로 대체된 결과), AI 기본 결과로 대체된 응답은 캐시하지 않음"""
+    if data.get("success", True) is False or data.get("upstream_error"):
+        return False
+    return not any((data.get(field) or {}).get("fallback") for field in AI_RESULT_FIELDS)
+
+
+async def cached_json_response(request: Request, key: Hashable, produce: Callable[[], Awaitable[Any]],
+                               cache_if: Optional[Callable[[Any], bool]] = None) -> Response:
+    """
+    같은 요청이면 저장된 직렬화 바이트를 그대로 전송 (필터링/포맷팅/직렬화 생략).
+    cache_if가 False인 결과(기본: success가 False, upstream_error가 True, AI 결과가 fallback)는 저장하지 않음
+    """
+    rendered = _response_cache.get(key)
+    annotate("response_cache", "hit" if rendered is not None else "miss")
+    if rendered is None:
+        data = await produce()
+        rendered = render(data)
+        if (cache_if or _cacheable)(data):
+            _response_cache.set(key, rendered)
+    # 브라우저는 저장한 응답을 ETag로 재검증 (변경 없으면 304)
+    return send_rendered(request, rendered, headers={"Cache-Control": "no-cache"})
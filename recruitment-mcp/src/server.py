@@ -1,64 +1,22 @@
 # server.py — MCP 서버 (자동 TLS 폴백: default → TLS1.2+SECLEVEL1 → verify=False)
-import os
-import ssl
-from typing import Any, Dict, Optional, Tuple, Iterable
+from typing import Any, Dict, Optional
 
-import httpx
-from dotenv import load_dotenv
-from mcp.server.fastmcp import FastMCP
+try:
+    from .bootstrap import load_env_once, LazyFastMCP
+    from .timing import stage
+    from .upstream import resolve_api_key, resolve_base_url, try_get
+except ImportError:  # 단독 MCP 서버로 실행하는 경우
+    from bootstrap import load_env_once, LazyFastMCP
+    from timing import stage
+    from upstream import resolve_api_key, resolve_base_url, try_get
 
-load_dotenv()
+load_env_once()
 
-mcp = FastMCP("recruitment-mcp")
-
-BASE_URL = (os.getenv("BASE_URL") or "https://apis.data.go.kr/1051000/recruitment").rstrip("/")
-API_KEY = (os.getenv("DATA_GO_KR_KEY") or "").strip()
-
-def _client_candidates() -> Iterable[Tuple[str, httpx.Client]]:
-    """
-    TLS/SSL 환경에 따라 순차적으로 시도할 httpx.Client 후보들.
-    각 후보는 (모드이름, Client) 형태로 yield됩니다.
-    """
-    # 1) 기본값: TLS 자동 협상 + 시스템 프록시/환경 변수 신뢰
-    yield "default", httpx.Client(http2=False, timeout=20, trust_env=True)
-
-    # 2) TLS 1.2 이상 + 낮은 보안 레벨(일부 구형 서버/프록시 대응)
-    try:
-        tls = ssl.create_default_context()
-        tls.minimum_version = ssl.TLSVersion.TLSv1_2
-        # 일부 공공/기관망 장비가 오래된 cipher만 허용 → OpenSSL3 기본 보안레벨과 충돌
-        try:
-            tls.set_ciphers("DEFAULT:@SECLEVEL=1")
-        except Exception:
-            pass
-        yield "tls12_seclevel1", httpx.Client(verify=tls, http2=False, timeout=20, trust_env=True)
-    except Exception:
-        pass
-
-    # 3) 최후 수단: 인증서 검증 비활성화 (가능하면 피하고, 네트워크 진단용으로만 사용)
-    #    성공 시에도 ssl_mode로 'insecure'가 내려갑니다.
-    yield "insecure", httpx.Client(verify=False, http2=False, timeout=20, trust_env=True)
-
-
-def _try_get(url: str, params: Dict[str, Any]):
-    """
-    위의 후보 클라이언트들을 순서대로 시도. 성공하면 (mode, response) 반환.
-    전부 실패하면 마지막 예외를 다시 던짐.
-    """
-    last_err: Optional[Exception] = None
-    for mode, client in _client_candidates():
-        try:
-            with client as c:
-                resp = c.get(url, params=params)
-                return mode, resp
-        except Exception as e:
-            last_err = e
-            continue
-    # 전부 실패
-    if last_err:
-        raise last_err
-    raise RuntimeError("No HTTP client candidates available")
+# FastMCP 인스턴스는 mcp.run() 시점에 생성 (웹 API에서는 도구 함수만 직접 호출)
+mcp = LazyFastMCP("recruitment-mcp")
 
+BASE_URL = resolve_base_url("BASE_URL", "https://apis.data.go.kr/1051000/recruitment", "recruitment")
+API_KEY = resolve_api_key("DATA_GO_KR_KEY")
 
 def call_api(
     path: str,
@@ -84,17 +42,20 @@ def call_api(
         params.update(filters)
 
     try:
-        mode, resp = _try_get(url, params)
+        with stage("upstream_recruitment"):
+            mode, resp = try_get(url, params)
         req_url = str(resp.request.url)
         status_code = resp.status_code
         resp.raise_for_status()
         try:
+            with stage("parse_recruitment"):
+                data = resp.json()
             return {
                 "status": "ok",
                 "ssl_mode": mode,
                 "request_url": req_url,
                 "status_code": status_code,
-                "data": resp.json(),
+                "data": data,
             }
         except Exception:
             return {
@@ -148,7 +109,7 @@ def ping():
 def main():
     # 시작 시 툴 목록 로그 (툴 등록 확인용)
     try:
-        names = [t.name for t in mcp._tools]
+        names = mcp.tool_names()
         print("[SERVER] tools:", names, flush=True)
     except Exception:
         pass
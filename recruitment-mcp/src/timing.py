@@ -0,0 +1,98 @@
+# timing.py — 요청 단계별 소요 시간 기록 (Server-Timing 헤더 + 구조화 로그)
+#
+# 요청마다 RequestTimings를 contextvar에 두고, 코드 곳곳에서 `with stage("이름"):`으로 구간을 잽니다.
+# 요청 밖(MCP 단독 실행 등)에서는 기록할 대상이 없으므로 stage()는 아무것도 하지 않습니다.
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger("ieum.timing")
+
+
+class RequestTimings:
+    """한 요청의 단계별 누적 시간(ms)/호출 횟수와 부가 정보"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, list] = {}  # 이름 → [누적 ms, 횟수]
+        self.fields: Dict[str, Any] = {}
+
+    def add(self, name: str, elapsed_ms: float):
+        entry = self.stages.setdefault(name, [0.0, 0])
+        entry[0] += elapsed_ms
+        entry[1] += 1
+
+    def annotate(self, name: str, value: Any):
+        self.fields[name] = value
+
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: {"ms": round(ms, 2), "count": count} for name, (ms, count) in self.stages.items()}
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (같은 단계가 여러 번이면 desc에 횟수 표시)"""
+        parts = []
+        for name, (ms, count) in self.stages.items():
+            parts.append(f'{name};dur={ms:.1f}' + (f';desc="x{count}"' if count > 1 else ""))
+        for name, value in self.fields.items():
+            parts.append(f'{name};desc="{value}"')
+        parts.append(f"total;dur={self.total_ms():.1f}")
+        return ", ".join(parts)
+
+
+_current: contextvars.ContextVar[Optional[RequestTimings]] = contextvars.ContextVar("request_timings", default=None)
+
+
+def begin() -> contextvars.Token:
+    """새 요청의 시간 기록 시작 - 반환한 토큰으로 end() 호출"""
+    return _current.set(RequestTimings())
+
+
+def end(token: contextvars.Token):
+    _current.reset(token)
+
+
+def current() -> Optional[RequestTimings]:
+    return _current.get()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """구간 시간 측정 - 현재 요청의 RequestTimings에 누적"""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, (time.perf_counter() - started) * 1000)
+
+
+def annotate(name: str, value: Any):
+    """현재 요청에 부가 정보 기록 (예: response_cache=hit)"""
+    timings = _current.get()
+    if timings is not None:
+        timings.annotate(name, value)
+
+
+def log_request(method: str, path: str, status_code: int, timings: RequestTimings):
+    """요청 단위 구조화 로그 (단계별 시간은 extra로 전달)"""
+    total_ms = round(timings.total_ms(), 2)
+    logger.info(
+        "%s %s %s %.1fms", method, path, status_code, total_ms,
+        extra={
+            "event": "request_timing",
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "total_ms": total_ms,
+            "stages": timings.as_dict(),
+            **timings.fields,
+        }
+    )
@@ -0,0 +1,144 @@
+# traffic_capture.py — 실제 사용자 요청 표본 기록 (부하 재현용, 기본 꺼짐)
+#
+# TRAFFIC_CAPTURE_DIR을 지정하면 /api/ 요청 중 표본을 골라 요청 본문과 처리 시간을 JSONL로 남깁니다.
+# 기록은 큐 → 리스너 스레드에서 파일에 쓰므로 요청 처리 경로는 파일 I/O를 기다리지 않습니다.
+# (큐가 가득 차면 버림 - ieum_log_records_dropped_total) 파일은 크기 기준으로 회전합니다.
+# 재생: python -m benchmarks.replay_traffic <TRAFFIC_CAPTURE_DIR> --target http://... --speed 2
+#
+# 🔒 JSON 본문의 user_query(사용자가 입력한 질문)는 같은 길이의 "*"로 바꿔 저장합니다 (로그와 같은 원칙 - 원문 미보관).
+#    재생 시 프롬프트 크기는 비슷하게 유지되지만 질문 관련도 순위는 달라질 수 있습니다.
+#    원문이 필요한 측정이면 TRAFFIC_CAPTURE_KEEP_QUERY=1 (기록 파일에 사용자 입력이 그대로 남으므로 취급 주의)
+#
+# 환경변수
+#   TRAFFIC_CAPTURE_DIR          기록 디렉터리 (지정하면 활성화) - traffic.jsonl, traffic.jsonl.1, ...
+#   TRAFFIC_CAPTURE_SAMPLE_RATE  기록할 요청 비율 0~1 (기본 1)
+#   TRAFFIC_CAPTURE_PATHS        기록할 경로 접두사, 콤마 구분 (기본 /api/)
+#   TRAFFIC_CAPTURE_MAX_BYTES    파일 하나의 최대 크기 (기본 50MB)
+#   TRAFFIC_CAPTURE_BACKUPS      보관할 이전 파일 수 (기본 5)
+#   TRAFFIC_CAPTURE_MAX_BODY     기록할 요청 본문 최대 바이트 (기본 65536, 넘으면 truncated로 표시)
+#   TRAFFIC_CAPTURE_KEEP_QUERY   1이면 user_query 원문 저장 (기본 가림)
+import json
+import logging
+import logging.handlers
+import os
+import random
+import time
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from .logging_setup import current_request_id, queued_handler
+except ImportError:
+    from logging_setup import current_request_id, queued_handler
+
+CAPTURE_FILE = "traffic.jsonl"
+# 재생에 필요한 요청 헤더만 보관 (쿠키/인증 헤더는 남기지 않음)
+KEPT_HEADERS = (b"content-type", b"accept-encoding")
+# JSON 본문에서 가릴 사용자 입력 필드
+REDACTED_FIELDS = ("user_query",)
+
+
+def settings_from_env() -> Optional[Dict[str, Any]]:
+    """TRAFFIC_CAPTURE_DIR이 없으면 None (미들웨어를 붙이지 않음)"""
+    directory = (os.getenv("TRAFFIC_CAPTURE_DIR") or "").strip()
+    if not directory:
+        return None
+    return {
+        "directory": directory,
+        "sample_rate": float(os.getenv("TRAFFIC_CAPTURE_SAMPLE_RATE") or 1),
+        "path_prefixes": tuple(p.strip() for p in (os.getenv("TRAFFIC_CAPTURE_PATHS") or "/api/").split(",") if p.strip()),
+        "max_bytes": int(os.getenv("TRAFFIC_CAPTURE_MAX_BYTES") or 50 * 1024 * 1024),
+        "backups": int(os.getenv("TRAFFIC_CAPTURE_BACKUPS") or 5),
+        "max_body": int(os.getenv("TRAFFIC_CAPTURE_MAX_BODY") or 65536),
+        "keep_query": os.getenv("TRAFFIC_CAPTURE_KEEP_QUERY", "").strip().lower() in ("1", "true", "yes"),
+    }
+
+
+def _capture_logger(directory: str, max_bytes: int, backups: int) -> logging.Logger:
+    """메시지(JSON 한 줄)만 회전 파일에 쓰는 전용 로거 - ieum 로그 출력과 섞이지 않음"""
+    os.makedirs(directory, exist_ok=True)
+    logger = logging.getLogger("ieum_traffic_capture")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not logger.handlers:
+        output = logging.handlers.RotatingFileHandler(os.path.join(directory, CAPTURE_FILE), maxBytes=max_bytes,
+                                                      backupCount=backups, encoding="utf-8")
+        output.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(queued_handler(output))
+    return logger
+
+
+def redact_body(body: str) -> str:
+    """JSON 객체 본문의 user_query를 같은 길이의 *로 (JSON이 아니거나 필드가 없으면 그대로)"""
+    if not any(field in body for field in REDACTED_FIELDS):
+        return body
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return body
+    if not isinstance(payload, dict):
+        return body
+    for field in REDACTED_FIELDS:
+        if isinstance(payload.get(field), str):
+            payload[field] = "*" * len(payload[field])
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+class TrafficCaptureMiddleware:
+    """표본 요청의 메서드/경로/본문/응답 상태/처리 시간을 기록 (ServerTimingMiddleware 안쪽에 두어 요청 ID 공유)"""
+
+    def __init__(self, app, directory: str, sample_rate: float = 1.0, path_prefixes: Tuple[str, ...] = ("/api/",),
+                 max_bytes: int = 50 * 1024 * 1024, backups: int = 5, max_body: int = 65536, keep_query: bool = False):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.path_prefixes = path_prefixes
+        self.max_body = max_body
+        self.keep_query = keep_query
+        self.logger = _capture_logger(directory, max_bytes, backups)
+
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes)
+                or random.random() >= self.sample_rate):
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.time()
+        started = time.perf_counter()
+        body = bytearray()
+        state = {"status": 500, "truncated": False}
+
+        async def capture_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                # 한 번 넘치면 이후 조각은 버림 (본문 중간이 빠진 채 이어 붙지 않게)
+                if state["truncated"] or len(body) + len(chunk) > self.max_body:
+                    state["truncated"] = True
+                else:
+                    body.extend(chunk)
+            return message
+
+        async def capture_send(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, capture_receive, capture_send)
+        finally:
+            text = body.decode("utf-8", errors="replace")
+            entry = {
+                "ts": round(started_at, 6),
+                "method": scope["method"],
+                "path": scope["path"],
+                "query": scope.get("query_string", b"").decode("latin-1"),
+                "headers": {name.decode("latin-1"): value.decode("latin-1")
+                            for name, value in scope.get("headers") or () if name in KEPT_HEADERS},
+                # 잘린 본문은 JSON으로 읽을 수 없어 가리지 못하므로 남기지 않음 (재생에서도 제외되는 항목)
+                "body": text if self.keep_query else ("" if state["truncated"] else redact_body(text)),
+                "status": state["status"],
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                "request_id": current_request_id(),
+            }
+            if state["truncated"]:
+                entry["truncated"] = True
+            self.logger.info(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
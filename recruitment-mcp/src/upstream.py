@@ -0,0 +1,685 @@
+# upstream.py — 공공 API 호출 공통 HTTP 계층
+#
+# 채용/부동산/청년정책 서버가 각자 갖고 있던 TLS 후보 순차 시도(_client_candidates/_try_get)를 한곳으로 모으고,
+# 시도마다 호스트 × 모드별 지연 시간/결과를 metrics에 기록합니다.
+#
+# UPSTREAM_STANDIN_URL을 지정하면 세 API 모두 로컬 대역 서버(benchmarks/standin_upstream.py)로 보냅니다.
+# (BASE_URL/MOLIT_BASE_URL/YOUTH_BASE_URL보다 우선, API 키가 없으면 대역용 키 사용)
+# UPSTREAM_CASSETTE_MODE=record|replay면 호출을 카세트 파일에 녹화하거나 카세트에서 재생합니다 (cassette.py)
+#
+# 🔌 호스트별 차단기: 연속 실패(예외 또는 5xx)가 UPSTREAM_BREAKER_FAILURES(기본 5)번이면 열려서
+#    UPSTREAM_BREAKER_RESET_SECONDS(기본 30초) 동안 호출 없이 바로 실패하고, 같은 요청의 마지막 정상 응답이
+#    있으면 그것을 돌려줍니다(mode="stale"). 이후 한 번에 한 요청만 시험 호출(반열림)해 성공하면 닫힙니다.
+#
+# 🔐 TLS 후보(default → tls12_seclevel1 → insecure)는 TLS 핸드셰이크 실패일 때만 다음 단계로 넘어갑니다.
+#    타임아웃/연결 거부는 모드를 바꿔도 나아지지 않으므로 바로 실패 → 호출 1회의 최악 지연은 연결+읽기 타임아웃 한 번.
+#    tls12_seclevel1로 성공하면 UPSTREAM_TLS_PREFERENCE_SECONDS(기본 600초) 동안 그 모드부터 시작하고, 지나면 default부터 다시 시도합니다.
+#    insecure(verify=False)는 기억하지 않음 - 일시적인 핸드셰이크 오류 한 번으로 인증서 검증이 계속 꺼지지 않게
+#    매번 검증 모드부터 시도하고, insecure로 성공할 때마다 error 로그를 남깁니다.
+#
+# 🔁 재시도 (GET만 - 공공 API 조회는 모두 멱등): 타임아웃/연결 실패/429·5xx 응답이면 지수 백오프 + 지터(full jitter)
+#    후 다시 호출합니다. Retry-After가 있으면 그만큼 기다리고, 한도(max_delay)보다 길면 재시도하지 않습니다.
+#    재시도는 프로세스 전체 예산(RetryBudget - 첫 호출의 UPSTREAM_RETRY_BUDGET_RATIO 비율 + 초당 최소치) 안에서만
+#    허용해 장애 시 재시도 폭주를 막고, 차단기가 열리면 즉시 멈춥니다.
+#    전체 소요 시간(대기 + 재시도)은 마감 시간(기본 = 호출 타임아웃) 안으로 제한 - 재시도의 읽기 타임아웃은 남은 시간으로 줄이고,
+#    남은 시간이 RETRY_MIN_ATTEMPT_SECONDS보다 적으면 재시도하지 않음 → 읽기 타임아웃은 기본 설정에서 재시도되지 않음
+#    (호출은 동기 - 웹 API에서는 이벤트 루프 밖 스레드에서 부름, web_api_handler 참고)
+#    호스트별 정책: UPSTREAM_RETRY_POLICIES="apis.data.go.kr=3:0.5:4,www.youthcenter.go.kr=2"
+#    (호스트=최대 시도 수:기본 대기초:최대 대기초, 생략하면 기본값) - 1이면 재시도 안 함
+#
+# 🏁 헤징 (선택, UPSTREAM_HEDGE_HOSTS로 켬): 엔드포인트(호스트+경로)별 최근 지연의 p90이 지나도 응답이 없으면
+#    같은 GET을 하나 더 보내 먼저 온 정상 응답(예외/5xx가 아닌 것)을 씁니다. 경주는 헤징 전용 이벤트 루프에서
+#    httpx.AsyncClient 작업 둘로 돌리고, 진 쪽은 작업을 취소해 연결을 끊습니다 (아직 보내지 않은 요청/TLS 재시도는 생략됨).
+#    표본이 모이기 전과 헤징 대상이 아닌 호출은 지금처럼 호출 스레드에서 동기로 보냅니다.
+#    예비 요청은 첫 호출의 UPSTREAM_HEDGE_BUDGET_RATIO(기본 5%) 이내로만 보내 공공 API 호출 한도를 아낍니다.
+import asyncio
+import email.utils
+import os
+import random
+import ssl
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+try:
+    from .cache import TTLCache
+    from .cassette import get_cassette, request_key
+    from .logging_setup import current_request_id, get_logger, with_request_id
+    from .metrics import (UPSTREAM_BREAKER_REJECTED, UPSTREAM_BREAKER_STATE, UPSTREAM_DURATION, UPSTREAM_ERRORS,
+                          UPSTREAM_HEDGES, UPSTREAM_IN_FLIGHT, UPSTREAM_REQUESTS, UPSTREAM_RETRIES, UPSTREAM_RETRIES_SKIPPED)
+except ImportError:
+    from cache import TTLCache
+    from cassette import get_cassette, request_key
+    from logging_setup import current_request_id, get_logger, with_request_id
+    from metrics import (UPSTREAM_BREAKER_REJECTED, UPSTREAM_BREAKER_STATE, UPSTREAM_DURATION, UPSTREAM_ERRORS,
+                         UPSTREAM_HEDGES, UPSTREAM_IN_FLIGHT, UPSTREAM_REQUESTS, UPSTREAM_RETRIES, UPSTREAM_RETRIES_SKIPPED)
+
+STANDIN_API_KEY = "standin-key"
+
+# ⚙️ 차단기 / 마지막 정상 응답 캐시 설정
+BREAKER_FAILURES = int(os.getenv("UPSTREAM_BREAKER_FAILURES") or 5)
+BREAKER_RESET_SECONDS = float(os.getenv("UPSTREAM_BREAKER_RESET_SECONDS") or 30)
+STALE_TTL = float(os.getenv("UPSTREAM_STALE_TTL_SECONDS") or 6 * 3600)
+STALE_CACHE_SIZE = int(os.getenv("UPSTREAM_STALE_CACHE_SIZE") or 256)
+
+# ⏱️ 연결/읽기 타임아웃 분리 (읽기는 호출부 값, UPSTREAM_READ_TIMEOUT_SECONDS로 일괄 지정 가능)
+CONNECT_TIMEOUT = float(os.getenv("UPSTREAM_CONNECT_TIMEOUT_SECONDS") or 5)
+READ_TIMEOUT_OVERRIDE = os.getenv("UPSTREAM_READ_TIMEOUT_SECONDS")
+
+TLS_MODES = ("default", "tls12_seclevel1", "insecure")
+TLS_PREFERENCE_SECONDS = float(os.getenv("UPSTREAM_TLS_PREFERENCE_SECONDS") or 600)
+
+# 🔁 재시도 기본값 / 전체 예산
+RETRY_MAX_ATTEMPTS = int(os.getenv("UPSTREAM_RETRY_MAX_ATTEMPTS") or 3)
+RETRY_BASE_DELAY = float(os.getenv("UPSTREAM_RETRY_BASE_SECONDS") or 0.3)
+RETRY_MAX_DELAY = float(os.getenv("UPSTREAM_RETRY_MAX_SECONDS") or 5)
+# 재시도 포함 전체 마감 시간 - 지정하지 않으면 호출의 읽기 타임아웃과 같음
+RETRY_DEADLINE: Optional[float] = float(os.environ["UPSTREAM_RETRY_DEADLINE_SECONDS"]) \
+    if os.getenv("UPSTREAM_RETRY_DEADLINE_SECONDS") else None
+RETRY_MIN_ATTEMPT_SECONDS = float(os.getenv("UPSTREAM_RETRY_MIN_ATTEMPT_SECONDS") or 1)
+RETRY_BUDGET_RATIO = float(os.getenv("UPSTREAM_RETRY_BUDGET_RATIO") or 0.1)
+RETRY_BUDGET_MIN_PER_SECOND = float(os.getenv("UPSTREAM_RETRY_BUDGET_MIN_PER_SECOND") or 1)
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRYABLE_ERRORS = frozenset({"timeout", "connection"})
+
+# 🏁 헤징 (기본 꺼짐) - UPSTREAM_HEDGE_HOSTS: 콤마 구분 호스트 또는 * (전체)
+HEDGE_HOSTS = frozenset(h.strip() for h in (os.getenv("UPSTREAM_HEDGE_HOSTS") or "").split(",") if h.strip())
+HEDGE_BUDGET_RATIO = float(os.getenv("UPSTREAM_HEDGE_BUDGET_RATIO") or 0.05)
+HEDGE_PERCENTILE = float(os.getenv("UPSTREAM_HEDGE_PERCENTILE") or 90)
+HEDGE_MIN_DELAY = float(os.getenv("UPSTREAM_HEDGE_MIN_DELAY_MS") or 50) / 1000
+HEDGE_MIN_SAMPLES = int(os.getenv("UPSTREAM_HEDGE_MIN_SAMPLES") or 20)
+HEDGE_WINDOW = int(os.getenv("UPSTREAM_HEDGE_WINDOW") or 200)
+
+logger = get_logger("upstream")
+
+
+def standin_url() -> str:
+    return (os.getenv("UPSTREAM_STANDIN_URL") or "").strip().rstrip("/")
+
+
+def resolve_base_url(env_name: str, default: str, standin_path: str) -> str:
+    """API 기본 URL - 대역 서버 지정 시 <대역 URL>/<standin_path>, 아니면 환경변수 또는 기본값"""
+    standin = standin_url()
+    if standin:
+        return f"{standin}/{standin_path.strip('/')}"
+    return (os.getenv(env_name) or default).rstrip("/")
+
+
+def resolve_api_key(env_name: str, default: str = "") -> str:
+    key = (os.getenv(env_name) or default).strip()
+    if not key and standin_url():
+        return STANDIN_API_KEY
+    return key
+
+
+def upstream_timeout(read: float) -> httpx.Timeout:
+    connect = min(CONNECT_TIMEOUT, read)
+    return httpx.Timeout(connect=connect, read=read, write=connect, pool=connect)
+
+
+def make_client(mode: str, timeout: httpx.Timeout, client_class=httpx.Client):
+    """TLS 모드별 httpx.Client (헤징 경주에서는 httpx.AsyncClient) - 시스템 프록시/환경 변수 신뢰"""
+    if mode == "tls12_seclevel1":
+        # TLS 1.2 이상 + 낮은 보안 레벨(일부 구형 서버/프록시 대응)
+        tls = ssl.create_default_context()
+        tls.minimum_version = ssl.TLSVersion.TLSv1_2
+        # 일부 공공/기관망 장비가 오래된 cipher만 허용 → OpenSSL3 기본 보안레벨과 충돌
+        try:
+            tls.set_ciphers("DEFAULT:@SECLEVEL=1")
+        except Exception:
+            pass
+        return client_class(verify=tls, http2=False, timeout=timeout, trust_env=True)
+    if mode == "insecure":
+        # 최후 수단: 인증서 검증 비활성화 (가능하면 피하고, 네트워크 진단용으로만 사용)
+        #    성공 시에도 ssl_mode로 'insecure'가 내려갑니다.
+        return client_class(verify=False, http2=False, timeout=timeout, trust_env=True)
+    # 기본값: TLS 자동 협상
+    return client_class(http2=False, timeout=timeout, trust_env=True)
+
+
+def client_candidates(timeout: float = 20, start_mode: str = "default",
+                      client_class=httpx.Client) -> Iterable[Tuple[str, httpx.Client]]:
+    """
+    TLS/SSL 환경에 따라 순차적으로 시도할 httpx.Client 후보들 (start_mode부터).
+    각 후보는 (모드이름, Client) 형태로 yield됩니다.
+    """
+    limits = upstream_timeout(timeout)
+    for mode in TLS_MODES[TLS_MODES.index(start_mode):]:
+        try:
+            yield mode, make_client(mode, limits, client_class)
+        except Exception:
+            # SSL 컨텍스트를 만들 수 없는 환경이면 다음 후보로
+            continue
+
+
+def classify_error(error: BaseException) -> str:
+    """tls(핸드셰이크/인증서) / timeout / connection / other - TLS 후보 전환은 tls일 때만"""
+    if isinstance(error, httpx.TimeoutException):
+        return "timeout"
+    seen = set()
+    cause: Optional[BaseException] = error
+    while cause is not None and id(cause) not in seen:
+        if isinstance(cause, ssl.SSLError):
+            return "tls"
+        seen.add(id(cause))
+        cause = cause.__cause__ or cause.__context__
+    if isinstance(error, httpx.ConnectError) and "[SSL" in str(error):
+        return "tls"
+    if isinstance(error, (httpx.NetworkError, httpx.RemoteProtocolError)):
+        return "connection"
+    return "other"
+
+
+# 호스트별로 낮춘 TLS 모드와 만료 시각 (만료 전까지 다음 호출은 여기서 시작, insecure는 저장하지 않음)
+_preferred_modes: Dict[str, Tuple[str, float]] = {}
+
+
+def _start_mode(host: str) -> str:
+    preferred = _preferred_modes.get(host)
+    if preferred is None or preferred[1] <= time.monotonic():
+        return "default"
+    return preferred[0]
+
+
+def _remember_mode(host: str, mode: str):
+    if mode == "insecure":
+        # 인증서 검증 없이 성공 - 기억하지 않고 매번 알림 (다음 호출은 다시 검증 모드부터)
+        logger.error("공공 API 인증서 검증 비활성화(verify=False)로 호출", extra={"host": host, "tls_mode": mode})
+        return
+    # 만료 전에는 갱신하지 않음 (시작 모드로 성공하면 여기 오지 않음) → TTL마다 default 재시도
+    logger.warning("공공 API TLS 모드 전환", extra={"host": host, "tls_mode": mode,
+                                                    "ttl_seconds": TLS_PREFERENCE_SECONDS})
+    _preferred_modes[host] = (mode, time.monotonic() + TLS_PREFERENCE_SECONDS)
+
+
+class RetryPolicy:
+    """호스트 하나의 재시도 정책 - attempts는 첫 호출 포함 최대 시도 수, deadline은 재시도 포함 전체 시간(None이면 호출 타임아웃)"""
+
+    def __init__(self, attempts: int = RETRY_MAX_ATTEMPTS, base_delay: float = RETRY_BASE_DELAY,
+                 max_delay: float = RETRY_MAX_DELAY, deadline: Optional[float] = RETRY_DEADLINE):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    def backoff(self, retry_number: int) -> float:
+        """full jitter: 0 ~ min(max_delay, base × 2^n) 사이 무작위 - 동시에 실패한 호출들이 같은 순간 몰리지 않게"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** retry_number)))
+
+
+def _parse_retry_policies(spec: str) -> Dict[str, RetryPolicy]:
+    """'host=3:0.5:4,host2=2' → {host: RetryPolicy} (빠진 값은 기본값)"""
+    policies: Dict[str, RetryPolicy] = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        host, _, values = item.partition("=")
+        parts = [v.strip() for v in values.split(":")]
+        try:
+            policies[host.strip()] = RetryPolicy(
+                attempts=int(parts[0]) if parts[0] else RETRY_MAX_ATTEMPTS,
+                base_delay=float(parts[1]) if len(parts) > 1 and parts[1] else RETRY_BASE_DELAY,
+                max_delay=float(parts[2]) if len(parts) > 2 and parts[2] else RETRY_MAX_DELAY)
+        except ValueError:
+            logger.warning("UPSTREAM_RETRY_POLICIES 항목 무시", extra={"item": item})
+    return policies
+
+
+_retry_policies = _parse_retry_policies(os.getenv("UPSTREAM_RETRY_POLICIES") or "")
+_default_retry_policy = RetryPolicy()
+
+
+def retry_policy_for(host: str) -> RetryPolicy:
+    return _retry_policies.get(host, _default_retry_policy)
+
+
+class RetryBudget:
+    """
+    프로세스 전체 재시도 예산 (토큰 버킷). 첫 호출마다 ratio만큼, 시간에 따라 초당 min_per_second만큼 쌓이고
+    재시도 한 번에 1씩 씀 → 평소 재시도는 첫 호출의 ratio 비율 + 최소치를 넘지 않음 (장애 시 호출량이 몇 배로 불지 않게)
+    헤징 예비 요청 예산(hedge_budget)도 같은 방식입니다.
+    """
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, min_per_second: float = RETRY_BUDGET_MIN_PER_SECOND,
+                 capacity: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def record_request(self):
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+retry_budget = RetryBudget()
+hedge_budget = RetryBudget(ratio=HEDGE_BUDGET_RATIO, min_per_second=0, capacity=2)
+
+
+class LatencyWindow:
+    """엔드포인트 하나의 최근 응답 시간(초) - 헤징 대기 시간(p90) 계산용"""
+
+    def __init__(self, size: int = HEDGE_WINDOW):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        with self._lock:
+            self.samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        with self._lock:
+            if len(self.samples) < HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+_latency_windows: Dict[str, LatencyWindow] = {}
+_latency_windows_lock = threading.Lock()
+_hedge_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _latency_window(endpoint: str) -> LatencyWindow:
+    with _latency_windows_lock:
+        if endpoint not in _latency_windows:
+            _latency_windows[endpoint] = LatencyWindow()
+        return _latency_windows[endpoint]
+
+
+def _get_hedge_loop() -> asyncio.AbstractEventLoop:
+    """헤징 경주 전용 이벤트 루프 (백그라운드 스레드, 최초 사용 시 1회 생성) - 동시 호출 수 제한 없음"""
+    global _hedge_loop
+    with _latency_windows_lock:
+        if _hedge_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="upstream-hedge-loop", daemon=True).start()
+            _hedge_loop = loop
+    return _hedge_loop
+
+
+def hedging_enabled(host: str) -> bool:
+    return "*" in HEDGE_HOSTS or host in HEDGE_HOSTS
+
+
+def retry_after_seconds(resp: httpx.Response) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 대기 초, 없거나 잘못된 값이면 None"""
+    value = (resp.headers.get("retry-after") or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class CircuitOpenError(httpx.TransportError):
+    """차단기가 열려 있어 호출하지 않음 (호출부에서는 일반 연결 실패와 같게 처리)"""
+
+
+class CircuitBreaker:
+    """호스트 하나의 차단기 - closed → (연속 실패) → open → (대기 후) half_open → (시험 호출 결과) closed/open"""
+
+    CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+    _STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(self, host: str, failure_threshold: int = BREAKER_FAILURES, reset_seconds: float = BREAKER_RESET_SECONDS):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self._stats = {"failures": 0, "successes": 0, "rejected": 0, "opened": 0}
+        UPSTREAM_BREAKER_STATE.set(0, host=host)
+
+    def _set_state(self, state: str):
+        self.state = state
+        UPSTREAM_BREAKER_STATE.set(self._STATE_VALUES[state], host=self.host)
+
+    def allow(self) -> bool:
+        """호출해도 되는지 - 반열림 상태에서는 시험 호출 하나만 허용"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_seconds:
+                    self._stats["rejected"] += 1
+                    return False
+                self._set_state(self.HALF_OPEN)
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    self._stats["rejected"] += 1
+                    return False
+                self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._stats["successes"] += 1
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+            if self.state != self.CLOSED:
+                self._set_state(self.CLOSED)
+                self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._stats["failures"] += 1
+            self.consecutive_failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED
+                                                and self.consecutive_failures >= self.failure_threshold):
+                self._set_state(self.OPEN)
+                self.opened_at = time.monotonic()
+                self._stats["opened"] += 1
+
+    def release_probe(self):
+        """결과 없이 끝난 호출(취소/인터럽트)의 시험 호출 자리 반환 - 성공/실패로 세지 않음"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def retry_in(self) -> float:
+        """열린 상태에서 시험 호출까지 남은 시간(초)"""
+        if self.state != self.OPEN or self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at))
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"state": self.state, "consecutive_failures": self.consecutive_failures,
+                    "retry_in_seconds": round(self.retry_in(), 1), **self._stats}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+# 요청(경로 + 인증 제외 파라미터)별 마지막 2xx 응답 - 차단기가 열렸을 때 대신 돌려줌
+_stale_responses = TTLCache("upstream_last_good", ttl_seconds=STALE_TTL, maxsize=STALE_CACHE_SIZE)
+
+
+def breaker_for(host: str) -> CircuitBreaker:
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(host)
+        return _breakers[host]
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    """/api/health 표시용 - 한 번이라도 호출한 호스트만"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.host: breaker.snapshot() for breaker in breakers}
+
+
+def _remember(url: str, params: Dict[str, Any], resp: httpx.Response):
+    _stale_responses.set(request_key(url, params), {
+        "status": resp.status_code, "content": resp.content, "stored_at": time.time(),
+        "headers": {k: resp.headers[k] for k in ("content-type",) if k in resp.headers},
+    })
+
+
+def _stale_response(url: str, params: Dict[str, Any]) -> Optional[httpx.Response]:
+    entry = _stale_responses.get(request_key(url, params))
+    if entry is None:
+        return None
+    headers = {**entry["headers"], "x-upstream-stale-seconds": str(int(time.time() - entry["stored_at"]))}
+    return httpx.Response(entry["status"], headers=headers, content=entry["content"],
+                          request=httpx.Request("GET", url, params=params))
+
+
+def _replay(host: str, url: str, params: Dict[str, Any]) -> Optional[Tuple[str, httpx.Response]]:
+    """카세트 재생 (카세트에 없고 live 설정이면 None) - 메트릭은 mode="replay"로 기록"""
+    started = time.perf_counter()
+    try:
+        hit = get_cassette().replay(url, params)
+    except Exception as e:
+        UPSTREAM_DURATION.observe(time.perf_counter() - started, host=host, mode="replay")
+        UPSTREAM_REQUESTS.inc(host=host, mode="replay", result="exception")
+        UPSTREAM_ERRORS.inc(host=host, mode="replay", kind=classify_error(e), error=type(e).__name__)
+        raise
+    if hit is not None:
+        UPSTREAM_DURATION.observe(time.perf_counter() - started, host=host, mode="replay")
+        UPSTREAM_REQUESTS.inc(host=host, mode="replay", result=f"{hit[1].status_code // 100}xx")
+    return hit
+
+
+def _attempt_failed(host: str, mode: str, started: float, error: Exception) -> str:
+    kind = classify_error(error)
+    UPSTREAM_DURATION.observe(time.perf_counter() - started, host=host, mode=mode)
+    UPSTREAM_REQUESTS.inc(host=host, mode=mode, result="exception")
+    UPSTREAM_ERRORS.inc(host=host, mode=mode, kind=kind, error=type(error).__name__)
+    return kind
+
+
+def _attempt_succeeded(host: str, mode: str, started: float, start_mode: str, resp: httpx.Response):
+    UPSTREAM_DURATION.observe(time.perf_counter() - started, host=host, mode=mode)
+    UPSTREAM_REQUESTS.inc(host=host, mode=mode, result=f"{resp.status_code // 100}xx")
+    if mode != start_mode:
+        _remember_mode(host, mode)
+
+
+def _fetch(host: str, url: str, params: Dict[str, Any], timeout: float) -> Tuple[str, httpx.Response]:
+    """TLS 후보를 순서대로 시도 (TLS 오류일 때만 다음 후보) - 시도마다 메트릭 기록"""
+    last_err: Optional[Exception] = None
+    start_mode = _start_mode(host)
+    UPSTREAM_IN_FLIGHT.inc(host=host)
+    try:
+        for mode, client in client_candidates(timeout, start_mode):
+            started = time.perf_counter()
+            try:
+                with client as c:
+                    resp = c.get(url, params=params)
+            except Exception as e:
+                if _attempt_failed(host, mode, started, e) != "tls":
+                    raise
+                last_err = e
+                continue
+            _attempt_succeeded(host, mode, started, start_mode, resp)
+            return mode, resp
+    finally:
+        UPSTREAM_IN_FLIGHT.dec(host=host)
+    # 전부 실패
+    if last_err:
+        raise last_err
+    raise RuntimeError("No HTTP client candidates available")
+
+
+async def _fetch_async(host: str, url: str, params: Dict[str, Any], timeout: float) -> Tuple[str, httpx.Response]:
+    """_fetch의 AsyncClient 버전 (헤징 경주용) - 취소되면 연결을 닫고 result="cancelled"로 기록"""
+    last_err: Optional[Exception] = None
+    start_mode = _start_mode(host)
+    UPSTREAM_IN_FLIGHT.inc(host=host)
+    try:
+        for mode, client in client_candidates(timeout, start_mode, httpx.AsyncClient):
+            started = time.perf_counter()
+            try:
+                async with client as c:
+                    resp = await c.get(url, params=params)
+            except asyncio.CancelledError:
+                UPSTREAM_DURATION.observe(time.perf_counter() - started, host=host, mode=mode)
+                UPSTREAM_REQUESTS.inc(host=host, mode=mode, result="cancelled")
+                raise
+            except Exception as e:
+                if _attempt_failed(host, mode, started, e) != "tls":
+                    raise
+                last_err = e
+                continue
+            _attempt_succeeded(host, mode, started, start_mode, resp)
+            return mode, resp
+    finally:
+        UPSTREAM_IN_FLIGHT.dec(host=host)
+    if last_err:
+        raise last_err
+    raise RuntimeError("No HTTP client candidates available")
+
+
+def _won(task: "asyncio.Task") -> bool:
+    """경주에서 이긴 결과인지 - 예외나 5xx 응답은 상대를 기다림"""
+    return task.exception() is None and task.result()[1].status_code < 500
+
+
+async def _race(host: str, url: str, params: Dict[str, Any], timeout: float,
+                hedge_after: float) -> Tuple[str, httpx.Response]:
+    """원 요청이 hedge_after초 안에 끝나지 않으면 예비 요청을 보내 먼저 이긴 쪽 반환, 진 쪽은 취소"""
+    primary = asyncio.ensure_future(_fetch_async(host, url, params, timeout))
+    done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+    if done:
+        return primary.result()
+    if not hedge_budget.try_spend():
+        UPSTREAM_HEDGES.inc(host=host, outcome="skipped_budget")
+        return await primary
+
+    hedge = asyncio.ensure_future(_fetch_async(host, url, params, timeout))
+    pending = {primary, hedge}
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if _won(task):
+                for loser in pending:
+                    loser.cancel()
+                UPSTREAM_HEDGES.inc(host=host, outcome="hedge_won" if task is hedge else "primary_won")
+                return task.result()
+    # 둘 다 실패 - 원 요청의 결과(예외 또는 5xx 응답)를 그대로 돌려줌
+    hedge.exception()  # 예외를 읽어 "never retrieved" 경고 방지
+    UPSTREAM_HEDGES.inc(host=host, outcome="both_failed")
+    return primary.result()
+
+
+def _fetch_hedged(host: str, url: str, params: Dict[str, Any], timeout: float) -> Tuple[str, httpx.Response]:
+    """
+    헤징 대상 호스트면 p90 이후 예비 요청 경주(_race)를 헤징 루프에서 실행하고 기다림.
+    대상이 아니거나 지연 표본이 모이기 전에는 _fetch를 그대로 호출 스레드에서 실행합니다.
+    """
+    if not hedging_enabled(host):
+        return _fetch(host, url, params, timeout)
+
+    hedge_budget.record_request()
+    window = _latency_window(f"{host}{urlsplit(url).path}")
+    started = time.perf_counter()
+    threshold = window.percentile(HEDGE_PERCENTILE)
+    if threshold is None:
+        # 표본이 모일 때까지는 헤징 없이 측정만
+        result = _fetch(host, url, params, timeout)
+        window.add(time.perf_counter() - started)
+        return result
+
+    race = _race(host, url, params, timeout, max(HEDGE_MIN_DELAY, threshold))
+    future = asyncio.run_coroutine_threadsafe(with_request_id(current_request_id(), race), _get_hedge_loop())
+    try:
+        result = future.result()
+    except BaseException:
+        future.cancel()
+        raise
+    window.add(time.perf_counter() - started)
+    return result
+
+
+def try_get(url: str, params: Dict[str, Any], timeout: float = 20) -> Tuple[str, httpx.Response]:
+    """
+    공공 API GET. 성공하면 (mode, response) 반환 - mode는 성공한 TLS 후보, 카세트 재생이면 녹화 당시 모드,
+    차단기가 열려 마지막 정상 응답을 돌려주면 "stale". 실패하면 마지막 예외(차단기가 열려 있으면 CircuitOpenError).
+    재시도 대상 실패는 호스트 정책/전체 예산 안에서 다시 호출하고 마지막 결과를 반환합니다.
+    """
+    host = urlsplit(url).hostname or "unknown"
+    cassette = get_cassette()
+    if cassette.replaying:
+        hit = _replay(host, url, params)
+        if hit is not None:
+            return hit
+
+    breaker = breaker_for(host)
+    if not breaker.allow():
+        stale = _stale_response(url, params)
+        UPSTREAM_BREAKER_REJECTED.inc(host=host, served="stale" if stale is not None else "error")
+        if stale is not None:
+            return "stale", stale
+        raise CircuitOpenError(f"{host} 차단기 열림 - {breaker.retry_in():.0f}초 후 다시 시도",
+                               request=httpx.Request("GET", url, params=params))
+
+    timeout = float(READ_TIMEOUT_OVERRIDE or timeout)
+    policy = retry_policy_for(host)
+    deadline = policy.deadline if policy.deadline is not None else timeout
+    retry_budget.record_request()
+    call_started = time.perf_counter()
+    attempt_timeout = timeout
+    attempt = 0
+    while True:
+        error: Optional[Exception] = None
+        try:
+            mode, resp = _fetch_hedged(host, url, params, attempt_timeout)
+        except Exception as e:
+            error = e
+            breaker.record_failure()
+            reason = classify_error(e)
+            retryable = reason in RETRYABLE_ERRORS
+            server_delay = None
+        except BaseException:
+            # 취소/인터럽트 - 반열림 시험 호출 자리를 잡은 채 빠져나가면 재시작 전까지 모든 호출이 거부됨
+            breaker.release_probe()
+            raise
+        else:
+            if resp.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+                if resp.is_success:
+                    _remember(url, params, resp)
+            reason = str(resp.status_code)
+            retryable = resp.status_code in RETRYABLE_STATUSES
+            server_delay = retry_after_seconds(resp)
+
+        attempt += 1
+        if not retryable or attempt >= policy.attempts:
+            break
+        delay = policy.backoff(attempt - 1)
+        if server_delay is not None:
+            if server_delay > policy.max_delay:
+                UPSTREAM_RETRIES_SKIPPED.inc(host=host, why="retry_after")
+                break
+            delay = max(delay, server_delay)
+        # 대기 후 남은 시간이 너무 짧으면 재시도하지 않음 (첫 시도가 읽기 타임아웃이면 기본 설정에서는 항상 여기서 멈춤)
+        if deadline - (time.perf_counter() - call_started + delay) < RETRY_MIN_ATTEMPT_SECONDS:
+            UPSTREAM_RETRIES_SKIPPED.inc(host=host, why="deadline")
+            break
+        if not retry_budget.try_spend():
+            UPSTREAM_RETRIES_SKIPPED.inc(host=host, why="budget")
+            break
+        time.sleep(delay)
+        # 기다리는 동안 차단기가 열렸으면(다른 호출의 실패 포함) 더 두드리지 않음
+        if not breaker.allow():
+            UPSTREAM_RETRIES_SKIPPED.inc(host=host, why="breaker")
+            break
+        UPSTREAM_RETRIES.inc(host=host, reason=reason)
+        attempt_timeout = min(timeout, deadline - (time.perf_counter() - call_started))
+
+    elapsed = time.perf_counter() - call_started
+    if error is not None:
+        if cassette.recording:
+            cassette.record(url, params, elapsed, error=error)
+        raise error
+    if cassette.recording:
+        cassette.record(url, params, elapsed, mode=mode, resp=resp)
+    return mode, resp
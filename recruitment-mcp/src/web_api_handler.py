@@ -1,15 +1,28 @@
 # src/web_api_handler.py - 수정된 버전
-from typing import Dict, Any, Optional, List
+import asyncio
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
 # 상대 import 방식으로 변경
 from .enhanced_orchestrator import EnhancedOrchestrator
 from .final_chatbot import PerfectChatbot
+from .analysis_jobs import policy_analysis_jobs
+from .timing import stage
+from .logging_setup import get_logger
+from .projections import (
+    EDUCATION_CODE_MAPPING, HIRE_TYPE_CODE_MAPPING, RECRUIT_TYPE_CODE_MAPPING,
+    format_education_requirement, format_hire_type, format_category_display,
+    job_projection, policy_projection,
+    JOB_VIEW_FIELDS, POLICY_VIEW_FIELDS, view_fields, pick_fields,
+)
+
+logger = get_logger("web_api")
+
 
 class WebAPIHandler:
     def __init__(self):
         self.orchestrator = EnhancedOrchestrator()
-        self.chatbot = PerfectChatbot()
+        self.chatbot = PerfectChatbot(orchestrator=self.orchestrator)
         
         # 🗺️ 지역코드 → 광역(도)명 매핑 (표시용)
         self.PROVINCE_BY_CODE = {
@@ -20,171 +33,23 @@ class WebAPIHandler:
             "44790": "충남",  # 청양 → 충남
         }
         
-        # 🔧 학력 코드 매핑 테이블 (클래스 속성으로 이동)
-        self.EDUCATION_CODE_MAPPING = {
-            "R7010": "학력무관",
-            "R7020": "고등학교졸업",
-            "R7030": "고등학교졸업 이상", 
-            "R7040": "전문대학졸업",
-            "R7050": "대학교졸업",
-            "R7060": "대학원 석사졸업", 
-            "R7070": "대학원 박사졸업",
-            "R7080": "기타"
-        }
-
-        # 🔧 고용형태 코드 매핑 (클래스 속성으로 이동)
-        self.HIRE_TYPE_CODE_MAPPING = {
-            "R1010": "정규직",
-            "R1020": "무기계약직",
-            "R1030": "기간제계약직",
-            "R1040": "비정규직",
-            "R1050": "청년인턴(체험형)",
-            "R1060": "청년인턴(채용형)",
-            "R1070": "기타"
-        }
-
-        # 🆕 채용구분 코드 매핑 추가
-        self.RECRUIT_TYPE_CODE_MAPPING = {
-            "R2010": "신입",
-            "R2020": "경력", 
-            "R2030": "신입+경력",
-            "R2040": "외국인 전형"
-        }
+        # 🔧 코드 매핑 테이블 (표시용 포맷팅은 projections 모듈에서 레코드당 한 번만 계산)
+        self.EDUCATION_CODE_MAPPING = EDUCATION_CODE_MAPPING
+        self.HIRE_TYPE_CODE_MAPPING = HIRE_TYPE_CODE_MAPPING
+        self.RECRUIT_TYPE_CODE_MAPPING = RECRUIT_TYPE_CODE_MAPPING
 
     def format_education_requirement(self, code_str):
-        """학력 코드를 한글로 변환 - 개선된 로직"""
-        if not code_str:
-            return "정보 없음"
-        
-        codes = [code.strip() for code in code_str.split(',') if code.strip()]
-        
-        # 🎯 학력무관이 포함되어 있으면 학력무관만 표시
-        if "R7010" in codes:
-            return "학력무관"
-        
-        # 🎯 학력 순서 정의 (낮은 순부터)
-        education_order = {
-            "R7020": 1,  # 고등학교졸업
-            "R7030": 2,  # 고등학교졸업 이상  
-            "R7040": 3,  # 전문대학졸업
-            "R7050": 4,  # 대학교졸업
-            "R7060": 5,  # 대학원 석사졸업
-            "R7070": 6,  # 대학원 박사졸업
-            "R7080": 7   # 기타
-        }
-        
-        # 코드를 학력 순서대로 정렬
-        valid_codes = [code for code in codes if code in education_order]
-        
-        if not valid_codes:
-            # 매핑되지 않은 코드들
-            return ', '.join([self.EDUCATION_CODE_MAPPING.get(code, code) for code in codes])
-        
-        # 가장 낮은 학력과 가장 높은 학력 찾기
-        sorted_codes = sorted(valid_codes, key=lambda x: education_order[x])
-        
-        if len(sorted_codes) == 1:
-            return self.EDUCATION_CODE_MAPPING.get(sorted_codes[0], sorted_codes[0])
-        
-        # 연속된 범위인 경우 "X 이상" 형태로 표시
-        min_code = sorted_codes[0]
-        max_code = sorted_codes[-1]
-        
-        # 🎯 범위로 표시하는 경우
-        if len(sorted_codes) >= 3:  # 3개 이상이면 범위로
-            min_education = self.EDUCATION_CODE_MAPPING.get(min_code, min_code)
-            return f"{min_education} 이상"
-        
-        # 🎯 개별 표시하는 경우 (2개 정도)
-        formatted_codes = [self.EDUCATION_CODE_MAPPING.get(code, code) for code in sorted_codes]
-        return ', '.join(formatted_codes)
+        """학력 코드를 한글로 변환"""
+        return format_education_requirement(code_str)
 
     def format_hire_type(self, code_str):
-        """고용형태 코드를 한글로 변환 - 개선된 로직"""
-        if not code_str:
-            return "정보 없음"
-        
-        codes = [code.strip() for code in code_str.split(',') if code.strip()]
-        
-        # 🎯 중복 제거 및 우선순위 정렬
-        hire_type_priority = {
-            "R1010": 1,  # 정규직 (최우선)
-            "R1020": 2,  # 무기계약직
-            "R1040": 3,  # 비정규직
-            "R1030": 4,  # 기간제계약직
-            "R1060": 5,  # 청년인턴(채용형)
-            "R1050": 6,  # 청년인턴(체험형)
-            "R1070": 7   # 기타
-        }
-        
-        # 우선순위에 따라 정렬
-        valid_codes = [code for code in codes if code in hire_type_priority]
-        sorted_codes = sorted(valid_codes, key=lambda x: hire_type_priority.get(x, 999))
-        
-        # 🎯 최대 2개까지만 표시 (너무 길어지지 않게)
-        display_codes = sorted_codes[:2]
-        
-        formatted_codes = [self.HIRE_TYPE_CODE_MAPPING.get(code, code) for code in display_codes]
-        result = ', '.join(formatted_codes)
-        
-        # 더 많은 타입이 있으면 "외 N개" 추가
-        if len(sorted_codes) > 2:
-            additional_count = len(sorted_codes) - 2
-            result += f" 외 {additional_count}개"
-        
-        return result
+        """고용형태 코드를 한글로 변환"""
+        return format_hire_type(code_str)
 
     def format_category_display(self, policy: Dict) -> str:
-        """
-        정책 카테고리를 깔끔하게 표시 (중복 제거 강화)
-        """
-        large_category = policy.get("lclsfNm", "")  # 대분류
-        medium_category = policy.get("mclsfNm", "")  # 중분류
-        
-        # 🔥 강화된 중복 제거 로직
-        if large_category and medium_category:
-            # 1. 완전히 같은 경우
-            if large_category.strip() == medium_category.strip():
-                return large_category.strip()
-            
-            # 2. 콤마로 구분된 여러 값이 있는 경우 처리
-            large_parts = [part.strip() for part in large_category.split(',') if part.strip()]
-            medium_parts = [part.strip() for part in medium_category.split(',') if part.strip()]
-            
-            # 3. 대분류와 중분류에서 중복되는 부분 제거
-            unique_parts = []
-            
-            # 대분류 먼저 추가 (중복 제거)
-            for part in large_parts:
-                if part and part not in unique_parts:
-                    unique_parts.append(part)
-            
-            # 중분류에서 대분류와 중복되지 않는 것만 추가
-            for part in medium_parts:
-                if part and part not in unique_parts:
-                    unique_parts.append(part)
-            
-            # 4. 결과 반환
-            if len(unique_parts) == 1:
-                return unique_parts[0]
-            elif len(unique_parts) > 1:
-                return " > ".join(unique_parts)
-            else:
-                return large_category or medium_category or "기타"
-        
-        elif large_category:
-            # 대분류만 있는 경우, 콤마 분리된 중복 제거
-            parts = list(dict.fromkeys([part.strip() for part in large_category.split(',') if part.strip()]))
-            return parts[0] if len(parts) == 1 else ", ".join(parts)
-        
-        elif medium_category:
-            # 중분류만 있는 경우, 콤마 분리된 중복 제거  
-            parts = list(dict.fromkeys([part.strip() for part in medium_category.split(',') if part.strip()]))
-            return parts[0] if len(parts) == 1 else ", ".join(parts)
-        
-        else:
-            return "기타"
-    
+        """정책 카테고리를 깔끔하게 표시 (중복 제거)"""
+        return format_category_display(policy)
+
     async def search_comprehensive(self, query: str, region_code: str = "44790", max_price: Optional[int] = None) -> Dict[str, Any]:
         """요약 페이지용 - 전체 데이터 통합"""
         try:
@@ -194,9 +59,7 @@ class WebAPIHandler:
                 intent["region_mentioned"] = region_code
 
             parsed_price = self.chatbot._parse_price_from_text(query)
-            print(f"🔍 검색어: {query}")
-            print(f"🔍 파싱된 가격: {parsed_price}")
-            print(f"🔍 전달받은 max_price: {max_price}")
+            logger.debug("종합 검색 가격 조건", extra={"parsed_price": parsed_price, "max_price": max_price})
 
             if max_price:
                 intent["max_price"] = max_price
@@ -206,7 +69,7 @@ class WebAPIHandler:
                 if parsed_price:
                     intent["max_price"] = parsed_price
 
-            print(f"🔍 최종 intent[max_price]: {intent.get('max_price')}")
+            logger.debug("종합 검색 최종 가격 조건", extra={"intent_max_price": intent.get("max_price")})
             
             # 모든 타입 검색 강제
             intent["search_jobs"] = True
@@ -240,32 +103,19 @@ class WebAPIHandler:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
-    async def search_jobs_only(self, region_code: str, filters: Dict = None) -> Dict[str, Any]:
-        """일자리 페이지용 - final_chatbot.py와 동일한 로직 사용"""
+    async def search_jobs_only(self, region_code: str, filters: Dict = None, view: str = "full",
+                               fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """일자리 페이지용 - final_chatbot.py와 동일한 로직 사용 (view/fields로 응답 필드 선택)"""
         try:
-            # 🎯 final_chatbot.py와 정확히 같은 방식으로 채용정보 검색
-            job_result = self.orchestrator.call_recruitment_tool(
-                'listRecruitments',
-                {
-                    'pageNo': 1,
-                    'numOfRows': 50,  # final_chatbot.py와 동일
-                    'filters': {**filters} if filters else {}
-                }
-            )
-            
-            jobs = []
-            if job_result["status"] == "success":
-                raw_jobs = job_result["result"].get("data", {}).get("result", [])
-                
-                # 🎯 final_chatbot.py와 동일한 지역 필터링 및 정렬 적용
-                filtered_jobs = raw_jobs
-                if filters and "ncsCdLst" in filters:
-                    requested_code = filters["ncsCdLst"]
-                    filtered_jobs = [
-                        job for job in raw_jobs
-                        if requested_code in job.get("ncsCdLst", "")
-                    ]
-                jobs = self.chatbot.filter_and_sort_jobs_by_region(filtered_jobs, region_code)
+            selected = view_fields(JOB_VIEW_FIELDS, view, fields)
+            # 🎯 final_chatbot.py와 같은 전국 공통 조회 결과에서 지역별 결과를 꺼냄
+            #    (지역 필터링·직무분야 확인은 조회 시 한 번만 수행됨)
+            with stage("jobs_fetch"):
+                job_result = await asyncio.to_thread(self.chatbot.get_region_jobs, region_code, filters)
+            jobs = job_result["jobs"] if job_result["status"] == "success" else []
+            projections = job_result.get("projections")
+            # ⚠️ 조회 실패(차단기 열림 포함)는 빈 목록과 구분 - 응답 캐시에서 제외됨
+            upstream_error = job_result["status"] != "success"
             
             # 🎯 final_chatbot.py의 format_job_results 함수와 동일한 포맷팅을 JSON으로 변환
             formatted_jobs = []
@@ -274,77 +124,32 @@ class WebAPIHandler:
             # ✅ 표시용 광역명 (강원/전북/충남 고정)
             province_name = self.PROVINCE_BY_CODE.get(region_code, self.chatbot.get_region_name(region_code))
 
-            for i, job in enumerate(jobs[:20], 1):  # 상위 20개
-                title = job.get("recrutPbancTtl", "제목 없음")
-                company = job.get("instNm", "기관명 없음")
-                hire_type = job.get("hireTypeNmLst", "")
-                region = job.get("workRgnNmLst", "")
-                deadline = job.get("pbancEndYmd", "")
-                ncs_field = job.get("ncsCdNmLst", "")
-
-                # 🎯 학력요건 포맷팅 (개선된 로직 사용)
-                education_code = job.get("acbgCondLst", "")
-                formatted_education = self.format_education_requirement(education_code)
-                
-                # 🎯 고용형태 포맷팅 (개선된 로직 사용)
-                hire_type_code = job.get("hireTypeNmLst", "")
-                formatted_hire_type_detailed = self.format_hire_type(hire_type_code)
-                
-                # 🎯 기본 고용형태 (제목용, 간단하게)
-                basic_hire_type = hire_type.split(',')[0] if hire_type else ""
-                
-                # 마감일 포맷팅 (final_chatbot.py와 동일)
-                formatted_deadline = ""
-                if deadline and len(deadline) == 8:
-                    formatted_deadline = f"{deadline[:4]}.{deadline[4:6]}.{deadline[6:]}"
-                
-                # ✅ 표시 규칙: 항상 광역명 기준으로 요약
-                region_display = province_name
-                if region:
-                    region_count = region.count(',') + 1
-                    if region_count > 1:
-                        region_display = f"{province_name} 외 {region_count-1}개 지역"
+            with stage("format"):
+                for i, job in enumerate(jobs[:20], 1):  # 상위 20개
+                    # 🎯 표시용 필드는 적재 시 계산된 값을 재사용 - 순번/지역 표시만 여기서 붙임
+                    projection = job_projection(job, projections)
+
+                    # ✅ 표시 규칙: 항상 광역명 기준으로 요약
+                    region = job.get("workRgnNmLst", "")
+                    region_count = region.count(',') + 1 if region else 1
+                    region_display = f"{province_name} 외 {region_count-1}개 지역" if region_count > 1 else province_name
+
+                    extras = {
+                        "display_number": i,
+                        "display_title": f"{i}. {projection['formatted_company']} ({projection['formatted_hire_type']})",
+                        "formatted_region": region_display,
+                    }
+                    if selected is None:
+                        # 원본 데이터 유지 - formatted_region은 projection의 자리(formatted_hire_type 다음)에 채움
+                        formatted_job = {**job, "display_number": i, "display_title": extras["display_title"], **projection}
+                        formatted_job["formatted_region"] = region_display
+                        formatted_jobs.append(formatted_job)
                     else:
-                        region_display = province_name
-                
-                # final_chatbot.py와 동일한 구조로 포맷팅
-                formatted_job = {
-                    **job,  # 원본 데이터 유지
-
-                    # final_chatbot.py에서 표시하는 추가 정보들
-                    "display_number": i,
-                    "display_title": f"{i}. {company} ({hire_type})",
-                    "formatted_title": title,
-                    "formatted_company": company,
-                    "formatted_hire_type": hire_type,
-                    "formatted_region": region_display,
-                    "formatted_deadline": formatted_deadline if formatted_deadline else "미정",
-                    "formatted_ncs_field": ncs_field,
-                    "formatted_education": formatted_education,
-                    "formatted_hire_type_detailed": formatted_hire_type_detailed if formatted_hire_type_detailed != basic_hire_type else None,
-                    "education_code_original": education_code,  # 원본 코드 보존
-                    "hire_type_code_original": hire_type_code,   # 원본 코드 보존
-                                        
-                    # 추가 필드들
-                    "acbg_cond": job.get("acbgCondLst", ""),
-                    "career_cond": job.get("creerCondLst", ""),
-                    "major_field": job.get("mjrfldNmLst", ""),
-                    "recruit_count": job.get("rcritNmprCo", ""),
-                    "work_type": job.get("workTypeNmLst", ""),
-                    "salary_type": job.get("salaryTypeNmLst", ""),
-                    "contact_info": job.get("cntctNo", ""),
-                    "recruit_start_date": job.get("pbancBgngYmd", ""),
-                    "application_method": job.get("aplyMthdNmLst", ""),
-                    
-                    # 🆕 채용구분 추가 - 올바른 필드명 사용
-                    "recruit_type_code": job.get("recrutSe", ""),
-                    "formatted_recruit_type": job.get("recrutSeNm", "") or "미정"  # 빈 값일 때 "미정"
-                }
-                
-                formatted_jobs.append(formatted_job)
+                        formatted_jobs.append(pick_fields(selected, extras, projection, job))
             
             # 통계 계산 (final_chatbot.py의 _calculate_job_stats와 동일)
-            statistics = self._calculate_job_stats_detailed(jobs)
+            with stage("statistics"):
+                statistics = self._calculate_job_stats_detailed(jobs)
             
             return {
                 "success": True,
@@ -357,7 +162,8 @@ class WebAPIHandler:
                     "name": region_name
                 },
                 # final_chatbot.py 스타일 메시지 추가
-                "summary_message": f"📋 **{region_name} 지역의 채용정보를 찾을 수 없습니다.**" if not jobs else f"📋 **채용정보** (총 {len(jobs)}건, 지역 관련성 순)"
+                "summary_message": f"📋 **{region_name} 지역의 채용정보를 찾을 수 없습니다.**" if not jobs else f"📋 **채용정보** (총 {len(jobs)}건, 지역 관련성 순)",
+                "upstream_error": upstream_error
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -412,20 +218,25 @@ class WebAPIHandler:
     async def search_realestate_only(self, region_code: str, deal_ymd: str = "202506", max_price: Optional[int] = None) -> Dict[str, Any]:
         """부동산 페이지용 - 실거래가 전문"""
         try:
-            apt_result = self.orchestrator.call_realestate_tool(
-                'getApartmentTrades',
-                {
-                    'lawdcd': region_code,
-                    'deal_ymd': deal_ymd,
-                    'pageNo': 1,
-                    'numOfRows': 30
-                }
-            )
+            with stage("realestate_fetch"):
+                apt_result = await asyncio.to_thread(
+                    self.orchestrator.call_realestate_tool,
+                    'getApartmentTrades',
+                    {
+                        'lawdcd': region_code,
+                        'deal_ymd': deal_ymd,
+                        'pageNo': 1,
+                        'numOfRows': 30
+                    }
+                )
             
             properties = []
+            # ⚠️ 실거래가 API 실패(차단기 열림 포함)는 빈 목록과 구분 - 응답 캐시에서 제외됨
+            upstream_error = apt_result["status"] != "success" or apt_result["result"].get("status") == "error"
             if apt_result["status"] == "success":
                 apt_text = apt_result["result"].get("text", "")
-                properties = self.chatbot.parse_apartment_xml(apt_text)
+                with stage("parse_realestate"):
+                    properties = self.chatbot.parse_apartment_xml(apt_text)
 
                 # 가격 필터링 로직
                 if max_price and max_price > 0:
@@ -454,134 +265,86 @@ class WebAPIHandler:
                     "name": self.chatbot.get_region_name(region_code),
                     "lat": lat,
                     "lng": lng
-                }
+                },
+                "upstream_error": upstream_error
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     
-    async def search_policies_only(self, region_code: str, keywords: str = None, user_query: str = None) -> Dict[str, Any]:
+    async def search_policies_only(self, region_code: str, keywords: str = None, user_query: str = None,
+                                   defer_ai: bool = False, view: str = "full",
+                                   fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        result, _ = await self._search_policies(region_code, keywords, user_query, defer_ai, view, fields)
+        return result
 
-        # search_policies_only 함수 시작 부분에 추가
-        print(f"🤖 [DEBUG] search_policies_only 호출")
-        print(f"📍 [DEBUG] region_code: {region_code}")
-        print(f"💬 [DEBUG] user_query: {user_query}")
+    async def _search_policies(self, region_code: str, keywords: str = None, user_query: str = None,
+                               defer_ai: bool = False, view: str = "full",
+                               fields: Optional[List[str]] = None) -> Tuple[Dict[str, Any], List[Dict]]:
+        """정책 응답 + AI 분석 후보 (지역 필터만 거친 원본 목록 - run_policy_ai/지연 분석과 같은 입력)"""
+
+        logger.debug("search_policies_only", extra={"region_code": region_code, "has_user_query": bool(user_query),
+                                                    "defer_ai": defer_ai})
 
         policies = []
+        all_policies = []
         ai_analysis = None
         ai_insights = None
-
-        # AI 결과 처리 후 추가
-        if ai_analysis:
-            print(f"🤖 [DEBUG] AI 분석 결과 포함됨")
-        if ai_insights:
-            print(f"🤖 [DEBUG] AI 인사이트 포함됨")
+        analysis_id = None
 
         """정책 페이지용 - final_chatbot.py와 동일한 로직 사용"""
         try:
             # 🎯 final_chatbot.py와 정확히 같은 방식으로 정책 검색
-            policy_result = self.orchestrator.call_youth_policy_tool(
-                'searchPoliciesByRegion',
-                {
-                    'regionCode': region_code,
-                    'pageNum': 1,
-                    'pageSize': 30,
-                    'user_query': user_query
-                }
-            )
+            # ⏱️ defer_ai면 AI 없이 목록만 먼저 조회하고, AI 분석은 백그라운드 작업으로 분리
+            with stage("policies_fetch"):
+                policy_result = await asyncio.to_thread(
+                    self.orchestrator.call_youth_policy_tool,
+                    'searchPoliciesByRegion',
+                    {
+                        'regionCode': region_code,
+                        'pageNum': 1,
+                        'pageSize': 30,
+                        'user_query': None if defer_ai else user_query
+                    }
+                )
             
             policies = []
+            projections = None
+            # ⚠️ 조회 실패 또는 일부 검색어 실패(부분 결과)는 응답 캐시에서 제외됨
+            upstream_error = policy_result["status"] != "success" or \
+                policy_result["result"].get("status") == "error" or bool(policy_result["result"].get("failed_attempts"))
             if policy_result["status"] == "success":
                 all_policies = policy_result["result"].get("policies", [])
 
                 ai_analysis = policy_result["result"].get("ai_analysis")
                 ai_insights = policy_result["result"].get("ai_insights")
+                logger.debug("정책 AI 결과", extra={"ai_analysis": bool(ai_analysis), "ai_insights": bool(ai_insights)})
+
+                youth_server = self.orchestrator.youth_policy_server
+                if defer_ai and user_query and all_policies and youth_server.ai_enabled():
+                    future = youth_server.submit_policy_ai(user_query, all_policies, region_code)
+                    analysis_id = policy_analysis_jobs.submit(future)
+                    logger.debug("AI 분석 백그라운드 시작", extra={"analysis_id": analysis_id})
                 
                 # 🎯 final_chatbot.py와 동일한 필터링 적용
-                active_policies = self.chatbot.filter_active_policies(all_policies)
-                policies = self.chatbot.filter_and_sort_policies_by_region(active_policies, region_code)
+                with stage("active_filter"):
+                    active_policies = self.chatbot.filter_active_policies(all_policies)
+                with stage("region_sort"):
+                    policies = self.chatbot.filter_and_sort_policies_by_region(active_policies, region_code)
+                # 🎯 광역 정책 캐시 항목에 함께 적재된 표시용 필드
+                projections = youth_server.province_policy_projections(region_code)
             
             # 🎯 final_chatbot.py의 format_policy_results 함수와 동일한 포맷팅을 JSON으로 변환
+            selected = view_fields(POLICY_VIEW_FIELDS, view, fields)
             formatted_policies = []
-            for i, policy in enumerate(policies[:30], 1):  # 상위 30개
-                
-                # 날짜 포맷팅 함수 (final_chatbot.py와 동일)
-                def format_date(date_str):
-                    if date_str and len(date_str) == 8 and date_str.isdigit():
-                        return f"{date_str[:4]}년 {date_str[4:6]}월 {date_str[6:]}일"
-                    return date_str
-
-                def format_apply_period(apply_str):
-                    if not apply_str:
-                        return ""
-                    if " ~ " in apply_str:
-                        dates = apply_str.split(" ~ ")
-                        if len(dates) == 2:
-                            start_formatted = format_date(dates[0].strip())
-                            end_formatted = format_date(dates[1].strip())
-                            return f"{start_formatted} ~ {end_formatted}"
-                    return format_date(apply_str)
-
-                # 사업 기간 계산
-                business_start = policy.get("bizPrdBgngYmd", "")
-                business_end = policy.get("bizPrdEndYmd", "")
-                business_period = ""
-                if business_start and business_end:
-                    if business_start.strip() and business_end.strip() and business_start != "00000000" and business_end != "00000000":
-                        business_period = f"{format_date(business_start)} ~ {format_date(business_end)}"
-                elif business_start and business_start.strip() and business_start != "00000000":
-                    business_period = f"{format_date(business_start)} ~"
-                elif business_end and business_end.strip() and business_end != "00000000":
-                    business_period = f"~ {format_date(business_end)}"
-
-                # 적용 범위 계산 (final_chatbot.py와 동일)
-                zip_codes = policy.get('zipCd', '')
-                if zip_codes:
-                    region_count = len(zip_codes.split(',')) if ',' in zip_codes else 1
-                    if region_count >= 50:
-                        scope_display = f"전국 ({region_count}개 지역)"
-                    elif region_count > 10:
-                        scope_display = f"광역 ({region_count}개 지역)"
-                    elif region_count > 1:
-                        scope_display = f"다지역 ({region_count}개 지역)"
+            with stage("format"):
+                for i, policy in enumerate(policies[:30], 1):  # 상위 30개
+                    # 🎯 표시용 필드는 적재 시 계산된 값을 재사용 - 순번만 여기서 붙임
+                    extras = {"display_title": f"{i}. {policy.get('plcyNm', '정책명 없음')}"}
+                    if selected is None:
+                        formatted_policies.append({**policy, **extras, **policy_projection(policy, projections)})  # 원본 데이터 유지
                     else:
-                        scope_display = "지역특화"
-                else:
-                    scope_display = "범위미상"
-
-                # 신청 기간 포맷팅
-                apply_period = policy.get("aplyYmd", "")
-                formatted_apply_period = format_apply_period(apply_period) if apply_period else ""
-
-                # 상세 링크 생성
-                policy_no = policy.get("plcyNo", "")
-                detail_url = f"https://www.youthcenter.go.kr/youthPolicy/ythPlcyTotalSearch/ythPlcyDetail/{policy_no}" if policy_no else ""
-
-                # 🔥 카테고리 중복 제거 로직
-                category_display = self.format_category_display(policy)
-
-                # final_chatbot.py와 동일한 구조로 포맷팅
-                formatted_policy = {
-                    **policy,  # 원본 데이터 유지
-                    
-                    # final_chatbot.py에서 표시하는 추가 정보들
-                    "display_title": f"{i}. {policy.get('plcyNm', '정책명 없음')}",
-                    "formatted_explanation": policy.get('plcyExplnCn', '설명 없음'),
-                    "category_display": category_display,  # 🔥 수정된 부분
-                    "scope_display": scope_display,
-                    "keywords_display": policy.get('plcyKywdNm', ''),
-                    "institution_display": policy.get('sprvsnInstCdNm', ''),
-                    "support_content_display": policy.get('plcySprtCn', ''),
-                    "business_period_display": business_period,
-                    "apply_period_display": formatted_apply_period if formatted_apply_period else "상시접수",
-                    "support_scale_display": f"{policy.get('sprtSclCnt', '0')}명" if policy.get('sprtSclCnt') and policy.get('sprtSclCnt') != "0" else "",
-                    "apply_method_display": policy.get('plcyAplyMthdCn', ''),
-                    "additional_conditions_display": policy.get('addAplyQlfcCndCn', ''),
-                    "participation_target_display": policy.get('ptcpPrpTrgtCn', ''),
-                    "detail_url": detail_url
-                }
-                
-                formatted_policies.append(formatted_policy)
+                        formatted_policies.append(pick_fields(selected, extras, policy_projection(policy, projections), policy))
             
             return {
                 "success": True,
@@ -594,10 +357,86 @@ class WebAPIHandler:
                     "name": self.chatbot.get_region_name(region_code)
                 },
                 "ai_analysis": ai_analysis if ai_analysis else None,
-                "ai_insights": ai_insights if ai_insights else None
-            }
+                "ai_insights": ai_insights if ai_insights else None,
+                "analysis_id": analysis_id,  # ⏱️ 지연 AI 분석 조회용 (없으면 None)
+                "upstream_error": upstream_error
+            }, all_policies
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return {"success": False, "error": str(e)}, []
+
+    async def get_policy_analysis(self, analysis_id: str, wait: float = 0) -> Dict[str, Any]:
+        """지연된 정책 AI 분석 결과 조회 - wait초 동안 완료를 기다림 (롱폴링)"""
+        future = policy_analysis_jobs.get(analysis_id)
+        if future is None:
+            return {"success": False, "error": f"분석 작업을 찾을 수 없습니다: {analysis_id}"}
+
+        if wait > 0 and not future.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout=wait)
+            except Exception:
+                pass  # 시간 초과/오류는 아래 상태 조회로 처리
+
+        state = policy_analysis_jobs.describe(future)
+        response = {
+            "success": True,
+            "analysis_id": analysis_id,
+            "status": state["status"],
+            "ai_analysis": None,
+            "ai_insights": None
+        }
+        if state["status"] == "done":
+            ai_analysis, ai_insights = state["result"]
+            # 기존 /api/search/policies 응답과 동일한 포함 조건
+            if ai_analysis and ai_analysis.get("ai_enhanced"):
+                response["ai_analysis"] = ai_analysis
+            if ai_insights and ai_insights.get("insights_available"):
+                response["ai_insights"] = ai_insights
+        elif state["status"] == "error":
+            response["error"] = state["error"]
+        return response
+
+    async def stream_policies(self, region_code: str, keywords: str = None, user_query: str = None,
+                              view: str = "full", fields: Optional[List[str]] = None):
+        """
+        정책 페이지 스트리밍 - (event, data)를 순서대로 생성
+        - policies: 정책 목록 (AI 없이 즉시, view/fields 적용)
+        - recommendation: AI 맞춤 추천 항목 (토큰 도착 순)
+        - ai_analysis / ai_insights: 최종 AI 결과
+        - done
+        """
+        # AI 분석에는 원본 필드가 필요하므로 전체로 조회한 뒤 응답만 view에 맞게 줄임
+        result, candidates = await self._search_policies(region_code, keywords=keywords, user_query=None)
+        policies = result.get("policies") or []
+        selected = view_fields(POLICY_VIEW_FIELDS, view, fields)
+        if selected is None:
+            yield "policies", result
+        else:
+            yield "policies", {**result, "policies": [pick_fields(selected, policy) for policy in policies]}
+
+        youth_server = self.orchestrator.youth_policy_server
+        # 🎯 AI 후보는 run_policy_ai와 같은 지역 필터 결과 원본 (표시용 상위 30개가 아님)
+        if user_query and candidates and youth_server.ai_enabled("stream"):
+            # ⏱️ 추천 스트리밍 + 인사이트를 합쳐 AI_DEADLINE 안에 끝냄 (비스트리밍 경로와 같은 상한)
+            loop = asyncio.get_running_loop()
+            deadline_at = loop.time() + youth_server.AI_DEADLINE
+
+            # 인사이트는 추천 스트리밍과 동시에 백그라운드로 생성
+            insights_future = youth_server.submit_policy_insights(candidates, region_code)
+
+            stream = youth_server.stream_policy_analysis_async(user_query, candidates, region_code,
+                                                              deadline=youth_server.AI_DEADLINE)
+            async for event, data in youth_server.iterate_on_ai_loop(stream):
+                yield ("ai_analysis" if event == "analysis" else event), data
+
+            try:
+                ai_insights = await asyncio.wait_for(asyncio.wrap_future(insights_future),
+                                                     timeout=max(deadline_at - loop.time(), 0))
+            except Exception as e:
+                logger.warning("스트리밍 인사이트 오류 - 기본 결과로 대체: %s", str(e) or "마감 시간 초과")
+                ai_insights = youth_server._fallback_policy_insights(candidates, self.chatbot.get_region_name(region_code))
+            yield "ai_insights", ai_insights
+
+        yield "done", {"success": True}
 
     async def _get_raw_data(self, intent: Dict[str, Any]) -> Dict[str, Any]:
         """원시 데이터 수집"""
@@ -607,36 +446,20 @@ class WebAPIHandler:
         
         # 채용정보
         if intent["search_jobs"]:
-            job_result = self.orchestrator.call_recruitment_tool(
-                'listRecruitments',
-                {'pageNo': 1, 'numOfRows': 50, 'filters': intent.get("filters", {})} #rows : 종합 분석 란에 보일 개수
-            )
+            job_result = await asyncio.to_thread(self.chatbot.get_region_jobs, region_code, intent.get("filters", {}))
             if job_result["status"] == "success":
-                raw_jobs = job_result["result"].get("data", {}).get("result", [])
-
-                filtered_jobs = raw_jobs
-                job_filters = intent.get("filters", {})
-                if job_filters and "ncsCdLst" in job_filters:
-                    requested_code = job_filters["ncsCdLst"]
-                    filtered_jobs = [
-                        job for job in raw_jobs
-                        if requested_code in job.get("ncsCdLst", "")
-                    ]
-
-                results["jobs"] = self.chatbot.filter_and_sort_jobs_by_region(filtered_jobs, region_code)
+                results["jobs"] = job_result["jobs"]
         
         # 부동산
         if intent["search_realestate"]:
-            apt_result = self.orchestrator.call_realestate_tool(
-                'getApartmentTrades',
+            apt_result = await asyncio.to_thread(
+                self.orchestrator.call_realestate_tool, 'getApartmentTrades',
                 {'lawdcd': region_code, 'deal_ymd': "202506", 'pageNo': 1, 'numOfRows': 15}
             )
             if apt_result["status"] == "success":
                 apt_text = apt_result["result"].get("text", "")
                 properties = self.chatbot.parse_apartment_xml(apt_text)
 
-                print(f"🏠 필터링 전 매물 수: {len(properties)}")  # 추가
-                print(f"🏠 필터링할 최대가격: {max_price}")  # 추가
 
                 # 🆕 가격 필터링 로직 추가
                 intent_max_price = intent.get("max_price")  # 변수명 변경
@@ -646,13 +469,14 @@ class WebAPIHandler:
                         prop for prop in properties
                         if int(prop.get("dealAmount", "0").replace(",", "")) <= intent_max_price
                     ]
-                    print(f"🏠 필터링 후 매물 수: {len(properties)}")
+                    logger.debug("매물 가격 필터링", extra={"before": original_count, "after": len(properties),
+                                                        "max_price": intent_max_price})
                 results["realestate"] = properties
         
         # 정책
         if intent["search_policies"]:
-            policy_result = self.orchestrator.call_youth_policy_tool(
-                'searchPoliciesByRegion',
+            policy_result = await asyncio.to_thread(
+                self.orchestrator.call_youth_policy_tool, 'searchPoliciesByRegion',
                 {'regionCode': region_code, 'pageNum': 1, 'pageSize': 20}
             )
             if policy_result["status"] == "success":
@@ -1,41 +1,57 @@
 # youth_policy_server.py — AI 활용 청소년정책 MCP 서버 (타임아웃 최적화 버전)
 import os
-import ssl
 import json
-from typing import Any, Dict, Optional, Tuple, Iterable, List
+import logging
+import asyncio
+import threading
+from typing import Any, Dict, Optional, Tuple, List
 
-import httpx
-from dotenv import load_dotenv
-from mcp.server.fastmcp import FastMCP
-
-# 🤖 AI 라이브러리 추가
+# 🤖 AI 백엔드 (OpenAI / 로컬 대체 백엔드 - AI_PROVIDER 환경변수로 선택)
 try:
-    from openai import OpenAI
-    AI_AVAILABLE = True
-except ImportError:
-    AI_AVAILABLE = False
-    print("⚠️ OpenAI not installed. Running in basic mode.")
+    from .ai_providers import get_ai_provider, provider_name_for, REQUEST_CLASSES
+    from .prompt_builder import build_policy_analysis_prompt
+    from .cache import TTLCache
+    from .bootstrap import load_env_once, LazyFastMCP
+    from .projections import precompute_policies
+    from .metrics import ai_call
+    from .timing import stage
+    from .logging_setup import current_request_id, get_logger, with_request_id
+    from .upstream import resolve_api_key, resolve_base_url, try_get
+except ImportError:  # 단독 MCP 서버로 실행하는 경우
+    from ai_providers import get_ai_provider, provider_name_for, REQUEST_CLASSES
+    from prompt_builder import build_policy_analysis_prompt
+    from cache import TTLCache
+    from bootstrap import load_env_once, LazyFastMCP
+    from projections import precompute_policies
+    from metrics import ai_call
+    from timing import stage
+    from logging_setup import current_request_id, get_logger, with_request_id
+    from upstream import resolve_api_key, resolve_base_url, try_get
+
+load_env_once()
+
+logger = get_logger("youth_policy")
+
+# FastMCP 인스턴스는 mcp.run() 시점에 생성 (웹 API에서는 도구 함수만 직접 호출)
+mcp = LazyFastMCP("youth-policy-mcp")
 
-load_dotenv()
+# 기존 설정들 그대로 유지
+BASE_URL = resolve_base_url("YOUTH_BASE_URL", "https://www.youthcenter.go.kr/go/ythip/getPlcy", "youthcenter/getPlcy")
+API_KEY = resolve_api_key("YOUTH_API_KEY", "55930c52-9e2e-42ba-9aec-f562fc10cd09")
 
-mcp = FastMCP("youth-policy-mcp")
+# 🗂️ 광역(도) 단위 정책 캐시 유지 시간(초)
+POLICY_CACHE_TTL = float(os.getenv("POLICY_CACHE_TTL_SECONDS") or 600)
+# 광역 조회 페이지 크기(고정 - 호출 측 pageNum/pageSize와 무관하게 한 번만 적재)와
+# 검색어 하나당 최대 페이지 수 (totCount를 다 받으면 중단)
+POLICY_PROVINCE_PAGE_SIZE = int(os.getenv("POLICY_PROVINCE_PAGE_SIZE") or 100)
+POLICY_PROVINCE_MAX_PAGES = int(os.getenv("POLICY_PROVINCE_MAX_PAGES") or 10)
 
-# 기존 설정들 그대로 유지
-BASE_URL = (os.getenv("YOUTH_BASE_URL") or "https://www.youthcenter.go.kr/go/ythip/getPlcy").rstrip("/")
-API_KEY = (os.getenv("YOUTH_API_KEY") or "55930c52-9e2e-42ba-9aec-f562fc10cd09").strip()
+# 🤖 AI 전체 마감 시간(초) - 분석/인사이트 두 호출을 합친 상한
+AI_DEADLINE = float(os.getenv("AI_DEADLINE_SECONDS") or 20)
 
-# 🤖 AI 클라이언트 초기화
-openai_client = None
-if AI_AVAILABLE and os.getenv("OPENAI_API_KEY"):
-    try:
-        openai_client = OpenAI(
-            api_key=os.getenv("OPENAI_API_KEY"),
-            timeout=30.0  # OpenAI 클라이언트 타임아웃 설정
-        )
-        print("✅ AI 분석 모드 활성화")
-    except Exception as e:
-        print(f"⚠️ AI 초기화 실패: {e}")
-        openai_client = None
+def ai_enabled(request_class: str = "analysis") -> bool:
+    """해당 요청 분류에 사용할 AI 백엔드가 설정되어 있는지"""
+    return get_ai_provider(request_class) is not None
 
 # 기존 지역 매핑 그대로 유지
 REGION_MAPPING = {
@@ -61,143 +77,244 @@ REGION_MAPPING = {
     }
 }
 
-# 기존 HTTP 클라이언트 함수들 그대로 유지
-def _client_candidates() -> Iterable[Tuple[str, httpx.Client]]:
-    yield "default", httpx.Client(http2=False, timeout=30, trust_env=True)
-    try:
-        tls = ssl.create_default_context()
-        tls.minimum_version = ssl.TLSVersion.TLSv1_2
-        try: tls.set_ciphers("DEFAULT:@SECLEVEL=1")
-        except Exception: pass
-        yield "tls12_seclevel1", httpx.Client(verify=tls, http2=False, timeout=30, trust_env=True)
-    except Exception: pass
-    yield "insecure", httpx.Client(verify=False, http2=False, timeout=30, trust_env=True)
-
-def _try_get(url: str, params: Dict[str, Any]):
-    last_err: Optional[Exception] = None
-    for mode, client in _client_candidates():
-        try:
-            with client as c: return c.get(url, params=params)
-        except Exception as e: last_err = e
-    if last_err: raise last_err
-    raise RuntimeError("No HTTP client candidates available")
-
-# 기존 API 호출 함수 그대로 유지
-def call_youth_api_enhanced(page_num: int = 1, page_size: int = 100, search_attempts: List[str] = None):
+# 기존 API 호출 함수 그대로 유지 (max_pages > 1이면 totCount까지 다음 페이지도 조회)
+def call_youth_api_enhanced(page_num: int = 1, page_size: int = 100, search_attempts: List[str] = None,
+                            max_pages: int = 1):
     if not API_KEY: return {"status": "error", "message": "YOUTH_API_KEY is missing"}
     all_policies = []
+    failed_attempts = 0
+    last_error = None
     for filters in (search_attempts or [{}]):
-        params = {"apiKeyNm": API_KEY, "pageNum": page_num, "pageSize": page_size, "rtnType": "json", **(filters or {})}
-        try:
-            resp = _try_get(BASE_URL, params)
-            resp.raise_for_status()
-            json_data = resp.json()
-            if json_data.get("resultCode") == 200:
-                policies = json_data.get("result", {}).get("youthPolicyList", [])
-                if policies: all_policies.extend(policies)
-        except Exception as e:
-            print(f"API 호출 오류: {e}")
+        for page in range(page_num, page_num + max_pages):
+            params = {"apiKeyNm": API_KEY, "pageNum": page, "pageSize": page_size, "rtnType": "json", **(filters or {})}
+            try:
+                with stage("upstream_youth"):
+                    _, resp = try_get(BASE_URL, params, timeout=30)
+                resp.raise_for_status()
+                with stage("parse_youth"):
+                    json_data = resp.json()
+            except Exception as e:
+                failed_attempts += 1
+                last_error = str(e)
+                logger.warning("청년정책 API 호출 오류: %s", e, extra={"filters": sorted(filters or {}), "page": page})
+                break
+            if json_data.get("resultCode") != 200:
+                break
+            result = json_data.get("result", {})
+            policies = result.get("youthPolicyList", [])
+            if policies: all_policies.extend(policies)
+            total = (result.get("pagging") or {}).get("totCount") or 0
+            if len(policies) < page_size or page * page_size >= total:
+                break
     unique_policies = {p['plcyNo']: p for p in all_policies if p.get('plcyNo')}
     final_policies = list(unique_policies.values())
-    return {"status": "ok" if final_policies else "no_results", "policies": final_policies}
+    if not final_policies and failed_attempts:
+        return {"status": "error", "message": last_error, "policies": [], "failed_attempts": failed_attempts}
+    # failed_attempts > 0이면 일부 검색어 결과가 빠진 부분 결과 (캐시하지 않음)
+    return {"status": "ok" if final_policies else "no_results", "policies": final_policies,
+            "failed_attempts": failed_attempts}
+
+# 🗂️ 광역(도) 단위 조회 - 같은 도의 시·군은 한 번 받은 결과를 나눠서 사용
+_province_policy_cache = TTLCache("youth_province_policies", ttl_seconds=POLICY_CACHE_TTL, maxsize=64)
+
+def _province_region_codes(region_code: str) -> List[str]:
+    """같은 광역(province_keywords)에 속한 지원 지역 코드들"""
+    province = REGION_MAPPING[region_code]["province_keywords"]
+    return [code for code, info in REGION_MAPPING.items() if info["province_keywords"] == province]
+
+def _filter_policies_for_region(policies: List[Dict], region_info: Dict[str, Any]) -> List[Dict]:
+    """대상 시·군 키워드가 있으면 포함, 다른 시·군만 언급하면 제외, 나머지(도 단위)는 포함"""
+    target_keyword = region_info["keywords"][0]
+    sibling_keywords = set(region_info.get("sibling_city_keywords", []))
+
+    filtered_policies = []
+    for policy in policies:
+        full_text = " ".join(filter(None, [
+            policy.get("plcyNm", ""),
+            policy.get("plcyExplnCn", ""),
+            policy.get("cnsgNmor", ""),
+        ]))
+
+        if target_keyword in full_text:
+            filtered_policies.append(policy)
+            continue
+
+        if any(sibling in full_text for sibling in sibling_keywords):
+            continue
+        
+        filtered_policies.append(policy)
+    return filtered_policies
+
+def _province_cache_key(region_code: str, categories: Optional[str]) -> Tuple:
+    return tuple(REGION_MAPPING[region_code]["province_keywords"]), categories or ""
+
+def fetch_province_policies(region_code: str, categories: Optional[str] = None) -> Dict[str, Any]:
+    """
+    광역(도) 단위로 정책을 한 번만 조회/캐시하고 시·군별 결과로 분할.
+    - 도 키워드 + 도 단위 zipCd 한 번으로 조회 (고정 페이지 크기로 totCount까지) → 도 안의 지원 시·군이 늘어도 API 호출 수는 같음
+    - 캐시 키는 도와 분류(categories)뿐 - 호출 측 pageNum/pageSize는 지역 목록을 자를 때 적용
+    - by_region: {지역코드: 필터링된 정책 목록}, projections: {정책번호: 표시용 필드}
+    - 검색어 중 하나라도 실패하면 부분 결과로 표시(failed_attempts)하고 캐시하지 않음
+    """
+    codes = _province_region_codes(region_code)
+    province_keywords = REGION_MAPPING[region_code]["province_keywords"]
+    cache_key = _province_cache_key(region_code, categories)
+
+    def load():
+        # 도 키워드(정책명) + 도 안 지원 시·군의 법정시군구코드(zipCd, 쉼표 구분) 한 번
+        #  → 시·군 이름으로만 된 정책("강릉시 ...")도 빠지지 않고, 시·군이 늘어도 호출 수는 같음
+        search_attempts = [{"plcyNm": keyword} for keyword in province_keywords] + [{"zipCd": ",".join(codes)}]
+        if categories:
+            for base_filter in search_attempts: base_filter["lclsfNm"] = categories
+
+        logger.debug("광역 정책 조회", extra={"province": province_keywords[0], "search_attempts": len(search_attempts),
+                                           "regions": len(codes)})
+        api_result = call_youth_api_enhanced(page_size=POLICY_PROVINCE_PAGE_SIZE, search_attempts=search_attempts,
+                                             max_pages=POLICY_PROVINCE_MAX_PAGES)
+        if api_result["status"] != "ok":
+            return api_result
+        policies = api_result["policies"]
+        # 표시용 필드는 적재 시 한 번만 계산 (도 내 모든 지역·요청에서 재사용)
+        with stage("projection"):
+            projections = precompute_policies(policies)
+        with stage("region_filter"):
+            by_region = {code: _filter_policies_for_region(policies, REGION_MAPPING[code]) for code in codes}
+        return {
+            "status": "ok",
+            "original_count": len(policies),
+            "by_region": by_region,
+            "projections": projections,
+            "failed_attempts": api_result["failed_attempts"]
+        }
+
+    # 조회 실패/결과 없음/부분 결과는 캐시하지 않음 (다음 요청에서 다시 시도)
+    return _province_policy_cache.get_or_load(
+        cache_key, load, cache_if=lambda r: r["status"] == "ok" and not r["failed_attempts"])
+
+def province_policy_projections(region_code: str, categories: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """캐시된 광역 정책 묶음의 표시용 필드 (캐시에 없으면 빈 dict - 호출 측에서 계산, API 호출 없음)"""
+    if region_code not in REGION_MAPPING:
+        return {}
+    entry = _province_policy_cache.get(_province_cache_key(region_code, categories))
+    return entry["projections"] if entry else {}
+
+# 🤖 AI 전용 이벤트 루프 (동기 MCP 도구에서도 비동기 OpenAI 호출을 동시에 실행)
+_ai_loop: Optional[asyncio.AbstractEventLoop] = None
+_ai_loop_lock = threading.Lock()
+
+def _get_ai_loop() -> asyncio.AbstractEventLoop:
+    """백그라운드 스레드에서 도는 AI 전용 이벤트 루프 (최초 호출 시 1회 생성)"""
+    global _ai_loop
+    with _ai_loop_lock:
+        if _ai_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="ai-loop", daemon=True).start()
+            _ai_loop = loop
+    return _ai_loop
+
+def _submit_to_ai_loop(coro):
+    """AI 루프에 코루틴 제출 (로그에 호출한 요청의 ID가 이어지도록)"""
+    return asyncio.run_coroutine_threadsafe(with_request_id(current_request_id(), coro), _get_ai_loop())
+
+def _run_on_ai_loop(coro, timeout: Optional[float] = None):
+    """코루틴을 AI 루프에서 실행하고 결과를 동기적으로 기다림"""
+    future = _submit_to_ai_loop(coro)
+    try:
+        return future.result(timeout)
+    except Exception:
+        future.cancel()
+        raise
+
+# 🚀 오류/시간초과 시 사용할 기본 결과 (AI 없이도 유용한 정보 제공)
+def _fallback_policy_analysis(policies: List[Dict], region_name: str) -> Dict[str, Any]:
+    return {
+        "ai_enhanced": True,
+        "analysis": {
+            "맞춤_추천": [
+                {
+                    "정책명": policies[0].get("plcyNm", "첫 번째 정책") if policies else "정책 없음",
+                    "추천_이유": f"{region_name} 지역 정책 중 가장 관련성이 높습니다",
+                    "우선순위": 1,
+                    "예상_혜택": "지역 특화 지원"
+                }
+            ],
+            "종합_분석": f"{region_name} 지역의 청년정책이 {len(policies)}개 확인되었습니다.",
+            "주의사항": "신청 기간과 자격 요건을 반드시 확인하세요.",
+            "다음_단계": "관심 정책의 상세 정보를 확인하고 신청 준비를 시작하세요."
+        },
+        "processed_policies": min(len(policies), 5),
+        "confidence": "기본 추천 (AI 오류로 인한 대체)",
+        "fallback": True  # AI 결과가 아님 - 응답 캐시에서 제외
+    }
+
+def _fallback_policy_insights(policies: List[Dict], region_name: str) -> Dict[str, Any]:
+    return {
+        "insights_available": True,
+        "insights": {
+            "지역_특징": f"{region_name}의 청년정책 현황",
+            "강점": "다양한 분야의 정책 지원",
+            "개선점": "정책 홍보 강화 필요",
+            "추천_전략": "관심 분야 정책부터 차근차근 확인",
+            "시장_점수": 6,
+            "한줄_요약": f"총 {len(policies)}개 정책으로 지원 가능"
+        },
+        "statistics": {
+            "total_policies": len(policies),
+            "category_distribution": {}
+        },
+        "fallback": True  # AI 결과가 아님 - 응답 캐시에서 제외
+    }
+
+def _build_policy_analysis_prompt(user_query: str, policies: List[Dict], region_name: str) -> Tuple[str, List[Dict], Dict[str, Any]]:
+    """맞춤 분석 프롬프트 생성 - 질문 관련도 순으로 토큰 예산만큼 정책을 채움 (prompt, 요약, 지표)"""
+    return build_policy_analysis_prompt(user_query, policies, region_name)
 
 # 🤖 AI 분석 함수들 - 최적화 버전
-def ai_analyze_policies_for_user(user_query: str, policies: List[Dict], region_code: str) -> Dict[str, Any]:
-    """AI를 활용한 정책 맞춤 분석 - 최적화 버전"""
-    if not openai_client or not policies:
+async def ai_analyze_policies_for_user_async(user_query: str, policies: List[Dict], region_code: str) -> Dict[str, Any]:
+    """AI를 활용한 정책 맞춤 분석 - 비동기 버전"""
+    provider = get_ai_provider("analysis")
+    if not provider or not policies:
         return {"ai_enhanced": False, "reason": "AI 비활성화 또는 정책 없음"}
     
+    region_name = REGION_MAPPING.get(region_code, {}).get("name", "해당 지역")
     try:
-        print(f"🤖 [AI-DEBUG] AI 분석 시작 - 정책 {len(policies)}개 처리")
-        region_name = REGION_MAPPING.get(region_code, {}).get("name", "해당 지역")
+        prompt, policy_summaries, prompt_metrics = _build_policy_analysis_prompt(user_query, policies, region_name)
+        logger.debug("AI 분석 호출", extra={"provider": provider.name, "policies": len(policies), **prompt_metrics})
         
-        # 🚀 정책 요약 최적화 (5개만 분석 + 더 짧은 설명)
-        policy_summaries = []
-        for policy in policies[:5]:  # 10개 → 5개로 줄임
-            summary = {
-                "이름": policy.get("plcyNm", ""),
-                "설명": policy.get("plcyExplnCn", "")[:80],  # 200자 → 80자로 줄임
-                "분야": policy.get("lclsfNm", ""),
-                "지원내용": policy.get("plcySprtCn", "")[:50],  # 100자 → 50자로 줄임
-            }
-            policy_summaries.append(summary)
-        
-        # 🚀 더 간결한 프롬프트
-        prompt = f"""
-사용자: "{user_query}"
-지역: {region_name}
-정책: {json.dumps(policy_summaries, ensure_ascii=False)}
-
-JSON만 답변:
-{{
-    "맞춤_추천": [
-        {{
-            "정책명": "이름",
-            "추천_이유": "간단한 이유",
-            "우선순위": 1,
-            "예상_혜택": "혜택"
-        }}
-    ],
-    "종합_분석": "한 줄 분석",
-    "주의사항": "주요 주의점",
-    "다음_단계": "다음 행동"
-}}
-"""
-
-        print(f"🤖 [AI-DEBUG] OpenAI API 호출 시작")
-        
-        # 🚀 더 빠른 모델 사용 + 짧은 응답
-        response = openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",  # gpt-4 → gpt-3.5-turbo로 변경 (더 빠름)
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.5,  # 0.7 → 0.5로 줄임
-            max_tokens=600,   # 1500 → 600으로 줄임
-            timeout=25        # 25초 타임아웃 설정
-        )
+        # 🚀 짧은 응답 (모델은 백엔드 설정을 따름)
+        with ai_call(provider.name, "analysis"):
+            content = await provider.complete(
+                "analysis", prompt,
+                {"user_query": user_query, "region_name": region_name, "policy_summaries": policy_summaries},
+                temperature=0.5,  # 0.7 → 0.5로 줄임
+                max_tokens=600,   # 1500 → 600으로 줄임
+                timeout=25        # 25초 타임아웃 설정
+            )
         
-        print(f"🤖 [AI-DEBUG] OpenAI API 응답 완료")
         
-        ai_analysis = json.loads(response.choices[0].message.content)
+        ai_analysis = json.loads(content)
         
-        print(f"🤖 [AI-DEBUG] AI 분석 성공!")
         
         return {
             "ai_enhanced": True,
             "analysis": ai_analysis,
             "processed_policies": len(policy_summaries),
+            "prompt_metrics": prompt_metrics,
             "confidence": "빠른 AI 분석"
         }
         
     except Exception as e:
-        print(f"🤖 [AI-ERROR] AI 분석 오류: {e}")
-        # 🚀 오류 시 기본 추천 반환 (AI 없이도 유용한 정보 제공)
-        return {
-            "ai_enhanced": True,
-            "analysis": {
-                "맞춤_추천": [
-                    {
-                        "정책명": policies[0].get("plcyNm", "첫 번째 정책") if policies else "정책 없음",
-                        "추천_이유": f"{region_name} 지역 정책 중 가장 관련성이 높습니다",
-                        "우선순위": 1,
-                        "예상_혜택": "지역 특화 지원"
-                    }
-                ],
-                "종합_분석": f"{region_name} 지역의 청년정책이 {len(policies)}개 확인되었습니다.",
-                "주의사항": "신청 기간과 자격 요건을 반드시 확인하세요.",
-                "다음_단계": "관심 정책의 상세 정보를 확인하고 신청 준비를 시작하세요."
-            },
-            "processed_policies": min(len(policies), 5),
-            "confidence": "기본 추천 (AI 오류로 인한 대체)"
-        }
+        logger.warning("AI 분석 오류 - 기본 결과로 대체: %s", e)
+        return _fallback_policy_analysis(policies, region_name)
 
-def ai_generate_policy_insights(policies: List[Dict], region_code: str) -> Dict[str, Any]:
-    """정책 현황에 대한 AI 인사이트 생성 - 간소화 버전"""
-    if not openai_client or not policies:
+async def ai_generate_policy_insights_async(policies: List[Dict], region_code: str) -> Dict[str, Any]:
+    """정책 현황에 대한 AI 인사이트 생성 - 비동기 버전"""
+    provider = get_ai_provider("insights")
+    if not provider or not policies:
         return {"insights_available": False}
     
+    region_name = REGION_MAPPING.get(region_code, {}).get("name", "해당 지역")
     try:
-        print(f"🤖 [AI-DEBUG] AI 인사이트 생성 시작")
-        region_name = REGION_MAPPING.get(region_code, {}).get("name", "해당 지역")
         
         # 🚀 간단한 통계만 사용
         total_count = len(policies)
@@ -221,20 +338,20 @@ JSON만:
 }}
 """
         
-        print(f"🤖 [AI-DEBUG] 인사이트 OpenAI API 호출")
+        logger.debug("AI 인사이트 호출", extra={"provider": provider.name, "policies": total_count})
         
-        # 🚀 빠른 모델 + 짧은 응답
-        response = openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": stats_prompt}],
-            temperature=0.3,
-            max_tokens=300,
-            timeout=20  # 20초 타임아웃
-        )
+        # 🚀 짧은 응답
+        with ai_call(provider.name, "insights"):
+            content = await provider.complete(
+                "insights", stats_prompt,
+                {"region_name": region_name, "total_count": total_count, "categories": categories},
+                temperature=0.3,
+                max_tokens=300,
+                timeout=20  # 20초 타임아웃
+            )
         
-        print(f"🤖 [AI-DEBUG] 인사이트 생성 완료")
         
-        insights = json.loads(response.choices[0].message.content)
+        insights = json.loads(content)
         
         return {
             "insights_available": True,
@@ -246,23 +363,193 @@ JSON만:
         }
         
     except Exception as e:
-        print(f"🤖 [AI-ERROR] 인사이트 생성 오류: {e}")
-        # 🚀 오류 시 기본 인사이트 반환
-        return {
-            "insights_available": True,
-            "insights": {
-                "지역_특징": f"{region_name}의 청년정책 현황",
-                "강점": "다양한 분야의 정책 지원",
-                "개선점": "정책 홍보 강화 필요",
-                "추천_전략": "관심 분야 정책부터 차근차근 확인",
-                "시장_점수": 6,
-                "한줄_요약": f"총 {len(policies)}개 정책으로 지원 가능"
-            },
-            "statistics": {
-                "total_policies": len(policies),
-                "category_distribution": {}
-            }
+        logger.warning("AI 인사이트 오류 - 기본 결과로 대체: %s", e)
+        return _fallback_policy_insights(policies, region_name)
+
+def ai_analyze_policies_for_user(user_query: str, policies: List[Dict], region_code: str) -> Dict[str, Any]:
+    """AI를 활용한 정책 맞춤 분석 - 동기 호출용 래퍼"""
+    return _run_on_ai_loop(ai_analyze_policies_for_user_async(user_query, policies, region_code))
+
+def ai_generate_policy_insights(policies: List[Dict], region_code: str) -> Dict[str, Any]:
+    """정책 현황에 대한 AI 인사이트 생성 - 동기 호출용 래퍼"""
+    return _run_on_ai_loop(ai_generate_policy_insights_async(policies, region_code))
+
+async def _gather_policy_ai(user_query: str, policies: List[Dict], region_code: str, deadline: float):
+    """분석/인사이트 두 AI 호출을 동시에 실행 - 마감 시간이 지나면 기본 결과로 대체"""
+    region_name = REGION_MAPPING.get(region_code, {}).get("name", "해당 지역")
+    analysis_task = asyncio.ensure_future(ai_analyze_policies_for_user_async(user_query, policies, region_code))
+    insights_task = asyncio.ensure_future(ai_generate_policy_insights_async(policies, region_code))
+
+    done, pending = await asyncio.wait({analysis_task, insights_task}, timeout=deadline)
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.warning("AI 마감 시간(%ss) 초과 - %d개 호출 기본 결과로 대체", deadline, len(pending))
+
+    def _result_or(task, fallback):
+        if task in done and not task.cancelled() and task.exception() is None:
+            return task.result()
+        return fallback(policies, region_name)
+
+    return (
+        _result_or(analysis_task, _fallback_policy_analysis),
+        _result_or(insights_task, _fallback_policy_insights),
+    )
+
+def run_policy_ai(user_query: str, policies: List[Dict], region_code: str, deadline: float = AI_DEADLINE):
+    """정책 AI 분석 + 인사이트를 동시에 실행하고 (analysis, insights)를 반환"""
+    region_name = REGION_MAPPING.get(region_code, {}).get("name", "해당 지역")
+    try:
+        # 루프 내부에서 마감 처리하므로 바깥 대기는 약간의 여유만 둠
+        return _run_on_ai_loop(_gather_policy_ai(user_query, policies, region_code, deadline), timeout=deadline + 1)
+    except Exception as e:
+        logger.warning("AI 동시 실행 오류 - 기본 결과로 대체: %s", e)
+        return _fallback_policy_analysis(policies, region_name), _fallback_policy_insights(policies, region_name)
+
+def submit_policy_ai(user_query: str, policies: List[Dict], region_code: str, deadline: float = AI_DEADLINE):
+    """정책 AI 분석을 백그라운드로 시작하고 (analysis, insights)를 돌려줄 Future를 즉시 반환"""
+    return _submit_to_ai_loop(_gather_policy_ai(user_query, policies, region_code, deadline))
+
+# 📡 스트리밍 모드 - 토큰이 도착하는 대로 맞춤_추천 항목을 하나씩 전달
+class _RecommendationStreamParser:
+    """
+    스트리밍 중인 JSON 텍스트에서 "맞춤_추천" 배열의 완성된 객체만 순서대로 꺼냅니다.
+    문자열/이스케이프를 추적하며 이미 읽은 위치부터 이어서 스캔합니다.
+    """
+
+    KEY = '"맞춤_추천"'
+
+    def __init__(self):
+        self.buffer = ""
+        self._pos = -1          # 배열 내부 스캔 위치 (-1: 아직 배열 시작 전)
+        self._depth = 0         # 배열 내부 기준 중괄호 깊이
+        self._in_string = False
+        self._escaped = False
+        self._item_start = -1
+        self._closed = False
+
+    def feed(self, text: str) -> List[Dict]:
+        self.buffer += text
+        if self._closed:
+            return []
+        if self._pos < 0:
+            key_at = self.buffer.find(self.KEY)
+            bracket_at = self.buffer.find("[", key_at + len(self.KEY)) if key_at >= 0 else -1
+            if bracket_at < 0:
+                return []
+            self._pos = bracket_at + 1
+
+        items = []
+        buf = self.buffer
+        while self._pos < len(buf):
+            ch = buf[self._pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                if self._depth == 0:
+                    self._item_start = self._pos
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0 and self._item_start >= 0:
+                    try:
+                        items.append(json.loads(buf[self._item_start:self._pos + 1]))
+                    except ValueError:
+                        pass
+                    self._item_start = -1
+            elif ch == "]" and self._depth == 0:
+                self._closed = True
+                self._pos += 1
+                break
+            self._pos += 1
+        return items
+
+async def stream_policy_analysis_async(user_query: str, policies: List[Dict], region_code: str,
+                                       deadline: float = AI_DEADLINE):
+    """
+    맞춤 분석을 스트리밍으로 생성 (비동기 제너레이터)
+    - ("recommendation", 추천 항목): 맞춤_추천 배열 항목이 완성될 때마다
+    - ("analysis", ai_analysis): 마지막에 전체 분석 (오류·마감 시간 초과 시 기본 결과)
+    """
+    region_name = REGION_MAPPING.get(region_code, {}).get("name", "해당 지역")
+    provider = get_ai_provider("stream")
+    if not provider or not policies:
+        yield "analysis", {"ai_enhanced": False, "reason": "AI 비활성화 또는 정책 없음"}
+        return
+
+    parser = _RecommendationStreamParser()
+    sent: List[Dict] = []  # 이미 전달한 추천 항목
+    stream = None
+    try:
+        prompt, policy_summaries, prompt_metrics = _build_policy_analysis_prompt(user_query, policies, region_name)
+        logger.debug("AI 스트리밍 호출", extra={"provider": provider.name, "policies": len(policies), **prompt_metrics})
+        stream = provider.stream(
+            "stream", prompt,
+            {"user_query": user_query, "region_name": region_name, "policy_summaries": policy_summaries},
+            temperature=0.5,
+            max_tokens=600,
+            timeout=25
+        )
+        # ⏱️ 청크 대기마다 남은 시간만 허용 - 마감이 지나면 스트림을 끊고 기본 결과로 대체
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + deadline
+        with ai_call(provider.name, "stream"):
+            while True:
+                try:
+                    delta = await asyncio.wait_for(anext(stream), timeout=max(deadline_at - loop.time(), 0))
+                except StopAsyncIteration:
+                    break
+                for item in parser.feed(delta):
+                    sent.append(item)
+                    yield "recommendation", item
+
+        ai_analysis = json.loads(parser.buffer)
+        logger.debug("AI 스트리밍 분석 완료", extra={"recommendations": len(sent)})
+        yield "analysis", {
+            "ai_enhanced": True,
+            "analysis": ai_analysis,
+            "processed_policies": len(policy_summaries),
+            "prompt_metrics": prompt_metrics,
+            "confidence": "빠른 AI 분석"
         }
+    except Exception as e:
+        logger.warning("AI 스트리밍 분석 오류 - 기본 결과로 대체: %s", str(e) or f"마감 시간({deadline}s) 초과")
+        fallback = _fallback_policy_analysis(policies, region_name)
+        if sent:
+            # 이미 보낸 추천은 그대로 두고 종합 분석 등 나머지만 기본 결과로 채움
+            fallback["analysis"]["맞춤_추천"] = sent
+        else:
+            for item in fallback["analysis"]["맞춤_추천"]:
+                yield "recommendation", item
+        yield "analysis", fallback
+    finally:
+        # 마감으로 끊긴 경우에도 공급자 스트림(HTTP 연결)을 바로 닫음
+        if stream is not None:
+            await stream.aclose()
+
+async def iterate_on_ai_loop(agen):
+    """AI 루프에서 도는 비동기 제너레이터를 호출 측 이벤트 루프에서 순회"""
+    loop = _get_ai_loop()
+    try:
+        while True:
+            try:
+                item = await asyncio.wrap_future(_submit_to_ai_loop(agen.__anext__()))
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        asyncio.run_coroutine_threadsafe(agen.aclose(), loop)
+
+def submit_policy_insights(policies: List[Dict], region_code: str):
+    """정책 인사이트를 백그라운드로 시작하고 Future를 즉시 반환"""
+    return _submit_to_ai_loop(ai_generate_policy_insights_async(policies, region_code))
 
 # 🔄 기존 MCP 도구들 - 인터페이스 100% 유지하면서 AI 기능 추가
 @mcp.tool()
@@ -278,88 +565,47 @@ def searchPoliciesByRegion(regionCode: str, pageNum: int = 1, pageSize: int = 50
     if regionCode not in REGION_MAPPING:
         return {"status": "error", "message": f"지원하지 않는 지역코드: {regionCode}."}
 
-    region_info = REGION_MAPPING[regionCode]
-    search_attempts = []
-    search_keywords = region_info["keywords"] + region_info["province_keywords"]
-    for keyword in set(search_keywords):
-        base_filter = {"plcyNm": keyword}
-        if categories: base_filter["lclsfNm"] = categories
-        search_attempts.append(base_filter)
-
-    print(f"🤖 [AI-DEBUG] searchPoliciesByRegion 호출됨")
-    print(f"📍 [AI-DEBUG] regionCode: {regionCode}")
-    print(f"💬 [AI-DEBUG] user_query: {user_query}")
-    print(f"🔑 [AI-DEBUG] openai_client 상태: {openai_client is not None}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("searchPoliciesByRegion", extra={"region_code": regionCode, "has_user_query": bool(user_query),
+                                                      "ai_provider": provider_name_for("analysis")})
 
-    # 기존 API 호출 로직 그대로 유지
-    api_result = call_youth_api_enhanced(page_num=pageNum, page_size=pageSize, search_attempts=search_attempts)
+    # 🗂️ 광역 단위 조회(캐시) 후 이 지역 몫만 사용 - 같은 도의 다른 지역은 추가 API 호출 없음
+    api_result = fetch_province_policies(regionCode, categories=categories)
 
     if api_result["status"] == "ok":
-        original_policies = api_result["policies"]
-        
-        # 기존 필터링 로직 그대로 유지
-        target_keyword = region_info["keywords"][0]
-        sibling_keywords = set(region_info.get("sibling_city_keywords", []))
-
-        filtered_policies = []
-        for policy in original_policies:
-            full_text = " ".join(filter(None, [
-                policy.get("plcyNm", ""),
-                policy.get("plcyExplnCn", ""),
-                policy.get("cnsgNmor", ""),
-            ]))
-
-            if target_keyword in full_text:
-                filtered_policies.append(policy)
-                continue
-
-            if any(sibling in full_text for sibling in sibling_keywords):
-                continue
-            
-            filtered_policies.append(policy)
+        original_count = api_result["original_count"]
+        # 📄 요청한 페이지만 잘라서 사용 (광역 묶음은 페이지 크기와 무관하게 공유)
+        start = (max(pageNum, 1) - 1) * pageSize
+        filtered_policies = api_result["by_region"][regionCode][start:start + pageSize]
 
         # 🤖 AI 분석 추가 (사용자 쿼리가 있을 때만)
         ai_analysis = None
         ai_insights = None
 
-        print(f"🤖 [AI-DEBUG] AI 분석 시도 시작")
-        print(f"🤖 [AI-DEBUG] user_query 존재: {user_query is not None}")
-        print(f"🤖 [AI-DEBUG] filtered_policies 개수: {len(filtered_policies)}")
-        
-        # 🚀 AI 분석을 별도 처리 (에러가 발생해도 정책 목록은 반환)
-        if user_query and filtered_policies and openai_client:
-            try:
-                print(f"🤖 [AI-DEBUG] AI 분석 실행 중...")
-                ai_analysis = ai_analyze_policies_for_user(user_query, filtered_policies, regionCode)
-                print(f"🤖 [AI-DEBUG] AI 분석 완료")
-            except Exception as e:
-                print(f"🤖 [AI-ERROR] AI 분석 중 오류: {e}")
-                ai_analysis = None
-            
-            try:
-                print(f"🤖 [AI-DEBUG] AI 인사이트 실행 중...")
-                ai_insights = ai_generate_policy_insights(filtered_policies, regionCode)
-                print(f"🤖 [AI-DEBUG] AI 인사이트 완료")
-            except Exception as e:
-                print(f"🤖 [AI-ERROR] AI 인사이트 중 오류: {e}")
-                ai_insights = None
+        # 🚀 AI 분석/인사이트를 동시에 실행 (마감 초과·오류 시 기본 결과, 정책 목록은 항상 반환)
+        if user_query and filtered_policies and ai_enabled():
+            logger.debug("AI 분석 + 인사이트 동시 실행", extra={"policies": len(filtered_policies), "deadline": AI_DEADLINE})
+            with stage("ai_analysis"):
+                ai_analysis, ai_insights = run_policy_ai(user_query, filtered_policies, regionCode)
 
         # 기존 응답 구조 유지하면서 AI 결과 추가
         result = {
             "status": "ok" if filtered_policies else "no_results",
             "policies": filtered_policies,
             "total_count": len(filtered_policies),
-            "search_summary": f"API 검색 결과 {len(original_policies)}개 중, 최종 필터링 후 {len(filtered_policies)}개 발견"
+            "search_summary": f"API 검색 결과 {original_count}개 중, 최종 필터링 후 {len(filtered_policies)}개 발견"
         }
         
         # 🤖 AI 결과가 있으면 추가 (기존 코드와 100% 호환)
         if ai_analysis and ai_analysis.get("ai_enhanced"):
             result["ai_analysis"] = ai_analysis
-            print(f"🤖 [AI-SUCCESS] AI 분석 결과 포함됨")
             
         if ai_insights and ai_insights.get("insights_available"):
             result["ai_insights"] = ai_insights
-            print(f"🤖 [AI-SUCCESS] AI 인사이트 결과 포함됨")
+
+        # ⚠️ 일부 검색어 조회가 실패한 부분 결과 표시 (호출 측에서 캐시하지 않도록)
+        if api_result["failed_attempts"]:
+            result["failed_attempts"] = api_result["failed_attempts"]
 
         return result
 
@@ -386,7 +632,7 @@ def searchYouthPolicies(pageNum: int = 1, pageSize: int = 20,
             if ai_recommendations.get("ai_enhanced"):
                 api_result["ai_recommendations"] = ai_recommendations
         except Exception as e:
-            print(f"🤖 [AI-ERROR] 일반 정책 AI 분석 오류: {e}")
+            logger.warning("일반 정책 AI 분석 오류: %s", e)
     
     return api_result
 
@@ -413,7 +659,7 @@ def searchPoliciesByKeywords(keywords: str, regionCode: Optional[str] = None,
     )
     
     # 🤖 AI 키워드 매칭 (간소화 버전)
-    if user_query and api_result.get("status") == "ok" and openai_client:
+    if user_query and api_result.get("status") == "ok" and ai_enabled():
         try:
             # 기본 키워드 분석만 제공
             api_result["keyword_analysis"] = {
@@ -422,34 +668,28 @@ def searchPoliciesByKeywords(keywords: str, regionCode: Optional[str] = None,
                 "검색_개선_제안": "더 구체적인 키워드로 재검색 권장"
             }
         except Exception as e:
-            print(f"키워드 분석 오류: {e}")
+            logger.warning("키워드 분석 오류: %s", e)
     
     return api_result
 
 @mcp.tool()
 def ping():
     """헬스체크 - AI 상태 포함"""
-    ai_status = "활성화" if openai_client else "비활성화"
-    
-    # 🔧 OpenAI API 키 확인
-    api_key = os.getenv("OPENAI_API_KEY")
-    api_key_status = f"설정됨 (길이: {len(api_key)})" if api_key else "설정되지 않음"
-    
-    print(f"🤖 [DEBUG] OpenAI API 키 상태: {api_key_status}")
-    print(f"🤖 [DEBUG] OpenAI 클라이언트 상태: {openai_client is not None}")
+    ai_status = "활성화" if ai_enabled() else "비활성화"
     
+    # 🔧 OpenAI API 키 확인 (설정 여부만 - 키 길이 등 키에서 나온 값은 내보내지 않음)
     return {
         "status": "ok", 
         "message": f"Youth policy server (AI {ai_status}) pong",
-        "ai_available": openai_client is not None,
-        "openai_configured": bool(api_key),
-        "api_key_length": len(api_key) if api_key else 0
+        "ai_available": ai_enabled(),
+        "ai_providers": {rc: provider_name_for(rc) for rc in REQUEST_CLASSES},
+        "openai_configured": bool(os.getenv("OPENAI_API_KEY"))
     }
 
 def main():
     try:
-        names = [t.name for t in mcp._tools]
-        ai_status = "AI 활성화" if openai_client else "기본 모드"
+        names = mcp.tool_names()
+        ai_status = "AI 활성화" if ai_enabled() else "기본 모드"
         print(f"[YOUTH POLICY SERVER - {ai_status}] tools: {names}", flush=True)
     except Exception: pass
     mcp.run()